@@ -0,0 +1,38 @@
+"""table versions
+
+Revision ID: 1d50e7eace08
+Revises: b1652b7d726f
+Create Date: 2026-10-17 03:56:36.887284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d50e7eace08'
+down_revision: Union[str, Sequence[str], None] = 'b1652b7d726f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table_versions = op.create_table('TableVersions',
+    sa.Column('table_name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name', name=op.f('pk_TableVersions'))
+    )
+
+    # 변경 카운터 행 미리 생성 (쓰기 경로는 UPDATE 한 번으로 끝남)
+    op.bulk_insert(table_versions, [
+        {'table_name': 'Stocks', 'version': 0},
+        {'table_name': 'Category', 'version': 0},
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('TableVersions')
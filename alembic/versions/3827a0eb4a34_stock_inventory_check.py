@@ -0,0 +1,34 @@
+"""stock inventory check
+
+Revision ID: 3827a0eb4a34
+Revises: f5042472743a
+Create Date: 2026-10-17 03:50:47.964482
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3827a0eb4a34'
+down_revision: Union[str, Sequence[str], None] = 'f5042472743a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 제약 추가 전 기존 음수 수량 정리
+    op.execute('UPDATE Stocks SET inventory = 0 WHERE inventory < 0')
+
+    # SQLite는 ALTER로 CHECK 추가 불가 → batch 모드(테이블 재생성)
+    with op.batch_alter_table('Stocks') as batch_op:
+        batch_op.create_check_constraint(op.f('ck_Stocks_inventory_nonneg'), 'inventory >= 0')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('Stocks') as batch_op:
+        batch_op.drop_constraint(op.f('ck_Stocks_inventory_nonneg'), type_='check')
@@ -0,0 +1,49 @@
+"""category stock rollups
+
+Revision ID: 5be0d7a41c93
+Revises: a3f1c29e7b54
+Create Date: 2026-10-17 18:05:51.770214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5be0d7a41c93'
+down_revision: Union[str, Sequence[str], None] = 'a3f1c29e7b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 마이그레이션 시점의 부족 기준 (app/core/config.py low_stock_threshold 기본값과 동일, 다르게 쓰면 rebuild-counts)
+LOW_STOCK_THRESHOLD = 10
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('CategoryStats', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_quantity', sa.BigInteger(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('zero_stock_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('low_stock_count', sa.Integer(), server_default='0', nullable=False))
+
+    # 기존 재고로 집계 채움 (카테고리별 상관 서브쿼리)
+    op.execute(
+        sa.text(
+            'UPDATE CategoryStats SET '
+            'total_quantity = (SELECT COALESCE(SUM(s.inventory), 0) FROM Stocks s WHERE s.category_id = CategoryStats.category_id), '
+            'zero_stock_count = (SELECT COUNT(*) FROM Stocks s WHERE s.category_id = CategoryStats.category_id AND s.inventory = 0), '
+            'low_stock_count = (SELECT COUNT(*) FROM Stocks s WHERE s.category_id = CategoryStats.category_id '
+            'AND s.inventory BETWEEN 1 AND :low)'
+        ).bindparams(low=LOW_STOCK_THRESHOLD)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('CategoryStats', schema=None) as batch_op:
+        batch_op.drop_column('low_stock_count')
+        batch_op.drop_column('zero_stock_count')
+        batch_op.drop_column('total_quantity')
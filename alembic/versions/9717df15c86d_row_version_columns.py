@@ -0,0 +1,33 @@
+"""row version columns
+
+Revision ID: 9717df15c86d
+Revises: d803b3a9d52b
+Create Date: 2026-10-17 04:25:39.346118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9717df15c86d'
+down_revision: Union[str, Sequence[str], None] = 'd803b3a9d52b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 version 1 부터 시작
+    op.add_column('Category', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('Stocks', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('Stocks') as batch_op:
+        batch_op.drop_column('version')
+    with op.batch_alter_table('Category') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,71 @@
+"""warehouse stock locations
+
+Revision ID: a3f1c29e7b54
+Revises: 9717df15c86d
+Create Date: 2026-10-17 16:42:08.318502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c29e7b54'
+down_revision: Union[str, Sequence[str], None] = '9717df15c86d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 마이그레이션 시점의 기본 창고 (app/core/config.py default_warehouse_id 기본값과 동일)
+DEFAULT_WAREHOUSE_ID = 1
+DEFAULT_WAREHOUSE_NAME = '기본 창고'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('Warehouses',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_Warehouses')),
+    sa.UniqueConstraint('name', name=op.f('uq_Warehouses_name'))
+    )
+    op.create_table('StockLocations',
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('stock_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.CheckConstraint('quantity >= 0', name=op.f('ck_StockLocations_quantity_nonneg')),
+    sa.ForeignKeyConstraint(['stock_id'], ['Stocks.id'], name=op.f('fk_StockLocations_stock_id_Stocks'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['warehouse_id'], ['Warehouses.id'], name=op.f('fk_StockLocations_warehouse_id_Warehouses'), ondelete='RESTRICT'),
+    sa.PrimaryKeyConstraint('warehouse_id', 'stock_id', name=op.f('pk_StockLocations')),
+    sqlite_with_rowid=False
+    )
+    with op.batch_alter_table('StockLocations', schema=None) as batch_op:
+        batch_op.create_index('ix_StockLocations_warehouse_id_quantity', ['warehouse_id', 'quantity', 'stock_id'], unique=False)
+        batch_op.create_index('ix_StockLocations_warehouse_id_category_id', ['warehouse_id', 'category_id', 'stock_id'], unique=False)
+        batch_op.create_index('ix_StockLocations_stock_id', ['stock_id', 'warehouse_id'], unique=False)
+
+    # 기본 창고 + 기존 재고 전량을 기본 창고에 배치 (Stocks.inventory = 창고별 합계 불변식 시작점)
+    op.execute(
+        sa.text('INSERT INTO Warehouses (id, name) VALUES (:id, :name)')
+        .bindparams(id=DEFAULT_WAREHOUSE_ID, name=DEFAULT_WAREHOUSE_NAME)
+    )
+    op.execute(
+        sa.text(
+            'INSERT INTO StockLocations (warehouse_id, stock_id, category_id, quantity) '
+            'SELECT :id, id, category_id, inventory FROM Stocks'
+        ).bindparams(id=DEFAULT_WAREHOUSE_ID)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('StockLocations', schema=None) as batch_op:
+        batch_op.drop_index('ix_StockLocations_stock_id')
+        batch_op.drop_index('ix_StockLocations_warehouse_id_category_id')
+        batch_op.drop_index('ix_StockLocations_warehouse_id_quantity')
+
+    op.drop_table('StockLocations')
+    op.drop_table('Warehouses')
@@ -0,0 +1,60 @@
+"""stock movement ledger
+
+Revision ID: b1652b7d726f
+Revises: 3827a0eb4a34
+Create Date: 2026-10-17 03:53:12.260563
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1652b7d726f'
+down_revision: Union[str, Sequence[str], None] = '3827a0eb4a34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('StockMovements',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('stock_id', sa.Integer(), nullable=False),
+    sa.Column('delta', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.String(length=20), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_StockMovements'))
+    )
+    op.create_index('ix_StockMovements_stock_id_id', 'StockMovements', ['stock_id', 'id'], unique=False)
+    op.create_index(op.f('ix_StockMovements_created_at'), 'StockMovements', ['created_at'], unique=False)
+    op.create_table('StockSnapshots',
+    sa.Column('stock_id', sa.Integer(), nullable=False),
+    sa.Column('movement_id', sa.BigInteger(), nullable=False),
+    sa.Column('balance', sa.Integer(), nullable=False),
+    sa.Column('taken_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('stock_id', 'movement_id', name=op.f('pk_StockSnapshots'))
+    )
+    op.create_index(op.f('ix_StockSnapshots_movement_id'), 'StockSnapshots', ['movement_id'], unique=False)
+
+    # 기존 재고 수량을 기초(opening) 변동으로 기록 → 이 시점 이후 이력이 온전해짐
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    op.get_bind().execute(
+        sa.text(
+            'INSERT INTO StockMovements (stock_id, delta, reason, created_at) '
+            "SELECT id, inventory, 'opening', :now FROM Stocks WHERE inventory <> 0 ORDER BY id"
+        ),
+        {"now": now},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_StockSnapshots_movement_id'), table_name='StockSnapshots')
+    op.drop_table('StockSnapshots')
+    op.drop_index(op.f('ix_StockMovements_created_at'), table_name='StockMovements')
+    op.drop_index('ix_StockMovements_stock_id_id', table_name='StockMovements')
+    op.drop_table('StockMovements')
@@ -0,0 +1,40 @@
+"""stock name grams without rowid
+
+Revision ID: bcbc55c9a687
+Revises: f0993adcedf4
+Create Date: 2026-10-17 22:05:37.902215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bcbc55c9a687'
+down_revision: Union[str, Sequence[str], None] = 'f0993adcedf4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# SQLite 전용: 복합 PK 를 클러스터 키로 저장하도록 테이블 재생성 (다른 백엔드는 변경 없음)
+# - WITHOUT ROWID 는 생성 후 바꿀 수 없으므로 batch 재생성(새 테이블 복사 → 이름 변경)
+def _rebuild(with_rowid: bool) -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    # 반영(reflect)한 테이블 옵션을 그대로 복사하므로 되돌릴 때도 값을 명시함
+    with op.batch_alter_table(
+        'StockNameGrams', schema=None, recreate='always', table_kwargs={'sqlite_with_rowid': with_rowid}
+    ):
+        pass
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild(with_rowid=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild(with_rowid=True)
@@ -0,0 +1,40 @@
+"""stock sort indexes
+
+Revision ID: cacad6339e79
+Revises: 1d50e7eace08
+Create Date: 2026-10-17 03:58:05.152672
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cacad6339e79'
+down_revision: Union[str, Sequence[str], None] = '1d50e7eace08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_Stocks_inventory'), 'Stocks', ['inventory'], unique=False)
+    op.create_index('ix_Stocks_category_id_name', 'Stocks', ['category_id', 'name'], unique=False)
+    op.create_index('ix_Stocks_category_id_inventory', 'Stocks', ['category_id', 'inventory'], unique=False)
+
+    # 통계 갱신: 카테고리명 정렬이 (Category.name 인덱스 → ix_Stocks_category_id) 중첩 루프를 타도록
+    # (통계가 없으면 SQLite가 Stocks 전체를 읽고 임시 B-tree 정렬을 고름)
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute('ANALYZE')
+    elif dialect in ('mysql', 'mariadb'):
+        op.execute('ANALYZE TABLE Stocks, Category')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_Stocks_category_id_inventory', table_name='Stocks')
+    op.drop_index('ix_Stocks_category_id_name', table_name='Stocks')
+    op.drop_index(op.f('ix_Stocks_inventory'), table_name='Stocks')
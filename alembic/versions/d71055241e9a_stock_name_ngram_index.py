@@ -0,0 +1,61 @@
+"""stock name ngram index
+
+Revision ID: d71055241e9a
+Revises: 84744c0ce172
+Create Date: 2026-10-17 09:12:31.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd71055241e9a'
+down_revision: Union[str, Sequence[str], None] = '84744c0ce172'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 마이그레이션 시점의 조각 규칙 고정 (app/services/search.py 의 NGRAM_N=2 와 동일)
+def _name_grams(text: str) -> set:
+    s = text.lower()
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('StockNameGrams',
+    sa.Column('gram', sa.String(length=8).with_variant(mysql.VARCHAR(length=8, collation='utf8mb4_bin'), 'mysql', 'mariadb'), nullable=False),
+    sa.Column('stock_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['stock_id'], ['Stocks.id'], name=op.f('fk_StockNameGrams_stock_id_Stocks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gram', 'stock_id', name=op.f('pk_StockNameGrams'))
+    )
+    with op.batch_alter_table('StockNameGrams', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_StockNameGrams_stock_id'), ['stock_id'], unique=False)
+
+    # 기존 재고 이름 색인 채움 (id 키셋 청크 단위)
+    conn = op.get_bind()
+    grams = sa.table('StockNameGrams', sa.column('gram'), sa.column('stock_id'))
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text('SELECT id, name FROM Stocks WHERE id > :last ORDER BY id LIMIT 1000'),
+            {"last": last_id},
+        ).all()
+        if not rows:
+            break
+        params = [{"gram": g, "stock_id": r.id} for r in rows for g in _name_grams(r.name)]
+        if params:
+            conn.execute(grams.insert(), params)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('StockNameGrams', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_StockNameGrams_stock_id'))
+
+    op.drop_table('StockNameGrams')
@@ -0,0 +1,40 @@
+"""stock change feed
+
+Revision ID: d803b3a9d52b
+Revises: cacad6339e79
+Create Date: 2026-10-17 04:11:58.653153
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd803b3a9d52b'
+down_revision: Union[str, Sequence[str], None] = 'cacad6339e79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('StockEvents',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('stock_id', sa.Integer(), nullable=True),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('prev_category_id', sa.Integer(), nullable=True),
+    sa.Column('name', sa.String(length=200), nullable=True),
+    sa.Column('inventory', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_StockEvents'))
+    )
+    op.create_index(op.f('ix_StockEvents_created_at'), 'StockEvents', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_StockEvents_created_at'), table_name='StockEvents')
+    op.drop_table('StockEvents')
@@ -0,0 +1,71 @@
+"""stock name gram folding
+
+Revision ID: f0993adcedf4
+Revises: 5be0d7a41c93
+Create Date: 2026-10-17 21:40:12.318604
+
+"""
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0993adcedf4'
+down_revision: Union[str, Sequence[str], None] = '5be0d7a41c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 마이그레이션 시점의 접기 규칙 고정 (app/services/search.py 의 fold/NGRAM_N=2 와 동일)
+_FOLD_EXTRA = {"ø": "o", "đ": "d", "ð": "d", "ł": "l", "ħ": "h", "ŧ": "t", "ı": "i", "æ": "ae", "œ": "oe"}
+
+
+def _fold_char(ch: str) -> str:
+    base = "".join(c for c in unicodedata.normalize("NFKD", ch) if not unicodedata.combining(c))
+    base = unicodedata.normalize("NFC", base).casefold()
+    return "".join(_FOLD_EXTRA.get(c, c) for c in base)
+
+
+def _folded_grams(text: str) -> set:
+    s = text.lower() if text.isascii() else "".join(map(_fold_char, text))
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+# 이전 규칙 (d71055241e9a)
+def _lower_grams(text: str) -> set:
+    s = text.lower()
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+def _refill(name_grams) -> None:
+    # ASCII 이름은 두 규칙의 조각이 같으므로 나머지 이름만 다시 채움 (id 키셋 청크 단위)
+    conn = op.get_bind()
+    grams = sa.table('StockNameGrams', sa.column('gram'), sa.column('stock_id'))
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text('SELECT id, name FROM Stocks WHERE id > :last ORDER BY id LIMIT 1000'),
+            {"last": last_id},
+        ).all()
+        if not rows:
+            break
+        changed = [r for r in rows if not r.name.isascii()]
+        if changed:
+            conn.execute(grams.delete().where(grams.c.stock_id.in_([r.id for r in changed])))
+            params = [{"gram": g, "stock_id": r.id} for r in changed for g in name_grams(r.name)]
+            if params:
+                conn.execute(grams.insert(), params)
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _refill(_folded_grams)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _refill(_lower_grams)
@@ -0,0 +1,41 @@
+"""category stock counters
+
+Revision ID: f5042472743a
+Revises: d71055241e9a
+Create Date: 2026-10-17 10:03:47.219554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5042472743a'
+down_revision: Union[str, Sequence[str], None] = 'd71055241e9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('CategoryStats',
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('stock_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['Category.id'], name=op.f('fk_CategoryStats_category_id_Category'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('category_id', name=op.f('pk_CategoryStats'))
+    )
+
+    # 기존 카테고리별 재고 건수로 카운터 채움
+    op.execute(
+        'INSERT INTO CategoryStats (category_id, stock_count) '
+        'SELECT c.id, COUNT(s.id) FROM Category c '
+        'LEFT OUTER JOIN Stocks s ON s.category_id = c.id '
+        'GROUP BY c.id'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('CategoryStats')
@@ -1,119 +1,223 @@
 # app/api/routes/categories.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Response
+from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
-# 동기 세션 주입 (단일 진실 원천)
-from app.db.session import get_session
+from app.core import metrics
 
-from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryOut
+# 세션 주입 (단일 진실 원천, 설정에 따라 동기/비동기)
+from app.db.session import DbSession, get_db, run_db
+
+from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryOut, CategoryListItem
 from app.models.category import Category
+from app.models.stock import Stock
+from app.services import category_cache, change_feed, counts, page_cache, row_version, stock_bulk, versions
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 
 # 생성
 @router.post("", response_model=CategoryOut, status_code=status.HTTP_201_CREATED)
-def create_category(payload: CategoryCreate, db: Session = Depends(get_session)):
-    # 입력 정규화
-    name = (payload.name or "").strip()
-    if not name:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="이름이 비어 있음")
-
-    # 중복 체크 (대소문자 구분 유지)
-    exists = db.query(Category).filter(Category.name == name).first()
-    if exists:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 카테고리 이름임")
-
-    try:
-        obj = Category(name=name)
-        db.add(obj)
-        db.commit()
-        db.refresh(obj)
-        return obj
-    except HTTPException:
-        db.rollback()
-        raise
-    except Exception:
-        db.rollback()
-        raise
+async def create_category(payload: CategoryCreate, db: DbSession = Depends(get_db)):
+    def work(db: Session):
+        # 입력 정규화
+        name = (payload.name or "").strip()
+        if not name:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="이름이 비어 있음")
+
+        # 중복 체크 (대소문자 구분 유지)
+        exists = db.query(Category).filter(Category.name == name).first()
+        if exists:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 카테고리 이름임")
+
+        try:
+            obj = Category(name=name)
+            db.add(obj)
+            db.flush()  # id 확보 후 재고 카운터 행 생성
+            counts.ensure_row(db, obj.id)
+            change_feed.record_category(db, "create", obj.id, name)
+            versions.bump(db, versions.CATEGORIES)
+            page_cache.invalidate_on_commit(db)
+            db.commit()
+            category_cache.invalidate(obj.id)
+            db.refresh(obj)
+            return obj
+        except HTTPException:
+            db.rollback()
+            raise
+        except Exception:
+            db.rollback()
+            raise
+
+    return await run_db(db, work)
 
 
 # 목록 (페이지네이션)
-@router.get("", response_model=list[CategoryOut])
-def list_categories(
+# - with_counts=true 이면 카테고리별 재고 건수를 GROUP BY 한 번으로 함께 반환함
+# - 약한 ETag: If-None-Match 일치 시 목록 쿼리 없이 304 (with_counts 면 재고 카운터도 반영)
+@router.get("", response_model=list[CategoryListItem], response_model_exclude_none=True)
+async def list_categories(
     response: Response,
     page: int = Query(0, ge=0, description="0부터 시작"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기(1~100)"),
-    db: Session = Depends(get_session),
+    with_counts: bool = Query(False, description="카테고리별 재고 건수 포함 여부"),
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
 ):
-    total = db.query(func.count(Category.id)).scalar() or 0
-    items = (
-        db.query(Category)
-        .order_by(Category.id.desc())
-        .offset(page * size)
-        .limit(size)
-        .all()
-    )
-    # 총건수 전달
-    response.headers["X-Total-Count"] = str(total)
-    return items
+    def work(db: Session):
+        tables = (versions.CATEGORIES, versions.STOCKS) if with_counts else (versions.CATEGORIES,)
+        tag = versions.etag(db, *tables)
+        if versions.matches(if_none_match, tag):
+            return versions.not_modified(tag)
+        versions.set_headers(response, tag)
+
+        # 총건수: 덜 찬 페이지면 확정이므로 COUNT 생략
+        def total_of(row_count: int) -> int:
+            total = counts.total_from_page(page * size, row_count, size)
+            if total is None:
+                total = db.query(func.count(Category.id)).scalar() or 0
+            return total
+
+        if with_counts:
+            rows = (
+                db.query(Category.id, Category.name, Category.version, func.count(Stock.id).label("stock_count"))
+                .outerjoin(Stock, Stock.category_id == Category.id)
+                .group_by(Category.id, Category.name, Category.version)
+                .order_by(Category.id.desc())
+                .offset(page * size)
+                .limit(size)
+                .all()
+            )
+            metrics.add_rows(len(rows))
+            response.headers["X-Total-Count"] = str(total_of(len(rows)))
+            return [{"id": r.id, "name": r.name, "version": r.version, "stock_count": r.stock_count} for r in rows]
+
+        items = (
+            db.query(Category)
+            .order_by(Category.id.desc())
+            .offset(page * size)
+            .limit(size)
+            .all()
+        )
+        # 총건수 전달
+        response.headers["X-Total-Count"] = str(total_of(len(items)))
+        return items
+
+    return await run_db(db, work)
+
+
+# 카테고리 캐시 통계 (적중/미스/축출)
+# - /{category_id} 보다 먼저 등록
+@router.get("/cache/stats")
+async def category_cache_stats():
+    return category_cache.stats()
 
 
 # 단건 조회
+# - 행 version 기반 약한 ETag (수정 요청의 If-Match 로 그대로 사용), If-None-Match 일치 시 304
 @router.get("/{category_id}", response_model=CategoryOut)
-def get_category(category_id: int, db: Session = Depends(get_session)):
-    obj = db.get(Category, category_id)
-    if not obj:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상을 찾을 수 없음")
-    return obj
+async def get_category(
+    category_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
+):
+    def work(db: Session):
+        obj = db.get(Category, category_id)
+        if not obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상을 찾을 수 없음")
+        tag = row_version.etag(obj.version)
+        if versions.matches(if_none_match, tag):
+            return versions.not_modified(tag)
+        versions.set_headers(response, tag)
+        return obj
+
+    return await run_db(db, work)
 
 
 # 부분 수정
+# - 기대 version: If-Match 헤더(단건 조회 ETag) 우선, 없으면 바디 version (둘 다 없으면 마지막 쓰기 우선)
+# - 조건부 UPDATE 한 문장, 충돌 시 412(If-Match) / 409(바디 version) (app/services/row_version.py)
 @router.patch("/{category_id}", response_model=CategoryOut)
-def update_category(category_id: int, payload: CategoryUpdate, db: Session = Depends(get_session)):
-    obj = db.get(Category, category_id)
-    if not obj:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상을 찾을 수 없음")
+async def update_category(
+    category_id: int,
+    payload: CategoryUpdate,
+    if_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
+):
+    exp = row_version.expected(if_match, payload.version)
 
-    try:
+    def work(db: Session):
+        new_name = None
         if payload.name is not None:
             new_name = payload.name.strip()
             if not new_name:
                 raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="이름이 비어 있음")
 
-            dup = (
-                db.query(Category)
-                .filter(Category.name == new_name, Category.id != category_id)
-                .first()
-            )
-            if dup:
-                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 카테고리 이름임")
-
-            obj.name = new_name
-
-        db.add(obj)
-        db.commit()
-        db.refresh(obj)
-        return obj
-    except HTTPException:
-        db.rollback()
-        raise
-    except Exception:
-        db.rollback()
-        raise
+        try:
+            for _ in range(row_version.UPDATE_RETRIES):
+                row = db.execute(
+                    select(Category.id, Category.name, Category.version).where(Category.id == category_id)
+                ).first()
+                if row is None:
+                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상을 찾을 수 없음")
+                row_version.check(exp, row.version)
+                if new_name is None:
+                    return {"id": row.id, "name": row.name, "version": row.version}
+
+                if new_name != row.name:
+                    dup = db.scalar(select(Category.id).where(Category.name == new_name, Category.id != category_id))
+                    if dup is not None:
+                        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 카테고리 이름임")
+
+                if row_version.update_if(db, Category, category_id, row.version, {"name": new_name}):
+                    break
+                # 읽은 뒤 다른 쓰기가 끼어듦: 기대 version 이 있으면 충돌, 없으면 다시 읽음
+                if exp.version is not None:
+                    raise row_version.VersionConflict()
+            else:
+                raise row_version.VersionConflict()
+
+            change_feed.record_category(db, "update", category_id, new_name)
+            versions.bump(db, versions.CATEGORIES)
+            page_cache.invalidate_on_commit(db)
+            db.commit()
+            category_cache.invalidate(category_id)
+            return {"id": category_id, "name": new_name, "version": row.version + 1}
+        except row_version.VersionConflict as exc:
+            db.rollback()
+            raise row_version.conflict_error(exc, exp)
+        except Exception:
+            db.rollback()
+            raise
+
+    return await run_db(db, work)
 
 
 # 삭제
+# - 소속 재고도 함께 삭제 (재고 일괄 삭제와 같은 경로: 검색/창고/집계/변경 피드 정리 후 IN 삭제)
+#   · 관계는 passive_deletes + FK RESTRICT 라 ORM/DB 어느 쪽도 재고를 대신 지우지 않음
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_category(category_id: int, db: Session = Depends(get_session)):
-    obj = db.get(Category, category_id)
-    if not obj:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상을 찾을 수 없음")
-    try:
-        db.delete(obj)
-        db.commit()
-        return None
-    except Exception:
-        db.rollback()
-        raise
+async def delete_category(category_id: int, db: DbSession = Depends(get_db)):
+    def work(db: Session):
+        # 행 잠금: 삭제 도중 이 카테고리로 재고가 추가되지 않게 함 (InnoDB 는 자식 INSERT 가 부모 행 공유 잠금을 기다림)
+        obj = db.get(Category, category_id, with_for_update=True)
+        if not obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상을 찾을 수 없음")
+        try:
+            stock_ids = db.scalars(select(Stock.id).where(Stock.category_id == obj.id)).all()
+            stock_bulk.delete_rows(db, list(stock_bulk.fetch_rows(db, stock_ids).values()))
+            counts.drop_row(db, obj.id)
+            db.delete(obj)
+            change_feed.record_category(db, "delete", category_id, None)
+            versions.bump(db, versions.CATEGORIES)
+            page_cache.invalidate_on_commit(db)
+            db.commit()
+            category_cache.invalidate(category_id)
+            return None
+        except Exception:
+            db.rollback()
+            raise
+
+    return await run_db(db, work)
@@ -0,0 +1,128 @@
+# app/api/routes/ops.py
+# 라우터: 운영 지표 API (/api/ops)
+# - 커넥션 풀 상태: 체크아웃 중/오버플로/대기 시간 누적 (워커 프로세스 단위 값)
+# - DB 회로 차단기 상태 + /stocks 화면 캐시 통계 (/api/ops/db-breaker)
+# - 수량 증감 묶음 커밋 큐 통계 (/api/ops/group-commit)
+# - 읽기 복제본 상태/선택 횟수 (/api/ops/replicas)
+# - 요청 계측 + 풀 상태 + 차단기 상태를 Prometheus 텍스트 형식으로 노출 (/api/ops/metrics)
+
+from typing import Any, Dict, List
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.db.breaker import db_breaker, OPEN, HALF_OPEN
+from app.db import session as db_session
+from app.db.engine import pool_stats
+from app.services import group_commit, page_cache
+
+router = APIRouter(prefix="/api/ops", tags=["ops"])
+
+
+# 커넥션 풀 통계
+@router.get("/db-pool")
+async def db_pool_stats() -> Dict[str, Any]:
+    settings = get_settings()
+    return {
+        "config": {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_timeout": settings.db_pool_timeout,
+            "pre_ping": settings.db_pool_pre_ping,
+        },
+        "engines": pool_stats(),
+    }
+
+
+# 회로 차단기 상태 + 화면 캐시 통계
+@router.get("/db-breaker")
+async def db_breaker_stats() -> Dict[str, Any]:
+    return {"breaker": db_breaker.stats(), "stocks_page_cache": page_cache.stats()}
+
+
+# 수량 증감 묶음 커밋 큐 통계
+@router.get("/group-commit")
+async def group_commit_stats() -> Dict[str, Any]:
+    return group_commit.inventory_queue.stats()
+
+
+# 읽기 복제본 상태 (복제본 미설정이면 빈 목록)
+@router.get("/replicas")
+async def replica_stats() -> Dict[str, Any]:
+    replica_set = db_session.async_replica_set if db_session.USE_ASYNC else db_session.replica_set
+    if replica_set is None:
+        return {"replicas": [], "primary_fallbacks": 0}
+    return replica_set.stats()
+
+
+# 풀 상태 → Prometheus 게이지/카운터 줄
+def _pool_lines() -> List[str]:
+    gauges = [
+        ("db_pool_checked_out", "gauge", "checked_out", "사용 중인 연결 수"),
+        ("db_pool_overflow", "gauge", "overflow", "풀 크기를 넘어 연 연결 수"),
+        ("db_pool_size", "gauge", "size", "풀 크기"),
+        ("db_pool_checkouts_total", "counter", "checkouts", "체크아웃 횟수"),
+        ("db_pool_timeouts_total", "counter", "timeouts", "체크아웃 대기 시간 초과 횟수"),
+    ]
+    engines = pool_stats()
+    lines: List[str] = []
+    for name, kind, key, help_text in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        lines += [f'{name}{{engine="{e["engine"]}"}} {e[key]}' for e in engines if key in e]
+    lines += ["# HELP db_pool_wait_seconds_total 체크아웃 대기 시간 합계", "# TYPE db_pool_wait_seconds_total counter"]
+    lines += [
+        f'db_pool_wait_seconds_total{{engine="{e["engine"]}"}} {e["wait_total_ms"] / 1000}'
+        for e in engines if "wait_total_ms" in e
+    ]
+    return lines
+
+
+# 차단기 상태 → Prometheus 게이지/카운터 줄 (상태: 0 closed, 1 half_open, 2 open)
+def _breaker_lines() -> List[str]:
+    b = db_breaker.stats()
+    state = {HALF_OPEN: 1, OPEN: 2}.get(b["state"], 0)
+    return [
+        "# HELP db_breaker_state 회로 차단기 상태 (0 closed, 1 half_open, 2 open)",
+        "# TYPE db_breaker_state gauge",
+        f'db_breaker_state{{breaker="{b["name"]}"}} {state}',
+        "# HELP db_breaker_opened_total 차단 전환 횟수",
+        "# TYPE db_breaker_opened_total counter",
+        f'db_breaker_opened_total{{breaker="{b["name"]}"}} {b["opened_total"]}',
+        "# HELP db_breaker_rejected_total 차단으로 거부한 호출 수",
+        "# TYPE db_breaker_rejected_total counter",
+        f'db_breaker_rejected_total{{breaker="{b["name"]}"}} {b["rejected_total"]}',
+    ]
+
+
+def _replica_lines() -> List[str]:
+    replica_set = db_session.async_replica_set if db_session.USE_ASYNC else db_session.replica_set
+    if replica_set is None:
+        return []
+    stats = replica_set.stats()
+    lines = [
+        "# HELP db_replica_up 복제본 상태 (1 정상, 0 제외)",
+        "# TYPE db_replica_up gauge",
+    ]
+    lines += [f'db_replica_up{{replica="{r["name"]}"}} {int(r["healthy"])}' for r in stats["replicas"]]
+    lines += [
+        "# HELP db_replica_picked_total 복제본으로 보낸 읽기 세션 수",
+        "# TYPE db_replica_picked_total counter",
+    ]
+    lines += [f'db_replica_picked_total{{replica="{r["name"]}"}} {r["picked"]}' for r in stats["replicas"]]
+    lines += [
+        "# HELP db_replica_primary_fallbacks_total 정상 복제본이 없어 주 DB 로 읽은 횟수",
+        "# TYPE db_replica_primary_fallbacks_total counter",
+        f"db_replica_primary_fallbacks_total {stats['primary_fallbacks']}",
+    ]
+    return lines
+
+
+# Prometheus 스크레이프용 지표
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    return PlainTextResponse(
+        metrics.render_prometheus(extra=_pool_lines() + _breaker_lines() + _replica_lines()),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,87 @@
+# app/api/routes/reports.py
+# 라우터: 대시보드용 재고 보고서 (/api/reports)
+# - 목록 API 를 페이지 단위로 훑어 합산하던 것을 집계 행 조회 한 번으로 대체 (app/services/reports.py)
+#   · 응답 비용은 재고 행 수와 무관 (카테고리 수에 비례)
+# - 약한 ETag: 재고/카테고리 변경 카운터 기반, If-None-Match 일치 시 집계 조회 없이 304 (app/services/versions.py)
+# - 집계 복구/부족 기준 변경 반영: python -m app.cli rebuild-counts
+from math import ceil
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.responses import json_response
+from app.db.session import DbSession, get_db, run_db
+from app.services import category_cache, reports, versions
+
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+
+def _tagged(response: Response, if_none_match: Optional[str], db: Session):
+    """ETag 설정, 일치하면 304 응답 반환 (아니면 None)"""
+    tag = versions.etag(db, versions.STOCKS, versions.CATEGORIES)
+    if versions.matches(if_none_match, tag):
+        return versions.not_modified(tag)
+    versions.set_headers(response, tag)
+    return None
+
+
+# 전체 합계: 품목 수, 수량 합계, 품절/부족 품목 수
+@router.get("/summary")
+async def report_summary(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
+):
+    def work(db: Session):
+        return _tagged(response, if_none_match, db) or json_response(reports.summary(db), response)
+
+    return await run_db(db, work)
+
+
+# 카테고리별 합계 (정렬 키 내림차순, 페이지는 1부터)
+@router.get("/categories")
+async def report_by_category(
+    response: Response,
+    page: int = Query(1, ge=1),
+    size: int = Query(50, ge=1, le=500),
+    sort: str = Query("total_quantity", description="정렬 (id|sku_count|total_quantity|zero_stock|low_stock), 내림차순"),
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
+):
+    if sort not in reports.CATEGORY_SORTS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 sort")
+
+    def work(db: Session):
+        not_modified = _tagged(response, if_none_match, db)
+        if not_modified is not None:
+            return not_modified
+        items, total = reports.by_category(db, page, size, sort)
+        response.headers["X-Total-Count"] = str(total)
+        return json_response({
+            "page": page,
+            "total_pages": ceil(total / size) if total > 0 else 1,
+            "sort": sort,
+            "items": items,
+        }, response)
+
+    return await run_db(db, work)
+
+
+# 재고 분포 히스토그램 (zero / low / ok), categoryId 지정 시 그 카테고리만
+@router.get("/stock-levels")
+async def report_stock_levels(
+    response: Response,
+    categoryId: Optional[int] = Query(None, ge=1),
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
+):
+    def work(db: Session):
+        not_modified = _tagged(response, if_none_match, db)
+        if not_modified is not None:
+            return not_modified
+        if categoryId is not None and category_cache.get_name(db, categoryId) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="카테고리가 존재하지 않음")
+        return json_response(reports.stock_levels(db, categoryId), response)
+
+    return await run_db(db, work)
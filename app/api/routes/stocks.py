@@ -1,25 +1,53 @@
 # app/api/routes/stocks.py
 # 라우터: 상품 목록 화면 + 목록 API
 # - 검색(keyword), 카테고리 필터(categoryId)
-# - 페이지네이션(page, size) + id desc 정렬
+#   · 키워드는 물품명 n-gram 색인으로 후보를 좁힌 뒤 ILIKE 재확인 (app/services/search.py)
+# - 페이지네이션(page, size) + 정렬(sort=필드:방향, 기본 id:desc, 인덱스 기반 화이트리스트)
+# - API는 cursor 파라미터로 키셋 페이지네이션 지원 (next_cursor / prev_cursor)
 # - API는 X-Total-Count 헤더로 총건수 제공
+# - 조회 API는 변경 토큰 기반 약한 ETag 제공, If-None-Match 일치 시 페이지 쿼리 없이 304 (app/services/versions.py)
+#   · 단건 조회(/api/stocks/{id})는 행 version 기반 ETag → 수정 요청의 If-Match 로 그대로 사용 (app/services/row_version.py)
+#   · 카테고리 카운터/상한 COUNT 사용, 키워드 검색은 상한 초과 시 "1000+" (app/services/counts.py)
+# - 응답의 category_name 은 카테고리 캐시에서 채움 (목록 쿼리에 Category 조인 없음)
+# - 목록/검색 API는 필요한 컬럼만 튜플로 조회하고 FastJSONResponse(orjson 선택)로 바로 직렬화 (app/core/responses.py)
 # - 템플릿은 구(old) 변수(stocks, pageInfo)와 신(new) 변수(pageData) 둘 다 지원
 # - base.html의 {{ now().year }} 지원
-# - DB 미연결 시에도 템플릿 폴백 렌더 보장
-
-
-from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Request, Depends, Query, Response
-from fastapi.responses import HTMLResponse, JSONResponse
+# - DB 미연결 시에도 템플릿 폴백 렌더 보장 (/stocks 는 렌더 캐시 + DB 회로 차단기, 장애 중 마지막 정상 본문 제공)
+# - 핸들러는 async def, DB 작업은 run_db로 실행 (설정에 따라 동기/비동기 세션)
+# - 내보내기(/api/stocks/export)는 서버 사이드 커서로 CSV/NDJSON 스트리밍
+# - 수정(PUT)은 행 version 으로 낙관적 동시성 제어: If-Match 또는 바디 version, 충돌 시 412/409 (app/services/row_version.py)
+# - 수량 증감(/api/stocks/{id}/adjust)은 UPDATE 한 문장으로 원자 적용 (app/services/inventory.py)
+#   · INVENTORY_GROUP_COMMIT=true 면 묶음 커밋 큐 경유 (app/services/group_commit.py)
+# - 수량 이력: 변동 원장(/movements), 시점 잔량(/balance?at=) (app/services/ledger.py)
+# - 창고 범위: 목록/검색 API 의 warehouseId, 증감 바디의 warehouse_id (app/services/locations.py)
+#   · 목록/검색은 그 창고 취급 품목만, inventory 는 그 창고 수량 (total_inventory 는 전 창고 합계)
+#   · 단건 조회는 창고별 수량(locations)을 함께 제공
+
+
+import base64
+import csv
+import io
+import json
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple, Iterator, AsyncIterator, Literal
+from fastapi import APIRouter, Request, Depends, Header, Query, Response, HTTPException
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from fastapi.templating import Jinja2Templates
 from datetime import datetime
 
-from app.db.session import get_session
+from app.core import metrics
+from app.core.config import get_settings
+from app.core.responses import json_response
+from app.db import session as db_session
+from app.db.breaker import db_breaker
+from app.db.session import DbSession, get_db, run_db, run_in_session
 from app.models.stock import Stock
 from app.models.category import Category
-from app.schemas.stock import StockCreate, StockUpdate  # JSON 스키마
+from app.models.stock_location import StockLocation
+from app.schemas.stock import StockAdjust, StockAdjustResult, StockCreate, StockUpdate  # JSON 스키마
+from app.services import category_cache, counts, group_commit, inventory, ledger, locations, page_cache, row_version, search, stock_sync, versions
 
 from math import ceil
 
@@ -28,52 +56,325 @@ templates = Jinja2Templates(directory="app/templates")
 
 # ----------------------------------------------------------
 # 내부 유틸: 필터 쿼리 구성
+#  - _apply_stock_filters는 Query/Select 둘 다 받음 (내보내기와 공용)
+#  - 창고 범위면 StockLocations 를 창고 id 범위로 읽고 Stocks 는 PK 조인 (app/models/stock_location.py)
+#    · id/수량 정렬, 카테고리 필터, 총건수가 (warehouse_id, ...) 선두 인덱스 안에서 끝남 (다른 창고 행은 읽지 않음)
 # ----------------------------------------------------------
+_LIST_COLUMNS = (Stock.id, Stock.name, Stock.inventory, Stock.category_id, Stock.version)
+
+
+class _Cols(NamedTuple):
+    """범위별 키 컬럼 (정렬/키셋/필터 대상)"""
+    id: Any
+    inventory: Any
+    category_id: Any
+
+
+_STOCK_COLS = _Cols(Stock.id, Stock.inventory, Stock.category_id)
+_LOCATION_COLS = _Cols(StockLocation.stock_id, StockLocation.quantity, StockLocation.category_id)
+
+
+def _cols(warehouse_id: Optional[int]) -> _Cols:
+    return _STOCK_COLS if warehouse_id is None else _LOCATION_COLS
+
+
 def _build_stock_query(
     db: Session,
     category_id: Optional[int],
     keyword: Optional[str],
+    warehouse_id: Optional[int] = None,
 ):
-    q = db.query(Stock).outerjoin(Category, Stock.category_id == Category.id)
+    # 필요한 컬럼만 튜플로 조회 (ORM 인스턴스/관계 적재 없음), 카테고리 이름은 캐시로 채움 (_stock_items)
+    if warehouse_id is None:
+        q = db.query(*_LIST_COLUMNS)
+    else:
+        q = (
+            db.query(
+                StockLocation.stock_id.label("id"),
+                Stock.name,
+                StockLocation.quantity.label("inventory"),
+                StockLocation.category_id.label("category_id"),
+                Stock.version,
+                Stock.inventory.label("total_inventory"),
+            )
+            .select_from(StockLocation)
+            .join(Stock, Stock.id == StockLocation.stock_id)
+            .filter(StockLocation.warehouse_id == warehouse_id)
+        )
+    return _apply_stock_filters(q, category_id, keyword, _cols(warehouse_id))
 
+
+def _apply_stock_filters(q, category_id: Optional[int], keyword: Optional[str], cols: _Cols = _STOCK_COLS):
     if category_id is not None:
-        q = q.filter(Stock.category_id == category_id)
+        q = q.filter(cols.category_id == category_id)
 
     if keyword:
         kw = keyword.strip()
         if kw:
-            q = q.filter(Stock.name.ilike(f"%{kw}%"))
+            q = search.apply_keyword_filter(q, kw)
 
     return q
 
 
+def _stock_items(db: Session, rows, warehouse_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """목록 응답 항목 변환 ((id, name, inventory, category_id, version[, total_inventory]) 행, category_name 은 카테고리 캐시 조회)"""
+    metrics.add_rows(len(rows))
+    names = category_cache.get_names(db, {r.category_id for r in rows})
+    items = [
+        {
+            "id": r.id,
+            "name": r.name,
+            "inventory": r.inventory,
+            "category_id": r.category_id,
+            "category_name": names.get(r.category_id),
+            "version": r.version,
+        }
+        for r in rows
+    ]
+    if warehouse_id is not None:
+        for item, r in zip(items, rows):
+            item["warehouse_id"] = warehouse_id
+            item["total_inventory"] = r.total_inventory
+    return items
+
+
+def _warehouse_or_404(db: Session, warehouse_id: Optional[int]) -> None:
+    if warehouse_id is not None and not locations.exists(db, warehouse_id):
+        raise HTTPException(status_code=404, detail="창고가 존재하지 않음")
+
+
+# ----------------------------------------------------------
+# 내부 유틸: 정렬 (sort=필드:방향)
+#  - 화이트리스트: id, name, inventory, categoryName(category_name)
+#  - 동률은 id로 끊고 방향을 주 키와 맞춰 인덱스 정/역방향 스캔 한 번으로 끝나게 함
+#    · name/inventory: ix_Stocks_name, ix_Stocks_inventory
+#      카테고리 필터 시 (category_id, name), (category_id, inventory) 복합 인덱스
+#    · categoryName: Category.name 인덱스 순으로 카테고리를 돌며 ix_Stocks_category_id(+id) 범위 스캔
+#    · 창고 범위: id 는 PK(warehouse_id, stock_id), inventory 는 (warehouse_id, quantity, stock_id)
+#      name/categoryName 은 창고 행을 읽은 뒤 정렬 (창고 파티션 안에서만)
+# ----------------------------------------------------------
+class _Sort(NamedTuple):
+    field: str   # id | name | inventory | category_name
+    desc: bool
+
+    def __str__(self) -> str:
+        return f"{self.field}:{'desc' if self.desc else 'asc'}"
+
+
+_DEFAULT_SORT = _Sort("id", True)
+_SORT_FIELDS = {
+    "id": "id",
+    "name": "name",
+    "inventory": "inventory",
+    "categoryName": "category_name",
+    "category_name": "category_name",
+}
+
+
+def _parse_sort(sort: Optional[str]) -> _Sort:
+    if not sort:
+        return _DEFAULT_SORT
+    field, _, order = sort.partition(":")
+    if field not in _SORT_FIELDS or order not in ("", "asc", "desc"):
+        raise HTTPException(status_code=400, detail="유효하지 않은 sort")
+    return _Sort(_SORT_FIELDS[field], order != "asc")
+
+
+def _sort_column(sort: _Sort, cols: _Cols = _STOCK_COLS):
+    return {
+        "name": Stock.name,
+        "inventory": cols.inventory,
+        "category_name": Category.name,
+    }.get(sort.field)
+
+
+def _apply_sort(q, sort: _Sort, reverse: bool = False, cols: _Cols = _STOCK_COLS):
+    """정렬 적용 (reverse: 이전 페이지 조회용 역순)"""
+    desc = sort.desc != reverse
+    col = _sort_column(sort, cols)
+    if sort.field == "category_name":
+        q = q.join(Category, cols.category_id == Category.id)
+    keys = [cols.id] if col is None else [col, cols.id]
+    return q.order_by(*[k.desc() if desc else k.asc() for k in keys])
+
+
+def _seek(sort: _Sort, key: List[Any], forward: bool, cols: _Cols = _STOCK_COLS):
+    """키셋 조건: 정렬 순서상 key 다음(forward) 또는 이전 행"""
+    after = sort.desc != forward   # True면 key보다 큰 쪽
+    col = _sort_column(sort, cols)
+    if col is None:
+        return cols.id > key[0] if after else cols.id < key[0]
+    value, last_id = key
+    if after:
+        return or_(col > value, and_(col == value, cols.id > last_id))
+    return or_(col < value, and_(col == value, cols.id < last_id))
+
+
+def _row_keys(db: Session, sort: _Sort, rows: List[Any]) -> List[List[Any]]:
+    """행별 커서 키 ([id] 또는 [정렬값, id])"""
+    if sort.field == "id":
+        return [[r.id] for r in rows]
+    if sort.field == "category_name":
+        names = category_cache.get_names(db, {r.category_id for r in rows})
+        return [[names.get(r.category_id), r.id] for r in rows]
+    return [[getattr(r, sort.field), r.id] for r in rows]
+
+
+# ----------------------------------------------------------
+# 내부 유틸: 키셋(cursor) 페이지네이션
+#  - cursor는 {"k": [정렬키..., id], "d": "n"|"p", "s": "필드:방향", "w": 창고 ID} JSON을 base64url 인코딩한 불투명 문자열
+#  - "n"은 다음 페이지(정렬 순서상 뒤), "p"는 이전 페이지(정렬 순서상 앞)
+#  - "s"가 없으면 id:desc (이전 형식 호환), 요청 sort와 다르면 400 ("w"도 요청 창고와 다르면 400, 없으면 창고 미지정)
+#  - OFFSET 없이 인덱스 범위 탐색만 하므로 깊은 페이지도 일정한 비용
+# ----------------------------------------------------------
+def _encode_cursor(key: List[Any], direction: str, sort: _Sort = _DEFAULT_SORT, warehouse_id: Optional[int] = None) -> str:
+    data: Dict[str, Any] = {"k": key, "d": direction}
+    if sort != _DEFAULT_SORT:
+        data["s"] = str(sort)
+    if warehouse_id is not None:
+        data["w"] = warehouse_id
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: _Sort = _DEFAULT_SORT, warehouse_id: Optional[int] = None) -> Tuple[List[Any], str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        key, direction = data["k"], data["d"]
+        if direction not in ("n", "p") or not isinstance(key, list):
+            raise ValueError(direction)
+        if data.get("s", str(_DEFAULT_SORT)) != str(sort):
+            raise ValueError("sort")
+        if data.get("w") != warehouse_id:
+            raise ValueError("warehouse")
+        if sort.field == "id":
+            if len(key) != 1:
+                raise ValueError(key)
+            return [int(key[0])], direction
+        if len(key) != 2:
+            raise ValueError(key)
+        value = int(key[0]) if sort.field == "inventory" else str(key[0])
+        return [value, int(key[1])], direction
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 cursor")
+
+
+def _keyset_page(
+    db: Session, q, cursor: str, size: int, sort: _Sort = _DEFAULT_SORT, warehouse_id: Optional[int] = None
+) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """
+    cursor 기준으로 한 페이지 조회함. 빈 문자열이면 첫 페이지.
+    size+1건을 읽어 다음(또는 이전) 페이지 존재 여부 판단함.
+    반환: (행 목록, next_cursor, prev_cursor)
+    """
+    cols = _cols(warehouse_id)
+    if not cursor:
+        rows = _apply_sort(q, sort, cols=cols).limit(size + 1).all()
+        has_more = len(rows) > size
+        rows = rows[:size]
+        keys = _row_keys(db, sort, rows)
+        next_cursor = _encode_cursor(keys[-1], "n", sort, warehouse_id) if has_more else None
+        return rows, next_cursor, None
+
+    key, direction = _decode_cursor(cursor, sort, warehouse_id)
+
+    if direction == "n":
+        rows = _apply_sort(q.filter(_seek(sort, key, True, cols)), sort, cols=cols).limit(size + 1).all()
+        has_more = len(rows) > size
+        rows = rows[:size]
+        keys = _row_keys(db, sort, rows)
+        next_cursor = _encode_cursor(keys[-1], "n", sort, warehouse_id) if has_more else None
+        prev_cursor = _encode_cursor(keys[0], "p", sort, warehouse_id) if rows else None
+        return rows, next_cursor, prev_cursor
+
+    # 이전 페이지: 역순으로 읽은 뒤 뒤집어서 요청 정렬 순서 유지함
+    rows = _apply_sort(q.filter(_seek(sort, key, False, cols)), sort, reverse=True, cols=cols).limit(size + 1).all()
+    has_more = len(rows) > size
+    rows = list(reversed(rows[:size]))
+    keys = _row_keys(db, sort, rows)
+    next_cursor = _encode_cursor(keys[-1], "n", sort, warehouse_id) if rows else None
+    prev_cursor = _encode_cursor(keys[0], "p", sort, warehouse_id) if has_more else None
+    return rows, next_cursor, prev_cursor
+
+
+def _page_cursors(
+    db: Session,
+    rows: List[Any],
+    page: int,
+    total_pages: int,
+    more: bool = False,
+    sort: _Sort = _DEFAULT_SORT,
+    warehouse_id: Optional[int] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    page 모드 응답에도 cursor를 실어 보냄.
+    구 클라이언트는 무시하고, 신 클라이언트는 다음 이동부터 cursor 모드로 전환 가능함.
+    more: 총건수가 상한에서 잘린 경우 (마지막 페이지 이후에도 다음 cursor 제공)
+    """
+    if not rows:
+        return None, None
+    keys = _row_keys(db, sort, rows)
+    next_cursor = _encode_cursor(keys[-1], "n", sort, warehouse_id) if (page < total_pages or more) else None
+    prev_cursor = _encode_cursor(keys[0], "p", sort, warehouse_id) if page > 1 else None
+    return next_cursor, prev_cursor
+
+
 # ----------------------------------------------------------
 # 1) 목록 화면 렌더 (/stocks)
+#  - 렌더 결과는 page_cache 에 저장 (stale-while-revalidate, app/services/page_cache.py)
+#  - DB 오류는 회로 차단기(app/db/breaker.py)에 보고, 차단/오류 중에는 마지막 정상 본문을 안내와 함께 제공
+#  - X-Cache: HIT(신선) | REVALIDATED(태그 동일) | MISS(렌더) | STALE(갱신 중/장애)
 # ----------------------------------------------------------
+def _page_response(body: bytes, outcome: str, stale: bool = False) -> HTMLResponse:
+    headers = {"X-Cache": outcome}
+    if stale:
+        headers["Warning"] = '110 - "Response is Stale"'
+    return HTMLResponse(body, headers=headers)
+
+
 @router.get("/stocks", response_class=HTMLResponse)
-def render_stocks_page(
+async def render_stocks_page(
     request: Request,
     categoryId: Optional[int] = Query(None, description="카테고리 ID 필터"),
     keyword: Optional[str] = Query(None, description="이름 검색 키워드"),
     page: int = Query(0, ge=0, description="0부터 시작하는 페이지"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기(1~100)"),
-    db: Session = Depends(get_session),
+    db: DbSession = Depends(get_db),
 ):
-    try:
+    key = (categoryId, (keyword or "").strip(), page, size)
+    entry = page_cache.lookup(key)
+
+    # 신선한 캐시본: DB 확인 없이 제공
+    if entry is not None and page_cache.is_fresh(entry):
+        page_cache.count("hits")
+        return _page_response(entry.body, "HIT")
+
+    def work(db: Session) -> Tuple[bytes, str, str]:
+        # 변경 카운터가 그대로면 본문 재사용 (재검증)
+        tag = versions.etag(db, versions.STOCKS, versions.CATEGORIES)
+        if entry is not None and entry.tag == tag:
+            return entry.body, tag, "REVALIDATED"
+
         # 기본 쿼리
         base_q = _build_stock_query(db, categoryId, keyword)
-        total: int = base_q.with_entities(func.count(Stock.id)).scalar() or 0
 
         # 페이지 데이터
-        result_items: List[Stock] = (
+        result_items = (
             base_q.order_by(Stock.id.desc())
             .offset(page * size)
             .limit(size)
             .all()
         )
+        metrics.add_rows(len(result_items))
 
-        # 카테고리 목록 (검색폼용)
-        cats = db.query(Category).order_by(Category.name.asc()).all()
+        # 총건수: 덜 찬 페이지면 확정, 아니면 카운터/상한 COUNT
+        total = counts.total_from_page(page * size, len(result_items), size)
+        if total is None:
+            total, _ = counts.listing_total(db, base_q, categoryId, (keyword or "").strip())
+
+        # 카테고리 목록 (검색폼용) - 드롭다운에 필요한 id/name 컬럼만 조회함
+        cats = db.query(Category.id, Category.name).order_by(Category.name.asc()).all()
 
         # 신규 포맷(pageData)
         page_data: Dict[str, Any] = {
@@ -97,7 +398,7 @@ def render_stocks_page(
         }
 
         # 템플릿 렌더
-        return templates.TemplateResponse(
+        rendered = templates.TemplateResponse(
             "stocks/index.html",
             {
                 "request": request,
@@ -111,9 +412,13 @@ def render_stocks_page(
                 "keyword": (keyword or "").strip(),
             },
         )
+        return rendered.body, tag, "MISS"
 
-    except Exception:
-        # 폴백: DB 문제 시에도 렌더 보장
+    def fallback():
+        # 폴백: DB 문제 시에도 렌더 보장 (캐시본이 있으면 안내와 함께 그 본문)
+        if entry is not None:
+            page_cache.count("stale_served")
+            return _page_response(page_cache.stale_body(entry), "STALE", stale=True)
         empty_items: List[Stock] = []
         empty_page_data: Dict[str, Any] = {
             "items": empty_items,
@@ -147,108 +452,280 @@ def render_stocks_page(
             },
         )
 
+    # 재검증은 키마다 한 요청만, 나머지는 직전 본문 (stale-while-revalidate)
+    refreshing = entry is not None
+    if refreshing and not page_cache.begin_refresh(key):
+        page_cache.count("stale_served")
+        return _page_response(entry.body, "STALE")
+    try:
+        # 회로 차단 중이면 DB를 건드리지 않음
+        if not db_breaker.allow():
+            return fallback()
+        gen = page_cache.generation()
+        try:
+            body, tag, outcome = await run_db(db, work)
+        except SQLAlchemyError:
+            db_breaker.failure()
+            return fallback()
+        except Exception:
+            # DB 외 오류(템플릿 등)는 차단 사유 아님
+            return fallback()
+        db_breaker.success()
+        page_cache.store(key, body, tag, gen)
+        page_cache.count("revalidated" if outcome == "REVALIDATED" else "rendered")
+        return _page_response(body, outcome)
+    finally:
+        if refreshing:
+            page_cache.end_refresh(key)
+
 
 # ----------------------------------------------------------
 # 2) 목록 API (/api/stocks)
 #  - 프런트(JS)와 포맷 통일: { items, page, total_pages }
 #  - 페이지는 1부터 시작 (JS와 동일)
+#  - cursor 지정 시 키셋 모드: { items, size, next_cursor, prev_cursor } (COUNT 생략)
+#  - warehouseId 지정 시 그 창고 범위 (항목에 warehouse_id, total_inventory 추가, 없는 창고는 404)
 # ----------------------------------------------------------
 @router.get("/api/stocks")
-def list_stocks_api(
+async def list_stocks_api(
     response: Response,
     categoryId: Optional[int] = Query(None),
     keyword: Optional[str] = Query(None),
+    warehouseId: Optional[int] = Query(None, ge=1, description="창고 ID (지정 시 그 창고 취급 품목, 수량은 창고 수량)"),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_session),
+    cursor: Optional[str] = Query(None, description="키셋 페이지 커서(빈 값이면 첫 페이지)"),
+    sort: Optional[str] = Query(None, description="정렬 (id|name|inventory|categoryName):(asc|desc)"),
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
 ):
-    base_q = _build_stock_query(db, categoryId, keyword)
-    total: int = base_q.with_entities(func.count(Stock.id)).scalar() or 0
-
-    from math import ceil
-    total_pages = ceil(total / size) if total > 0 else 1
-    offset = (page - 1) * size
-
-    rows: List[Stock] = (
-        base_q.order_by(Stock.id.desc())
-        .offset(offset)
-        .limit(size)
-        .all()
-    )
+    sort_spec = _parse_sort(sort)
+
+    def work(db: Session):
+        tag = versions.etag(db, versions.STOCKS, versions.CATEGORIES)
+        if versions.matches(if_none_match, tag):
+            return versions.not_modified(tag)
+        versions.set_headers(response, tag)
+        _warehouse_or_404(db, warehouseId)
+
+        base_q = _build_stock_query(db, categoryId, keyword, warehouseId)
+
+        # 키셋 모드: OFFSET/COUNT 없이 커서 기준으로만 조회함
+        if cursor is not None:
+            rows, next_cursor, prev_cursor = _keyset_page(db, base_q, cursor, size, sort_spec, warehouseId)
+            return json_response({
+                "size": size,
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+                "items": _stock_items(db, rows, warehouseId),
+            }, response)
+
+        offset = (page - 1) * size
+
+        rows = (
+            _apply_sort(base_q, sort_spec, cols=_cols(warehouseId))
+            .offset(offset)
+            .limit(size)
+            .all()
+        )
 
-    items = [
-        {
-            "id": r.id,
-            "name": r.name,
-            "inventory": getattr(r, "inventory", None),
-            "category_id": getattr(r, "category_id", None),
-            "category_name": getattr(r.category, "name", None) if hasattr(r, "category") else None,
-        }
-        for r in rows
-    ]
+        # 총건수: 덜 찬 페이지면 확정, 아니면 카운터/상한 COUNT (창고 범위는 창고 인덱스 범위 COUNT)
+        total = counts.total_from_page(offset, len(rows), size)
+        capped = False
+        if total is None:
+            total, capped = counts.listing_total(db, base_q, categoryId, (keyword or "").strip(), warehouseId)
 
-    # 헤더는 유지 (총건수)
-    response.headers["X-Total-Count"] = str(total)
-    return {
-        "page": page,
-        "total_pages": total_pages,
-        "items": items
-    }
+        total_pages = ceil(total / size) if total > 0 else 1
+        next_cursor, prev_cursor = _page_cursors(db, rows, page, total_pages, capped, sort_spec, warehouseId)
+
+        items = _stock_items(db, rows, warehouseId)
+
+        # 헤더는 유지 (총건수, 상한 초과 시 "1000+")
+        response.headers["X-Total-Count"] = counts.format_total(total, capped)
+        return json_response({
+            "page": page,
+            "total_pages": total_pages,
+            "total_capped": capped,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+            "items": items
+        }, response)
+
+    return await run_db(db, work)
 
 
 # -----------------------------------------------------------
 # 검색 엔드포인트: /api/stocks/search
-# 조건: categoryId(선택), keyword(선택), page(기본1), size(기본20)
-# 반환: items(목록), page(현재페이지), total_pages(전체 페이지수)
+# 조건: categoryId(선택), keyword(선택), warehouseId(선택), page(기본1), size(기본20), cursor(선택)
+# 반환: items(목록), page(현재페이지), total_pages(전체 페이지수), next_cursor, prev_cursor
 # -----------------------------------------------------------
 
 @router.get("/api/stocks/search")
-def search_stocks(
+async def search_stocks(
+    response: Response,
     categoryId: int | None = Query(None),
     keyword: str | None = Query(None),
+    warehouseId: int | None = Query(None, ge=1, description="창고 ID (지정 시 그 창고 취급 품목, 수량은 창고 수량)"),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1),
-    db: Session = Depends(get_session)
+    cursor: str | None = Query(None, description="키셋 페이지 커서(빈 값이면 첫 페이지)"),
+    sort: str | None = Query(None, description="정렬 (id|name|inventory|categoryName):(asc|desc)"),
+    if_none_match: str | None = Header(None),
+    db: DbSession = Depends(get_db)
 ):
-    query = db.query(Stock)
+    sort_spec = _parse_sort(sort)
+    # 필터와 총건수가 같은 키워드를 보도록 한 번만 정규화 (공백만이면 검색 없음)
+    kw = (keyword or "").strip()
+
+    def work(db: Session):
+        tag = versions.etag(db, versions.STOCKS, versions.CATEGORIES)
+        if versions.matches(if_none_match, tag):
+            return versions.not_modified(tag)
+        versions.set_headers(response, tag)
+        _warehouse_or_404(db, warehouseId)
+
+        # 카테고리 필터(0은 전체) + 이름 검색 (+ 창고 범위), 컬럼 튜플 조회
+        query = _build_stock_query(db, categoryId or None, kw, warehouseId)
+
+        # 키셋 모드
+        if cursor is not None:
+            results, next_cursor, prev_cursor = _keyset_page(db, query, cursor, size, sort_spec, warehouseId)
+            return json_response({
+                "size": size,
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+                "items": _stock_items(db, results, warehouseId),
+            }, response)
+
+        # 페이지네이션
+        offset = (page - 1) * size
+        results = (
+            _apply_sort(query, sort_spec, cols=_cols(warehouseId))
+            .offset(offset)
+            .limit(size)
+            .all()
+        )
 
-    # 카테고리 필터
-    if categoryId:
-        query = query.filter(Stock.category_id == categoryId)
+        # 총건수: 덜 찬 페이지면 확정, 아니면 카운터/상한 COUNT (창고 범위는 창고 인덱스 범위 COUNT)
+        total = counts.total_from_page(offset, len(results), size)
+        capped = False
+        if total is None:
+            total, capped = counts.listing_total(db, query, categoryId or None, kw, warehouseId)
 
-    # 이름 검색
-    if keyword:
-        keyword_like = f"%{keyword}%"
-        query = query.filter(Stock.name.ilike(keyword_like))
-
-    total = query.count()
-    total_pages = ceil(total / size) if total > 0 else 1
-
-    # 페이지네이션
-    offset = (page - 1) * size
-    results = (
-        query.order_by(Stock.id.desc())
-        .offset(offset)
-        .limit(size)
-        .all()
-    )
+        total_pages = ceil(total / size) if total > 0 else 1
+        next_cursor, prev_cursor = _page_cursors(db, results, page, total_pages, capped, sort_spec, warehouseId)
 
-    items = [
-        {
-            "id": s.id,
-            "name": s.name,
-            "inventory": s.inventory,
-            "category_id": s.category_id,
-            "category_name": getattr(s.category, "name", None) if hasattr(s, "category") else None
-        }
-        for s in results
-    ]
+        items = _stock_items(db, results, warehouseId)
 
-    return {
-        "page": page,
-        "total_pages": total_pages,
-        "items": items
-    }
+        return json_response({
+            "page": page,
+            "total_pages": total_pages,
+            "total_capped": capped,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+            "items": items
+        }, response)
+
+    return await run_db(db, work)
+
+# -----------------------------------------------------------
+# 내보내기 엔드포인트: /api/stocks/export
+# 조건: format(csv|ndjson), categoryId(선택), keyword(선택), warehouseId(선택)
+# - warehouseId 지정 시 목록과 같은 창고 범위 (inventory 는 창고 수량, warehouse_id/total_inventory 열 추가)
+# - 필요한 컬럼만 조회, 서버 사이드 커서(stream_results)로 청크 단위 읽기
+# - 청크마다 직렬화해 바로 흘려보내므로 전체 테이블 크기와 무관하게 메모리 일정
+# - 동기 모드: 제너레이터를 스레드풀에서 순회 / 비동기 모드: AsyncSession.stream
+# - 스트림 수명 동안 쓸 전용 세션을 제너레이터 안에서 열고 닫음
+# -----------------------------------------------------------
+_EXPORT_COLUMNS = ["id", "name", "inventory", "category_id", "category_name"]
+_EXPORT_WAREHOUSE_COLUMNS = _EXPORT_COLUMNS + ["warehouse_id", "total_inventory"]
+
+
+def _export_statement(category_id: Optional[int], keyword: Optional[str], warehouse_id: Optional[int] = None):
+    if warehouse_id is None:
+        stmt = (
+            select(Stock.id, Stock.name, Stock.inventory, Stock.category_id, Category.name)
+            .outerjoin(Category, Stock.category_id == Category.id)
+            .order_by(Stock.id)
+        )
+    else:
+        # 창고 PK (warehouse_id, stock_id) 범위 순서대로 읽음
+        stmt = (
+            select(
+                StockLocation.stock_id,
+                Stock.name,
+                StockLocation.quantity,
+                StockLocation.category_id,
+                Category.name,
+                StockLocation.warehouse_id,
+                Stock.inventory,
+            )
+            .select_from(StockLocation)
+            .join(Stock, Stock.id == StockLocation.stock_id)
+            .outerjoin(Category, StockLocation.category_id == Category.id)
+            .where(StockLocation.warehouse_id == warehouse_id)
+            .order_by(StockLocation.stock_id)
+        )
+    stmt = _apply_stock_filters(stmt, category_id, keyword, _cols(warehouse_id))
+    return stmt.execution_options(stream_results=True, yield_per=get_settings().export_chunk_size)
+
+
+def _format_rows(rows, fmt: str, columns: List[str]) -> bytes:
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps(dict(zip(columns, r)), ensure_ascii=False) + "\n" for r in rows
+        ).encode("utf-8")
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def _export_header(fmt: str, columns: List[str]) -> bytes:
+    if fmt == "ndjson":
+        return b""
+    # 엑셀 한글 깨짐 방지용 BOM 포함
+    return ("\ufeff" + ",".join(columns) + "\n").encode("utf-8")
+
+
+def _iter_export_sync(stmt, fmt: str, columns: List[str]) -> Iterator[bytes]:
+    yield _export_header(fmt, columns)
+    with db_session.SessionLocal() as db:
+        for chunk in db.execute(stmt).partitions():
+            metrics.add_rows(len(chunk))
+            yield _format_rows(chunk, fmt, columns)
+
+
+async def _iter_export_async(stmt, fmt: str, columns: List[str]) -> AsyncIterator[bytes]:
+    yield _export_header(fmt, columns)
+    async with db_session.AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for chunk in result.partitions():
+            metrics.add_rows(len(chunk))
+            yield _format_rows(chunk, fmt, columns)
+
+
+@router.get("/api/stocks/export")
+async def export_stocks(
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format", description="내보내기 형식"),
+    categoryId: Optional[int] = Query(None),
+    keyword: Optional[str] = Query(None),
+    warehouseId: Optional[int] = Query(None, ge=1, description="창고 ID (지정 시 그 창고 취급 품목, 수량은 창고 수량)"),
+):
+    columns = _EXPORT_COLUMNS
+    if warehouseId is not None:
+        # 스트림 시작 전에 확인해야 404 로 응답할 수 있음
+        await run_in_session(_warehouse_or_404, warehouseId)
+        columns = _EXPORT_WAREHOUSE_COLUMNS
+    stmt = _export_statement(categoryId, keyword, warehouseId)
+    body = (
+        _iter_export_async(stmt, fmt, columns) if db_session.USE_ASYNC else _iter_export_sync(stmt, fmt, columns)
+    )
+    media_type = "application/x-ndjson" if fmt == "ndjson" else "text/csv; charset=utf-8"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="stocks.{fmt}"'},
+    )
 
 # ============================
 # CRUD: 생성 / 단건조회 / 수정 / 삭제
@@ -257,62 +734,188 @@ from fastapi import HTTPException, status
 from app.schemas.stock import StockCreate, StockUpdate
 
 @router.post("/api/stocks", status_code=status.HTTP_201_CREATED)
-def create_stock(payload: StockCreate, db: Session = Depends(get_session)):
-    # 카테고리 존재 검증
-    cat = db.get(Category, payload.category_id)
-    if not cat:
-        raise HTTPException(status_code=400, detail="유효하지 않은 category_id")
+async def create_stock(payload: StockCreate, db: DbSession = Depends(get_db)):
+    def work(db: Session):
+        # 카테고리 존재 검증 (캐시)
+        if category_cache.get_name(db, payload.category_id) is None:
+            raise HTTPException(status_code=400, detail="유효하지 않은 category_id")
 
-    # JSON 바디: { "name": str, "inventory": int, "category_id": int }
-    obj = Stock(name=payload.name, inventory=payload.inventory, category_id=payload.category_id)
+        # JSON 바디: { "name": str, "inventory": int, "category_id": int }
+        obj = Stock(name=payload.name, inventory=payload.inventory, category_id=payload.category_id)
 
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
-    return {"id": obj.id, "message": "등록 완료"}
+        db.add(obj)
+        db.flush()  # id 확보 후 같은 트랜잭션에서 색인/카운터 반영
+        stock_sync.after_insert(db, [stock_sync.row_of(obj)])
+        db.commit()
+        db.refresh(obj)
+        return {"id": obj.id, "message": "등록 완료", "version": obj.version}
+
+    return await run_db(db, work)
 
 @router.get("/api/stocks/{stock_id}")
-def get_stock(
+async def get_stock(
     stock_id: int,
-    db: Session = Depends(get_session),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
 ):
-    obj = db.get(Stock, stock_id)
-    if not obj:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상이 존재하지 않음")
-    return {
-        "id": obj.id,
-        "name": obj.name,
-        "inventory": obj.inventory,
-        "category_id": obj.category_id,
-        "category_name": getattr(obj.category, "name", None) if hasattr(obj, "category") else None,
-    }
+    def work(db: Session):
+        obj = db.get(Stock, stock_id)
+        if not obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상이 존재하지 않음")
+
+        # 행 version 기반 ETag (category_name 도 담으므로 카테고리 version 포함, If-Match 로 그대로 사용 가능)
+        category = obj.category
+        tag = row_version.etag(obj.version, getattr(category, "version", 0))
+        if versions.matches(if_none_match, tag):
+            return versions.not_modified(tag)
+        versions.set_headers(response, tag)
+        return {
+            "id": obj.id,
+            "name": obj.name,
+            "inventory": obj.inventory,
+            "category_id": obj.category_id,
+            "category_name": getattr(category, "name", None),
+            "version": obj.version,
+            "locations": locations.breakdown(db, stock_id),
+        }
 
+    return await run_db(db, work)
+
+# ----------------------------------------------------------
+# 수정 (낙관적 동시성 제어, app/services/row_version.py)
+#  - 바디: { "name"?, "inventory"?, "category_id"?, "version"? }
+#  - 기대 version: If-Match 헤더(단건 조회 ETag) 우선, 없으면 바디 version (둘 다 없으면 마지막 쓰기 우선)
+#  - 조건부 UPDATE 한 문장, 충돌 시 412(If-Match) / 409(바디 version)
+#  - 응답: { id, message, version(변경 후) }
+# ----------------------------------------------------------
 @router.put("/api/stocks/{stock_id}")
-def update_stock(stock_id: int, payload: StockUpdate, db: Session = Depends(get_session)):
-    # JSON 바디 일부만 와도 됨: { "name"?, "inventory"?, "category_id"? }
-    obj = db.get(Stock, stock_id)
-    if not obj:
-        raise HTTPException(status_code=404, detail="존재하지 않음")
-
-    if payload.name is not None:
-        obj.name = payload.name
-    if payload.inventory is not None:
-        obj.inventory = payload.inventory
-    if payload.category_id is not None:
-        obj.category_id = payload.category_id
-
-    db.commit()
-    db.refresh(obj)
-    return {"id": obj.id, "message": "수정 완료"}
+async def update_stock(
+    stock_id: int,
+    payload: StockUpdate,
+    if_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_db),
+):
+    exp = row_version.expected(if_match, payload.version)
+    values = payload.model_dump(exclude={"version"}, exclude_none=True)
+
+    def work(db: Session):
+        try:
+            for _ in range(row_version.UPDATE_RETRIES):
+                r = db.execute(select(*_LIST_COLUMNS).where(Stock.id == stock_id)).first()
+                if r is None:
+                    raise HTTPException(status_code=404, detail="존재하지 않음")
+                before = stock_sync.StockRow(*r)
+                row_version.check(exp, before.version)
+                if not values or row_version.update_if(db, Stock, stock_id, before.version, values):
+                    break
+                # 읽은 뒤 다른 쓰기가 끼어듦: 기대 version 이 있으면 충돌, 없으면 다시 읽음
+                if exp.version is not None:
+                    raise row_version.VersionConflict()
+            else:
+                raise row_version.VersionConflict()
+
+            if not values:
+                return {"id": stock_id, "message": "수정 완료", "version": before.version}
+            after = before._replace(**values, version=before.version + 1)
+            stock_sync.after_update(db, [(before, after)])
+            db.commit()
+        except row_version.VersionConflict as exc:
+            db.rollback()
+            raise row_version.conflict_error(exc, exp)
+        return {"id": stock_id, "message": "수정 완료", "version": after.version}
+
+    return await run_db(db, work)
 
 @router.delete("/api/stocks/{stock_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_stock(
+async def delete_stock(
     stock_id: int,
-    db: Session = Depends(get_session),
+    db: DbSession = Depends(get_db),
 ):
-    obj = db.get(Stock, stock_id)
-    if not obj:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상이 존재하지 않음")
-    db.delete(obj)
-    db.commit()
-    return
+    def work(db: Session):
+        obj = db.get(Stock, stock_id)
+        if not obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상이 존재하지 않음")
+        stock_sync.after_delete(db, [stock_sync.row_of(obj)])
+        db.delete(obj)
+        db.commit()
+        return
+
+    return await run_db(db, work)
+
+# ----------------------------------------------------------
+# 수량 증감 (입고/출고 스캔)
+#  - 바디: { "delta": int, "warehouse_id"?: int }  (양수: 입고, 음수: 출고)
+#  - 조회 없이 UPDATE 한 문장 → 동시 요청에도 누락 없음
+#  - warehouse_id 지정 시 그 창고 수량도 함께 증감 (응답에 warehouse_inventory)
+#  - 404: 대상/창고 없음, 409: 수량 부족 (0 미만이 되는 출고, 창고 지정이면 그 창고 기준)
+# ----------------------------------------------------------
+def _adjust_http_error(exc: inventory.AdjustError) -> HTTPException:
+    if exc.reason == "not_found":
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="대상이 존재하지 않음")
+    if exc.reason == "warehouse_not_found":
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="창고가 존재하지 않음")
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail="수량 부족")
+
+
+def _adjust_result(done: inventory.Adjusted, warehouse_id: Optional[int]) -> StockAdjustResult:
+    return StockAdjustResult(
+        id=done.row.id,
+        inventory=done.row.inventory,
+        warehouse_id=warehouse_id,
+        warehouse_inventory=done.warehouse_inventory,
+    )
+
+
+@router.post("/api/stocks/{stock_id}/adjust", response_model=StockAdjustResult, response_model_exclude_none=True)
+async def adjust_stock(stock_id: int, payload: StockAdjust):
+    # 묶음 커밋 모드: 큐에 넣고 묶음이 커밋되면 응답 (app/services/group_commit.py)
+    # - 요청 세션은 직접 커밋 경로에서만 엶 (큐 대기 동안 풀 연결을 잡지 않도록 get_db 의존성 미사용)
+    if get_settings().inventory_group_commit:
+        try:
+            done = await group_commit.inventory_queue.submit(stock_id, payload.delta, payload.warehouse_id)
+        except inventory.AdjustError as exc:
+            raise _adjust_http_error(exc)
+        return _adjust_result(done, payload.warehouse_id)
+
+    def work(db: Session):
+        try:
+            done = inventory.adjust(db, stock_id, payload.delta, payload.warehouse_id)
+            db.commit()
+        except inventory.AdjustError as exc:
+            db.rollback()
+            raise _adjust_http_error(exc)
+        return _adjust_result(done, payload.warehouse_id)
+
+    return await run_in_session(work)
+
+
+# ----------------------------------------------------------
+# 수량 이력
+#  - 삭제된 재고도 원장이 남으므로 존재 검사 없이 조회
+# ----------------------------------------------------------
+@router.get("/api/stocks/{stock_id}/balance")
+async def stock_balance_at(
+    stock_id: int,
+    at: datetime = Query(..., description="조회 시각 (ISO 8601, 오프셋 없으면 UTC)"),
+    db: DbSession = Depends(get_db),
+):
+    def work(db: Session):
+        at_utc = ledger.utc_naive(at)
+        return {"id": stock_id, "at": at_utc.isoformat(), "inventory": ledger.balance_at(db, stock_id, at_utc)}
+
+    return await run_db(db, work)
+
+
+@router.get("/api/stocks/{stock_id}/movements")
+async def stock_movements(
+    stock_id: int,
+    before_id: Optional[int] = Query(None, ge=1, description="이 id 미만의 이력부터 (다음 페이지)"),
+    size: int = Query(50, ge=1, le=500),
+    db: DbSession = Depends(get_db),
+):
+    def work(db: Session):
+        items, next_before = ledger.movements(db, stock_id, before_id, size)
+        return {"items": items, "next_before_id": next_before}
+
+    return await run_db(db, work)
@@ -0,0 +1,224 @@
+# app/api/routes/stocks_bulk.py
+# 라우터: 재고 일괄 쓰기 API (/api/stocks/bulk, /api/stocks/import)
+# - POST: 생성, PATCH: 부분 수정, DELETE: 삭제, POST /bulk/adjust: 수량 일괄 증감
+# - CSV 업로드 가져오기: 스트리밍 파싱 + 청크 단위 추가/커밋 (app/services/stock_import.py)
+# - 카테고리 검증은 IN 조회 한 번, 쓰기는 청크별 executemany, 전체를 트랜잭션 하나로 커밋
+# - 잘못된 항목은 건너뛰고 항목별 결과(index, id, ok, error)로 알려줌
+# - /api/stocks/{stock_id} 보다 먼저 등록해야 "bulk" 경로가 가로채이지 않음 (app/main.py)
+
+import io
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.db.session import DbSession, SessionLocal, get_db, run_db
+from app.schemas.stock import (
+    StockAdjustBulkResult,
+    StockAdjustItem,
+    StockAdjustItemResult,
+    StockBulkDelete,
+    StockBulkItemResult,
+    StockBulkResult,
+    StockBulkUpdateItem,
+    StockCreate,
+)
+from app.services import inventory, row_version, stock_bulk, stock_import
+from app.services.stock_sync import StockRow
+
+router = APIRouter(prefix="/api/stocks", tags=["stocks"])
+
+
+# ----------------------------------------------------------
+# 내부 유틸
+# ----------------------------------------------------------
+def _check_size(n: int) -> None:
+    limit = get_settings().bulk_max_items
+    if n > limit:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {limit}건까지 처리 가능",
+        )
+
+
+def _summary(results: List[StockBulkItemResult]) -> StockBulkResult:
+    ok = sum(1 for r in results if r.ok)
+    return StockBulkResult(succeeded=ok, failed=len(results) - ok, results=results)
+
+
+# ----------------------------------------------------------
+# 일괄 생성
+# ----------------------------------------------------------
+@router.post("/bulk", response_model=StockBulkResult)
+async def bulk_create_stocks(payload: List[StockCreate], db: DbSession = Depends(get_db)):
+    _check_size(len(payload))
+
+    def work(db: Session):
+        valid = stock_bulk.valid_category_ids(db, {p.category_id for p in payload})
+
+        results: List[StockBulkItemResult] = []
+        rows: List[dict] = []
+        row_index: List[int] = []
+        for i, p in enumerate(payload):
+            if p.category_id not in valid:
+                results.append(StockBulkItemResult(index=i, ok=False, error="유효하지 않은 category_id"))
+                continue
+            rows.append({"name": p.name, "inventory": p.inventory, "category_id": p.category_id})
+            row_index.append(i)
+
+        try:
+            new_ids = stock_bulk.insert_rows(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        results.extend(StockBulkItemResult(index=i, id=new_id, ok=True) for i, new_id in zip(row_index, new_ids))
+        results.sort(key=lambda r: r.index)
+        return _summary(results)
+
+    return await run_db(db, work)
+
+
+# ----------------------------------------------------------
+# 일괄 부분 수정
+#  - 같은 id가 여러 번 오면 요청 순서대로 누적 적용
+#  - 항목에 version 이 있으면 요청 시점 행 version 과 비교 (다르면 그 항목만 실패)
+#  - 읽은 뒤 커밋 전에 다른 요청이 같은 행을 바꾸면 전체 409 (다시 조회 후 재시도)
+# ----------------------------------------------------------
+@router.patch("/bulk", response_model=StockBulkResult)
+async def bulk_update_stocks(payload: List[StockBulkUpdateItem], db: DbSession = Depends(get_db)):
+    _check_size(len(payload))
+
+    def work(db: Session):
+        before = stock_bulk.fetch_rows(db, (p.id for p in payload))
+        valid = stock_bulk.valid_category_ids(
+            db, {p.category_id for p in payload if p.category_id is not None}
+        )
+
+        results: List[StockBulkItemResult] = []
+        current: Dict[int, StockRow] = dict(before)
+        for i, p in enumerate(payload):
+            row = current.get(p.id)
+            if row is None:
+                results.append(StockBulkItemResult(index=i, id=p.id, ok=False, error="존재하지 않음"))
+                continue
+            if p.category_id is not None and p.category_id not in valid:
+                results.append(StockBulkItemResult(index=i, id=p.id, ok=False, error="유효하지 않은 category_id"))
+                continue
+            if p.version is not None and p.version != before[p.id].version:
+                results.append(StockBulkItemResult(index=i, id=p.id, ok=False, error="version 불일치"))
+                continue
+            current[p.id] = row._replace(
+                **{k: v for k, v in p.model_dump(exclude={"id", "version"}).items() if v is not None}
+            )
+            results.append(StockBulkItemResult(index=i, id=p.id, ok=True))
+
+        changes = [(before[k], row) for k, row in current.items() if row != before[k]]
+        try:
+            stock_bulk.update_rows(db, changes)
+            db.commit()
+        except row_version.VersionConflict as exc:
+            db.rollback()
+            raise row_version.conflict_error(exc, row_version.Expected(None, False))
+        except Exception:
+            db.rollback()
+            raise
+        return _summary(results)
+
+    return await run_db(db, work)
+
+
+# ----------------------------------------------------------
+# 일괄 삭제
+#  - 바디: { "ids": [1, 2, ...] }
+# ----------------------------------------------------------
+@router.delete("/bulk", response_model=StockBulkResult)
+async def bulk_delete_stocks(payload: StockBulkDelete, db: DbSession = Depends(get_db)):
+    _check_size(len(payload.ids))
+
+    def work(db: Session):
+        existing = stock_bulk.fetch_rows(db, payload.ids)
+
+        results: List[StockBulkItemResult] = []
+        targets: List[StockRow] = []
+        seen = set()
+        for i, stock_id in enumerate(payload.ids):
+            if stock_id not in existing or stock_id in seen:
+                results.append(StockBulkItemResult(index=i, id=stock_id, ok=False, error="존재하지 않음"))
+                continue
+            seen.add(stock_id)
+            targets.append(existing[stock_id])
+            results.append(StockBulkItemResult(index=i, id=stock_id, ok=True))
+
+        try:
+            stock_bulk.delete_rows(db, targets)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return _summary(results)
+
+    return await run_db(db, work)
+
+
+# ----------------------------------------------------------
+# 수량 일괄 증감
+#  - 바디: [ { "id": int, "delta": int, "warehouse_id"?: int }, ... ]
+#  - 항목마다 UPDATE 한 문장(inventory = inventory + delta), 같은 id는 요청 순서대로 누적
+#  - 대상 없음/수량 부족 항목은 건너뛰고 나머지는 한 트랜잭션으로 커밋
+# ----------------------------------------------------------
+_ADJUST_ERRORS = {"not_found": "존재하지 않음", "warehouse_not_found": "창고 없음", "insufficient": "수량 부족"}
+
+
+@router.post("/bulk/adjust", response_model=StockAdjustBulkResult)
+async def bulk_adjust_stocks(payload: List[StockAdjustItem], db: DbSession = Depends(get_db)):
+    _check_size(len(payload))
+
+    def work(db: Session):
+        results: List[StockAdjustItemResult] = []
+        try:
+            for i, p in enumerate(payload):
+                try:
+                    done = inventory.adjust(db, p.id, p.delta, p.warehouse_id)
+                except inventory.AdjustError as exc:
+                    error = _ADJUST_ERRORS[exc.reason]
+                    results.append(StockAdjustItemResult(index=i, id=p.id, ok=False, error=error))
+                    continue
+                results.append(StockAdjustItemResult(
+                    index=i, id=p.id, ok=True, inventory=done.row.inventory, warehouse_inventory=done.warehouse_inventory,
+                ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        ok = sum(1 for r in results if r.ok)
+        return StockAdjustBulkResult(succeeded=ok, failed=len(results) - ok, results=results)
+
+    return await run_db(db, work)
+
+
+# ----------------------------------------------------------
+# CSV 가져오기 (multipart 업로드)
+#  - 헤더: name,inventory,category(이름) 또는 category_id
+#  - 파싱이 CPU 위주라 모드와 무관하게 전용 동기 세션으로 스레드풀에서 실행
+#  - 반환: { inserted, failed, errors: [{line, error}], errors_truncated }
+# ----------------------------------------------------------
+@router.post("/import")
+async def import_stocks_csv(
+    file: UploadFile = File(..., description="재고 CSV 파일 (UTF-8)"),
+    chunk_size: Optional[int] = Query(None, ge=1, le=50000, description="한 번에 추가/커밋할 행 수"),
+) -> Dict[str, Any]:
+    def work() -> Dict[str, Any]:
+        text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        try:
+            with SessionLocal() as db:
+                return stock_import.import_csv(db, text, chunk_size=chunk_size)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"CSV 형식 오류: {exc}")
+        finally:
+            text.detach()
+
+    return await run_in_threadpool(work)
@@ -0,0 +1,83 @@
+# app/api/routes/stocks_feed.py
+# 라우터: 재고/카테고리 변경 피드 (/api/stocks/events, Server-Sent Events)
+# - 쓰기 경로가 남긴 StockEvents 를 id 순으로 흘려보냄 (app/services/change_feed.py)
+#   · 이벤트: {"id", "type": create|update|adjust|delete, "stock": {...}, "prev_category_id"?}
+#            {"id", "type": category_create|category_update|category_delete, "category": {...}}
+# - categoryId: 해당 카테고리 재고만 (카테고리를 옮긴 수정은 변경 전/후 둘 다에 전달)
+# - 재개: Last-Event-ID 헤더(EventSource 재접속 시 자동) 또는 last_event_id 파라미터, 없으면 지금 이후만
+#   · 요청 id 가 보존 범위보다 오래됐으면 {"type": "reset"} 을 보내고 최신부터 이어감 (클라이언트는 목록 재조회)
+# - 같은 워커의 커밋은 즉시, 다른 워커는 change_feed_poll_seconds 주기로 전달
+#   · 빈 id 뒤 이벤트는 늦은 커밋을 기다려 최대 change_feed_settle_seconds 보류 (change_feed.read)
+# - change_feed_max_stream_seconds 가 지나면 연결을 닫음 (retry 후 이어서 재접속, 워커 간 연결 분산)
+# - 조회마다 짧은 전용 세션 사용 (스트림 동안 커넥션을 붙잡지 않음)
+# - /api/stocks/{stock_id} 보다 먼저 등록해야 "events" 경로가 가로채이지 않음 (app/main.py)
+
+import time
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import get_settings
+from app.db.session import run_in_session
+from app.services import change_feed
+
+router = APIRouter(prefix="/api/stocks", tags=["stocks"])
+
+# EventSource 재접속 대기 (ms)
+RETRY_MS = 3000
+
+
+async def _event_stream(start_id: Optional[int], category_id: Optional[int]) -> AsyncIterator[str]:
+    settings = get_settings()
+    yield f"retry: {RETRY_MS}\n\n"
+    try:
+        lo, hi = await run_in_session(change_feed.bounds)
+    except SQLAlchemyError:
+        return
+
+    last_id = hi if start_id is None else start_id
+    if start_id is not None and lo and start_id < lo - 1:
+        # 요청 구간이 이미 정리됨 → 누락 가능성을 알리고 최신부터
+        last_id = hi
+        yield change_feed.format_sse({"id": hi, "type": "reset"})
+
+    started = last_sent = time.monotonic()
+    while time.monotonic() - started < settings.change_feed_max_stream_seconds:
+        waiter = change_feed.subscribe()
+        try:
+            try:
+                events, last_id, more = await run_in_session(
+                    change_feed.read, last_id, category_id, settings.change_feed_batch_size
+                )
+            except SQLAlchemyError:
+                return   # 클라이언트가 retry 후 Last-Event-ID 로 이어받음
+            for data in events:
+                yield change_feed.format_sse(data)
+            if events:
+                last_sent = time.monotonic()
+            if more:
+                continue
+            await change_feed.wait(waiter, settings.change_feed_poll_seconds)
+        finally:
+            change_feed.unsubscribe(waiter)
+
+        if time.monotonic() - last_sent >= settings.change_feed_heartbeat_seconds:
+            last_sent = time.monotonic()
+            yield ": keepalive\n\n"
+
+
+@router.get("/events")
+async def stock_events(
+    categoryId: Optional[int] = Query(None, description="카테고리 ID 필터"),
+    last_event_id: Optional[int] = Query(None, ge=0, description="이 id 이후부터 (Last-Event-ID 헤더 우선)"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    start_id = last_event_id
+    if last_event_id_header and last_event_id_header.strip().isdigit():
+        start_id = int(last_event_id_header)
+    return StreamingResponse(
+        _event_stream(start_id, categoryId),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,56 @@
+# app/api/routes/warehouses.py
+# 라우터: 창고 목록/생성/단건 조회
+# - 창고별 수량 조회/증감은 재고 API 의 warehouseId / warehouse_id 로 (app/api/routes/stocks.py)
+# - 창고 삭제는 제공하지 않음 (창고 행이 남은 창고는 FK RESTRICT)
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.session import DbSession, get_db, run_db
+from app.models.warehouse import Warehouse
+from app.schemas.warehouse import WarehouseCreate, WarehouseOut
+from app.services import locations
+
+router = APIRouter(prefix="/api/warehouses", tags=["warehouses"])
+
+
+# 목록 (창고 수는 적으므로 페이지네이션 없음)
+@router.get("", response_model=list[WarehouseOut], response_model_exclude_none=True)
+async def list_warehouses(db: DbSession = Depends(get_db)):
+    def work(db: Session):
+        return [{"id": r.id, "name": r.name} for r in db.execute(select(Warehouse.id, Warehouse.name).order_by(Warehouse.id))]
+
+    return await run_db(db, work)
+
+
+# 생성
+@router.post("", response_model=WarehouseOut, response_model_exclude_none=True, status_code=status.HTTP_201_CREATED)
+async def create_warehouse(payload: WarehouseCreate, db: DbSession = Depends(get_db)):
+    def work(db: Session):
+        name = payload.name.strip()
+        if not name:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="이름이 비어 있음")
+        if db.scalar(select(Warehouse.id).where(Warehouse.name == name)) is not None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 창고 이름임")
+        try:
+            obj = Warehouse(name=name)
+            db.add(obj)
+            db.commit()
+            return {"id": obj.id, "name": name}
+        except Exception:
+            db.rollback()
+            raise
+
+    return await run_db(db, work)
+
+
+# 단건 조회 (취급 품목 수는 창고 파티션 인덱스 범위 COUNT)
+@router.get("/{warehouse_id}", response_model=WarehouseOut)
+async def get_warehouse(warehouse_id: int, db: DbSession = Depends(get_db)):
+    def work(db: Session):
+        obj = db.get(Warehouse, warehouse_id)
+        if not obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="창고가 존재하지 않음")
+        return {"id": obj.id, "name": obj.name, "sku_count": locations.count(db, warehouse_id)}
+
+    return await run_db(db, work)
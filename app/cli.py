@@ -0,0 +1,114 @@
+# app/cli.py
+# 목적: 운영용 명령행 진입점
+# 사용: python -m app.cli <명령> [옵션]
+#   rebuild-search-index  물품명 n-gram 색인 전체 재구축
+#   rebuild-counts        (별칭 rebuild-rollups) 카테고리별 재고 카운터/보고서 집계(수량 합계, 품절·부족 수) 재계산
+#   rebuild-locations     창고별 수량 행/재고 합계 불변식 복구
+#   import-stocks         재고 CSV 가져오기 (스트리밍, 청크 단위 커밋)
+#   snapshot-inventory    재고별 잔량 스냅샷 추가 (cron 등으로 주기 실행)
+#   prune-change-feed     보존 시간이 지난 변경 피드 이벤트 삭제 (cron 등으로 주기 실행)
+
+import argparse
+import json
+import sys
+import time
+
+from app.db.session import SessionLocal
+
+
+def _cmd_rebuild_search_index(args: argparse.Namespace) -> int:
+    from app.services import search
+
+    with SessionLocal() as db:
+        total = search.rebuild_index(db, chunk_size=args.chunk_size)
+    print(f"OK: 검색 색인 재구축 완료 (재고 {total}건)")
+    return 0
+
+
+def _cmd_rebuild_counts(args: argparse.Namespace) -> int:
+    from app.services import counts
+
+    with SessionLocal() as db:
+        total = counts.rebuild(db)
+    print(f"OK: 재고 카운터/집계 재계산 완료 (카테고리 {total}개)")
+    return 0
+
+
+def _cmd_rebuild_locations(args: argparse.Namespace) -> int:
+    from app.services import locations
+
+    with SessionLocal() as db:
+        report = locations.rebuild(db)
+    print(f"OK: 창고별 수량 복구 완료 (배치 {report['placed']}건, 보정 {report['fixed']}건, 보정 불가 {report['unresolved']}건)")
+    return 0 if report["unresolved"] == 0 else 1
+
+
+def _cmd_import_stocks(args: argparse.Namespace) -> int:
+    from app.services import stock_import
+
+    started = time.perf_counter()
+    with open(args.path, encoding="utf-8-sig", newline="") as f, SessionLocal() as db:
+        report = stock_import.import_csv(db, f, chunk_size=args.chunk_size, max_errors=args.max_errors)
+    elapsed = time.perf_counter() - started
+
+    for err in report["errors"]:
+        print(f"{args.path}:{err['line']}: {err['error']}", file=sys.stderr)
+    rate = report["inserted"] / elapsed if elapsed > 0 else 0
+    print(json.dumps({**{k: v for k, v in report.items() if k != "errors"}, "seconds": round(elapsed, 3), "rows_per_sec": round(rate)}))
+    return 0 if report["failed"] == 0 else 1
+
+
+def _cmd_snapshot_inventory(args: argparse.Namespace) -> int:
+    from app.services import ledger
+
+    with SessionLocal() as db:
+        total = ledger.snapshot(db, settle_seconds=args.settle_seconds)
+    print(f"OK: 잔량 스냅샷 추가 완료 (재고 {total}건)")
+    return 0
+
+
+def _cmd_prune_change_feed(args: argparse.Namespace) -> int:
+    from app.core.config import get_settings
+    from app.services import change_feed
+
+    hours = args.hours if args.hours is not None else get_settings().change_feed_retention_hours
+    with SessionLocal() as db:
+        total = change_feed.prune(db, retention_hours=hours)
+    print(f"OK: 변경 피드 정리 완료 (이벤트 {total}건 삭제)")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="FastWMS 운영 명령")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("rebuild-search-index", help="물품명 n-gram 색인 재구축")
+    p.add_argument("--chunk-size", type=int, default=1000, help="한 번에 처리할 재고 수")
+    p.set_defaults(func=_cmd_rebuild_search_index)
+
+    p = sub.add_parser("rebuild-counts", aliases=["rebuild-rollups"], help="카테고리별 재고 카운터/보고서 집계 재계산")
+    p.set_defaults(func=_cmd_rebuild_counts)
+
+    p = sub.add_parser("rebuild-locations", help="창고별 수량 행/재고 합계 복구")
+    p.set_defaults(func=_cmd_rebuild_locations)
+
+    p = sub.add_parser("import-stocks", help="재고 CSV 가져오기")
+    p.add_argument("path", help="CSV 파일 경로 (헤더: name,inventory,category 또는 category_id)")
+    p.add_argument("--chunk-size", type=int, default=None, help="한 번에 추가/커밋할 행 수 (기본: BULK_CHUNK_SIZE)")
+    p.add_argument("--max-errors", type=int, default=1000, help="출력할 오류 줄 최대 개수")
+    p.set_defaults(func=_cmd_import_stocks)
+
+    p = sub.add_parser("snapshot-inventory", help="재고별 잔량 스냅샷 추가")
+    p.add_argument("--settle-seconds", type=int, default=60, help="이 시간(초) 이전 변동까지만 포함")
+    p.set_defaults(func=_cmd_snapshot_inventory)
+
+    p = sub.add_parser("prune-change-feed", help="오래된 변경 피드 이벤트 삭제")
+    p.add_argument("--hours", type=int, default=None, help="보존 시간 (기본: CHANGE_FEED_RETENTION_HOURS)")
+    p.set_defaults(func=_cmd_prune_change_feed)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,8 @@
 # app/core/config.py
 from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator
-from typing import Literal
+from pydantic import Field, field_validator
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -19,8 +19,69 @@ class Settings(BaseSettings):
     db_password: str = ""
     db_name: str = "fastwms"
     db_echo: bool = False                 # SQLAlchemy 쿼리 로깅 여부
-    db_pool_size: int = 10                # 기본 커넥션 풀 크기
+    sqlalchemy_database_url: Optional[str] = None  # 연결 URL (최우선)
+    database_url_env: Optional[str] = Field(None, alias="DATABASE_URL")  # 연결 URL (Alembic과 공용)
+    db_pool_size: int = 10                # 기본 커넥션 풀 크기 (워커 프로세스당)
+    db_max_overflow: int = 10             # 풀 크기 초과로 임시 허용할 연결 수
     db_pool_recycle: int = 1800           # 초 단위. 0은 재활용 안 함
+    db_pool_timeout: int = 30             # 풀 고갈 시 연결 대기 최대 시간(초)
+    db_pool_pre_ping: bool = True         # 체크아웃 시 연결 유효성 확인 (끊긴 연결 자동 교체)
+    db_async: bool = False                # True면 AsyncSession(aiosqlite/asyncmy)으로 라우터 실행
+
+    # SQLite 설정 (파일 SQLite 에만 적용, 메모리 DB/MySQL 은 무시)
+    sqlite_profile: Literal["default", "wal"] = "default"  # wal: WAL + pragma + 단일 쓰기 연결/읽기 전용 연결 풀 분리
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"  # wal 프로필 쓰기 연결의 fsync 수준
+    sqlite_busy_timeout_ms: int = 5000    # 잠금 대기 최대 시간(ms), 다른 프로세스의 쓰기와 겹칠 때
+    sqlite_cache_size_kib: int = 65536    # 연결당 페이지 캐시 크기(KiB)
+    sqlite_mmap_size_mb: int = 256        # 메모리 매핑 읽기 크기(MB), 0이면 사용 안 함
+    sqlite_reader_pool_size: int = 16     # 읽기 전용 연결 수 (워커 프로세스당, 동시 요청 수만큼이면 풀 대기 없음)
+
+    # 읽기 복제본 설정 (GET/HEAD 요청의 읽기만 복제본으로, app/db/replicas.py)
+    db_replica_urls: str = ""             # 쉼표 구분 복제본 URL 목록, 비우면 사용 안 함
+    db_replica_check_interval: float = 5.0    # 복제본 상태 확인 주기(초), 비정상 복제본도 이 주기로 재확인
+    db_read_your_writes_seconds: float = 5.0  # 쓰기 후 이 시간(초) 동안 같은 클라이언트(쿠키)의 읽기는 주 DB, 0이면 끔
+
+    # 검색 설정
+    search_ngram_enabled: bool = True     # 물품명 n-gram 색인 사용 여부 (False면 ILIKE 폴백)
+    count_keyword_limit: int = 1000       # 키워드 검색 총건수 상한 (초과 시 "1000+"), 0이면 정확히 셈
+
+    # 일괄 처리 설정
+    bulk_max_items: int = 50000           # 일괄 API 한 요청당 최대 항목 수
+    bulk_chunk_size: int = 1000           # executemany 한 번에 보내는 행 수
+    export_chunk_size: int = 2000         # 내보내기 시 서버 사이드 커서에서 한 번에 읽는 행 수
+
+    # 계측 설정
+    metrics_enabled: bool = True          # 요청 지연/SQL 집계 미들웨어 사용 여부 (/api/ops/metrics)
+    metrics_server_timing: bool = False   # 응답에 Server-Timing 헤더(app/db 시간, 쿼리 수) 추가 여부
+
+    # 캐시 설정
+    category_cache_size: int = 1024       # 카테고리 id/이름 캐시 최대 항목 수 (방향별)
+    category_cache_ttl: int = 300         # 카테고리 캐시 항목 유효 시간(초), 0이면 캐시 사용 안 함
+    stocks_page_cache_size: int = 256     # /stocks 렌더 결과 캐시 최대 항목 수
+    stocks_page_cache_ttl: float = 5.0    # 이 시간(초) 동안은 DB 확인 없이 캐시본 제공, 지나면 변경 카운터로 재검증 (0이면 캐시 사용 안 함)
+
+    # 수량 증감 묶음 커밋 설정 (POST /api/stocks/{id}/adjust)
+    inventory_group_commit: bool = False      # True면 증감을 큐에 모아 트랜잭션 하나로 반영 (요청별 커밋 대신)
+    inventory_group_commit_ms: float = 5.0    # 첫 요청 후 더 모으는 시간(ms), 클수록 처리량↑ 지연↑
+    inventory_group_commit_max_ops: int = 500 # 이 건수가 모이면 시간 전이라도 바로 반영
+
+    # 보고서 설정 (/api/reports, 카테고리 집계 app/services/counts.py)
+    low_stock_threshold: int = 10             # 수량이 1 이상 이 값 이하면 부족 재고 (바꾸면 rebuild-counts 로 집계 재계산)
+
+    # 창고 설정 (창고별 수량, app/services/locations.py)
+    default_warehouse_id: int = 1             # 창고 미지정 쓰기(생성/수정/일괄/미지정 증감)가 반영되는 창고
+
+    # 변경 피드 설정 (/api/stocks/events)
+    change_feed_poll_seconds: float = 2.0     # 다른 워커의 기록을 확인하는 주기(초), 같은 워커 기록은 커밋 즉시 전달
+    change_feed_heartbeat_seconds: float = 15.0   # 유휴 시 연결 유지용 주석 전송 간격(초)
+    change_feed_max_stream_seconds: float = 300.0  # 한 연결 최대 유지 시간(초), 지나면 닫고 클라이언트가 이어서 재접속
+    change_feed_batch_size: int = 500         # 한 번에 읽어 보내는 이벤트 수
+    change_feed_settle_seconds: float = 10.0  # 빈 id(커밋 전일 수 있는 작은 id) 뒤 이벤트를 보류하는 최대 시간(초), 이보다 긴 트랜잭션의 이벤트는 누락될 수 있음
+    change_feed_retention_hours: int = 24     # prune-change-feed 기본 보존 시간
+
+    # 장애 대응 설정
+    db_breaker_threshold: int = 5         # 연속 DB 오류 N회면 회로 차단 (0이면 차단 안 함)
+    db_breaker_cooldown: float = 10.0     # 차단 유지 시간(초), 지나면 시험 요청 1건만 허용
 
     # 구성: .env 자동 로드
     model_config = SettingsConfigDict(
@@ -30,6 +91,14 @@ class Settings(BaseSettings):
         extra="ignore",                   # 정의되지 않은 값은 무시
     )
 
+    @property
+    def database_url(self) -> str:
+        """
+        앱 엔진 연결 URL.
+        SQLALCHEMY_DATABASE_URL → DATABASE_URL → 로컬 SQLite 순으로 사용함.
+        """
+        return self.sqlalchemy_database_url or self.database_url_env or "sqlite:///./app.db"
+
     @property
     def sqlalchemy_database_uri(self) -> str:
         """
@@ -50,9 +119,9 @@ class Settings(BaseSettings):
         # 최소 1 보장함
         return max(1, v)
 
-    @field_validator("db_pool_recycle")
+    @field_validator("db_pool_recycle", "db_max_overflow", "db_pool_timeout")
     @classmethod
-    def _valid_pool_recycle(cls, v: int) -> int:
+    def _valid_pool_non_negative(cls, v: int) -> int:
         # 음수 방지함
         return max(0, v)
 
@@ -1,28 +1,8 @@
 # app/core/db.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+# 하위 호환용 별칭 (구 임포트 경로 유지)
+# - 엔진/세션은 app/db/session.py 하나만 사용함 (URL/풀 설정은 app/db/engine.py)
 
-# 로컬 개발용 SQLite 파일 경로 지정
-DATABASE_URL = "sqlite:///./app.db"
+from app.db.session import DATABASE_URL, SessionLocal, engine
+from app.db.session import get_session as get_db
 
-# SQLite 동시성 제약 해제용 옵션 포함
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
-
-# 세션 팩토리 구성
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
-
-# FastAPI 의존성 주입용 제너레이터
-# 요청마다 세션 열고 응답 후 닫음
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+__all__ = ["DATABASE_URL", "engine", "SessionLocal", "get_db"]
@@ -0,0 +1,270 @@
+# app/core/metrics.py
+# 목적: 요청 단위 성능 계측 (지연 히스토그램, DB 시간, 쿼리 수, 행 수)
+# - ASGI 미들웨어: 요청마다 컨텍스트 변수에 집계 객체를 두고, 라우트 템플릿(/api/stocks/{stock_id}) 기준으로 누적
+#   · 스레드풀(run_in_threadpool)과 AsyncSession.run_sync 모두 컨텍스트를 이어받으므로 같은 객체에 합산됨
+# - SQLAlchemy 엔진 이벤트(before/after_cursor_execute): 쿼리 수, DB 시간, DML 영향 행 수
+# - ORM load 이벤트: 조회로 적재된 엔티티 수 (N+1 관계 로딩 확인용)
+#   · 컬럼 튜플/Core 조회는 load 이벤트가 없으므로 해당 경로가 읽은 행 수를 add_rows 로 보탬 (목록/검색/내보내기/보고서)
+# - 출력: Prometheus 텍스트 형식(render_prometheus), 선택적으로 Server-Timing 응답 헤더
+#   · Server-Timing 은 응답 시작 시점 값 (스트리밍 본문을 읽는 내보내기의 행/쿼리는 라우트 누적에만 반영)
+# - 값은 워커 프로세스 단위 (스크레이프 대상도 워커별)
+# - 설정: METRICS_ENABLED, METRICS_SERVER_TIMING
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+# 지연 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 쿼리 수 히스토그램 버킷 상한 (N+1 탐지용)
+QUERY_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+# ----------------------------------------------------------
+# 요청 단위 집계
+# ----------------------------------------------------------
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+# ----------------------------------------------------------
+# 라우트별 누적
+# ----------------------------------------------------------
+class _Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class _RouteStats:
+    __slots__ = ("latency", "queries", "db_seconds", "rows", "statuses")
+
+    def __init__(self) -> None:
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.queries = _Histogram(QUERY_BUCKETS)
+        self.db_seconds = 0.0
+        self.rows = 0
+        self.statuses: Dict[str, int] = {}
+
+
+_lock = threading.Lock()
+_routes: Dict[Tuple[str, str], _RouteStats] = {}
+
+
+def _record(method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+    with _lock:
+        rs = _routes.get((method, route))
+        if rs is None:
+            rs = _routes[(method, route)] = _RouteStats()
+        rs.latency.observe(seconds)
+        rs.queries.observe(stats.queries)
+        rs.db_seconds += stats.db_seconds
+        rs.rows += stats.rows
+        code = f"{status // 100}xx"
+        rs.statuses[code] = rs.statuses.get(code, 0) + 1
+
+
+# ----------------------------------------------------------
+# SQLAlchemy 이벤트
+# ----------------------------------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    started = conn.info.get("metrics_started")
+    if started:
+        stats.db_seconds += time.perf_counter() - started.pop()
+    stats.queries += 1
+    # DML 영향 행 수 (SELECT 는 -1 이라 ORM load 이벤트로 셈)
+    if cursor.rowcount > 0 and statement.lstrip()[:6].upper() != "SELECT":
+        stats.rows += cursor.rowcount
+
+
+def _on_load(target, context):
+    stats = _current.get()
+    if stats is not None:
+        stats.rows += 1
+
+
+def add_rows(count: int) -> None:
+    """컬럼 튜플/Core 조회로 읽은 행 수 합산 (ORM load 이벤트로 세지 않는 경로에서 호출)"""
+    stats = _current.get()
+    if stats is not None:
+        stats.rows += count
+
+
+_installed = False
+
+
+def install_sqlalchemy_hooks() -> None:
+    """엔진/ORM 이벤트 등록 (모든 엔진 공통, 한 번만)"""
+    global _installed
+    if _installed:
+        return
+    from app.db.base import Base
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Base, "load", _on_load, propagate=True)
+    _installed = True
+
+
+# ----------------------------------------------------------
+# ASGI 미들웨어
+# ----------------------------------------------------------
+class MetricsMiddleware:
+    """요청 지연/DB 집계 + 선택적 Server-Timing 헤더 (순수 ASGI, 응답 본문은 건드리지 않음)"""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.server_timing = get_settings().metrics_server_timing
+        self._route_paths: Dict[Any, str] = {}
+
+    def _route_of(self, scope) -> str:
+        # 경로 매개변수로 라벨이 늘지 않도록 라우트 템플릿 사용
+        route = scope.get("route")
+        if route is not None and getattr(route, "path", None):
+            return route.path
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            for r in scope["app"].routes:
+                if getattr(r, "endpoint", None) is endpoint:
+                    path = r.path
+                    break
+            path = self._route_paths[endpoint] = path or "unmatched"
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    value = (
+                        f'app;dur={elapsed:.1f}, '
+                        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries, {stats.rows} rows"'
+                    )
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [(b"server-timing", value.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            _record(scope["method"], self._route_of(scope), status, time.perf_counter() - started, stats)
+
+
+def install(app) -> None:
+    """FastAPI 앱에 계측 장착 (METRICS_ENABLED=false 면 아무것도 하지 않음)"""
+    if not get_settings().metrics_enabled:
+        return
+    install_sqlalchemy_hooks()
+    app.add_middleware(MetricsMiddleware)
+
+
+# ----------------------------------------------------------
+# Prometheus 텍스트 출력
+# ----------------------------------------------------------
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt(v: float) -> str:
+    return "+Inf" if v == float("inf") else repr(float(v))
+
+
+def _histogram_lines(name: str, labels: str, h: _Histogram) -> List[str]:
+    lines: List[str] = []
+    cumulative = 0
+    for bound, n in zip(list(h.buckets) + [float("inf")], h.counts):
+        cumulative += n
+        lines.append(f'{name}_bucket{{{labels},le="{_fmt(bound)}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {h.total}")
+    lines.append(f"{name}_count{{{labels}}} {h.count}")
+    return lines
+
+
+def render_prometheus(extra: Optional[List[str]] = None) -> str:
+    """누적 지표를 Prometheus 텍스트 노출 형식으로 변환"""
+    with _lock:
+        items = sorted(_routes.items())
+        lines: List[str] = [
+            "# HELP http_request_duration_seconds 요청 처리 시간",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), rs in items:
+            lines += _histogram_lines("http_request_duration_seconds", f'method="{method}",route="{_label(route)}"', rs.latency)
+
+        lines += [
+            "# HELP http_request_db_queries 요청당 SQL 실행 수",
+            "# TYPE http_request_db_queries histogram",
+        ]
+        for (method, route), rs in items:
+            lines += _histogram_lines("http_request_db_queries", f'method="{method}",route="{_label(route)}"', rs.queries)
+
+        lines += [
+            "# HELP http_requests_total 응답 상태 분류별 요청 수",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), rs in items:
+            for code, n in sorted(rs.statuses.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{_label(route)}",status="{code}"}} {n}')
+
+        lines += [
+            "# HELP http_request_db_seconds_total 요청 처리 중 SQL 실행 시간 합계",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, route), rs in items:
+            lines.append(f'http_request_db_seconds_total{{method="{method}",route="{_label(route)}"}} {rs.db_seconds}')
+
+        lines += [
+            "# HELP http_request_db_rows_total 조회 행(ORM 적재 + 컬럼/Core 조회) + DML 영향 행 합계",
+            "# TYPE http_request_db_rows_total counter",
+        ]
+        for (method, route), rs in items:
+            lines.append(f'http_request_db_rows_total{{method="{method}",route="{_label(route)}"}} {rs.rows}')
+
+    if extra:
+        lines += extra
+    return "\n".join(lines) + "\n"
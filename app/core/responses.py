@@ -0,0 +1,36 @@
+# app/core/responses.py
+# 목적: 빠른 JSON 응답 (목록/검색처럼 항목이 많은 응답용)
+# - orjson 설치 시 orjson.dumps 로 바로 bytes 직렬화, 없으면 표준 json 폴백 (선택 의존성)
+# - 핸들러가 이 응답을 직접 반환하면 FastAPI 의 jsonable_encoder 순회를 건너뜀
+#   → 값은 이미 JSON 기본 타입(dict/list/str/int/None)이어야 함
+# - Response 파라미터에 설정한 헤더(ETag, X-Total-Count 등)는 직접 반환 시 버려지므로 json_response 로 옮겨 담음
+
+import json
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 우선 JSON 응답 (없으면 JSONResponse 와 같은 출력)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(content: Any, response: Optional[Response] = None, status_code: int = 200) -> FastJSONResponse:
+    """FastJSONResponse 생성 + 주입받은 Response 의 헤더 이어받기"""
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
@@ -1,25 +1,7 @@
 # app/database.py
-# 목적: 동기 SQLAlchemy 세션 팩토리 + FastAPI 의존성 제공
+# 목적: 하위 호환용 별칭 (구 임포트 경로 유지)
+# - 엔진/세션은 app/db/session.py 하나만 사용함 (URL/풀 설정은 app/db/engine.py)
 
-import os
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from app.db.session import DATABASE_URL, SessionLocal, engine, get_session
 
-# Alembic/alembic.ini 의 sqlalchemy.url 과 맞추는 게 중요함
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./fastwms.db")
-
-# SQLite일 때만 check_same_thread 옵션 필요
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-)
-
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
-
-def get_session() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+__all__ = ["DATABASE_URL", "engine", "SessionLocal", "get_session"]
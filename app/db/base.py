@@ -20,4 +20,4 @@ class Base(DeclarativeBase):
 
 # ⚠️ 주의: 아래 임포트는 나중에 모델 파일 생성 후 활성화할 것
 # Alembic autogenerate가 테이블을 감지하려면 Base를 참조하는 모델들이 임포트되어 있어야 함
-from app.models import category, stock # Alembic 인식용
\ No newline at end of file
+from app.models import category, stock, stock_name_gram, category_stat, stock_movement, stock_snapshot, table_version, stock_event, warehouse, stock_location # Alembic 인식용
\ No newline at end of file
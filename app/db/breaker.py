@@ -0,0 +1,82 @@
+# app/db/breaker.py
+# 목적: DB 회로 차단기 (장애 중인 DB에 요청을 계속 보내지 않기)
+# - closed: 정상. 연속 실패가 db_breaker_threshold 에 닿으면 open
+# - open: db_breaker_cooldown 동안 DB 호출 거부 (호출 측이 캐시본/폴백으로 응답)
+# - half_open: 대기 후 시험 요청 1건만 통과, 성공하면 closed, 실패하면 다시 open
+#   (시험 요청이 보고 없이 끝나도 대기 시간이 지나면 다음 시험 허용)
+# - 값은 워커 프로세스 단위
+
+import threading
+import time
+from typing import Any, Dict
+
+from app.core.config import get_settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 회로 차단기 (스레드 안전)"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self.opened_total = 0
+        self.rejected_total = 0
+
+    def allow(self) -> bool:
+        """DB 호출 가능 여부 (True 를 받은 호출은 success/failure 중 하나를 반드시 보고)"""
+        settings = get_settings()
+        if settings.db_breaker_threshold <= 0:
+            return True
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            now = time.monotonic()
+            # open 대기가 끝났거나, 시험 요청이 결과 보고 없이 대기 시간을 넘긴 경우(취소 등) 시험 1건 허용
+            if now - self._opened_at >= settings.db_breaker_cooldown:
+                self._state = HALF_OPEN
+                self._opened_at = now
+                return True
+            self.rejected_total += 1
+            return False
+
+    def success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def failure(self) -> None:
+        threshold = get_settings().db_breaker_threshold
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (threshold > 0 and self._failures >= threshold):
+                if self._state != OPEN:
+                    self.opened_total += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def stats(self) -> Dict[str, Any]:
+        settings = get_settings()
+        return {
+            "name": self.name,
+            "state": self._state,
+            "consecutive_failures": self._failures,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+            "threshold": settings.db_breaker_threshold,
+            "cooldown_seconds": settings.db_breaker_cooldown,
+        }
+
+
+# 기본 DB 차단기 (현재 /stocks 화면이 사용)
+db_breaker = CircuitBreaker("db")
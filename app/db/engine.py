@@ -0,0 +1,230 @@
+# app/db/engine.py
+# 목적: SQLAlchemy 엔진 단일 생성 지점 (동기/비동기 공용)
+# - 연결 URL과 풀 옵션은 모두 get_settings() 에서 읽음 (.env / 환경변수로 환경별 조정)
+#   · DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_TIMEOUT, DB_POOL_PRE_PING
+# - 메모리 SQLite 는 연결 하나를 공유해야 하므로 풀 옵션 없이 StaticPool 사용
+# - 다중 워커: fork 직후 자식 프로세스는 부모에게 물려받은 연결을 버리고 새 풀로 시작
+#   (gunicorn --preload 등에서 소켓 공유 방지, uvicorn --workers 는 프로세스마다 새로 임포트)
+# - 풀 대기 시간 계측: 체크아웃 대기(_do_get)를 감싼 풀 클래스로 누적 (pool_stats)
+# - SQLite wal 프로필(SQLITE_PROFILE=wal): 연결 생성 훅으로 pragma 적용, 역할별 엔진
+#   · writer: 연결 1개 풀 (프로세스 안 쓰기 직렬화, 잠금 경합 대신 풀 대기), WAL + synchronous
+#   · reader: 읽기 전용(query_only) 연결 풀, WAL 이라 쓰기 중에도 마지막 커밋 기준으로 읽음
+#   · 공통: busy_timeout, cache_size, mmap_size
+#   · 세션 라우팅은 app/db/routing.py
+
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.core.config import get_settings
+
+
+# ----------------------------------------------------------
+# 풀 대기 계측
+# ----------------------------------------------------------
+class _WaitStats:
+    """체크아웃 대기 시간 누적 (스레드 안전)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+class _TimedPoolMixin:
+    """QueuePool 계열의 체크아웃 대기 시간을 기록함"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = _WaitStats()
+
+    def recreate(self):
+        # dispose/재생성 후에도 누적값 유지
+        new = super().recreate()
+        new.wait_stats = self.wait_stats
+        return new
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except Exception as exc:
+            timed_out = type(exc).__name__ == "TimeoutError"
+            raise
+        finally:
+            self.wait_stats.record(time.perf_counter() - started, timed_out)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+# 생성된 엔진 목록 (pool_stats 용, 이름 → 동기 Engine)
+_engines: "weakref.WeakValueDictionary[str, Engine]" = weakref.WeakValueDictionary()
+
+
+# ----------------------------------------------------------
+# URL / 옵션
+# ----------------------------------------------------------
+def database_url() -> str:
+    """연결 URL (SQLALCHEMY_DATABASE_URL → DATABASE_URL → 로컬 SQLite)"""
+    return get_settings().database_url
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def sqlite_profile_enabled(url_str: str) -> bool:
+    """파일 SQLite + wal 프로필이면 True (쓰기/읽기 엔진 분리 대상)"""
+    url = make_url(url_str)
+    return (
+        get_settings().sqlite_profile == "wal"
+        and url.get_backend_name() == "sqlite"
+        and not _is_memory_sqlite(url)
+    )
+
+
+def engine_options(url_str: str, async_: bool = False, role: Optional[str] = None) -> Dict[str, Any]:
+    """URL 종류와 설정에 맞는 create_engine 인자 (role: None | "writer" | "reader")"""
+    settings = get_settings()
+    url = make_url(url_str)
+    options: Dict[str, Any] = {"echo": settings.db_echo}
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_memory_sqlite(url):
+            options["poolclass"] = StaticPool
+            return options
+
+    options.update(
+        poolclass=TimedAsyncQueuePool if async_ else TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle or -1,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    if role == "writer":
+        options.update(pool_size=1, max_overflow=0)
+    elif role == "reader":
+        options.update(pool_size=settings.sqlite_reader_pool_size, max_overflow=0)
+    return options
+
+
+def _install_sqlite_profile(engine: Engine, role: str) -> None:
+    """연결 생성 시 wal 프로필 pragma 적용 (engine 은 동기 Engine, 비동기는 sync_engine)"""
+    settings = get_settings()
+    pragmas = [
+        f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size = -{int(settings.sqlite_cache_size_kib)}",
+        f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size_mb) * 1024 * 1024}",
+    ]
+    if role == "writer":
+        # journal_mode 는 파일에 남으므로 쓰기 연결에서 한 번 바꾸면 읽기 연결도 WAL 로 열림
+        pragmas += ["PRAGMA journal_mode = WAL", f"PRAGMA synchronous = {settings.sqlite_synchronous}"]
+    else:
+        pragmas.append("PRAGMA query_only = ON")
+
+    @event.listens_for(engine, "connect")
+    def _apply(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for sql in pragmas:
+                cursor.execute(sql)
+        finally:
+            cursor.close()
+
+
+def _dispose_in_child(engine: Engine) -> None:
+    """fork 된 자식에서 부모 연결을 닫지 않고 버림 (부모 쪽 연결은 계속 유효)"""
+    if hasattr(os, "register_at_fork"):
+        ref = weakref.ref(engine)
+
+        def reset() -> None:
+            e = ref()
+            if e is not None:
+                e.dispose(close=False)
+
+        os.register_at_fork(after_in_child=reset)
+
+
+# ----------------------------------------------------------
+# 엔진 생성
+# ----------------------------------------------------------
+def create_app_engine(url: Optional[str] = None, name: str = "default", role: Optional[str] = None) -> Engine:
+    """동기 엔진 생성 (role 지정 시 SQLite wal 프로필의 writer/reader 엔진)"""
+    url = url or database_url()
+    engine = create_engine(url, **engine_options(url, role=role))
+    if role is not None:
+        _install_sqlite_profile(engine, role)
+    _dispose_in_child(engine)
+    _engines[name] = engine
+    return engine
+
+
+def create_app_async_engine(url: str, name: str = "async", role: Optional[str] = None):
+    """비동기 엔진 생성 (url 은 async 드라이버 URL)"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(url, **engine_options(url, async_=True, role=role))
+    if role is not None:
+        _install_sqlite_profile(engine.sync_engine, role)
+    _dispose_in_child(engine.sync_engine)
+    _engines[name] = engine.sync_engine
+    return engine
+
+
+# ----------------------------------------------------------
+# 풀 통계
+# ----------------------------------------------------------
+def pool_stats() -> List[Dict[str, Any]]:
+    """엔진별 풀 상태 (체크아웃 중, 오버플로, 대기 시간 누적)"""
+    settings = get_settings()
+    result: List[Dict[str, Any]] = []
+    for name, engine in sorted(_engines.items()):
+        pool = engine.pool
+        item: Dict[str, Any] = {"engine": name, "pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            item.update(
+                size=pool.size(),
+                max_overflow=settings.db_max_overflow,
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(0, pool.overflow()),
+                timeout_s=pool.timeout(),
+            )
+        stats = getattr(pool, "wait_stats", None)
+        if stats is not None:
+            item.update(stats.snapshot())
+        result.append(item)
+    return result
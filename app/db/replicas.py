@@ -0,0 +1,194 @@
+# app/db/replicas.py
+# 목적: 읽기 복제본 라우팅 (설정 DB_REPLICA_URLS, 쉼표 구분)
+# - GET/HEAD 요청의 읽기 문장만 복제본으로 (쓰기 요청은 읽기까지 전부 주 DB, 복제 지연으로 판단이 어긋나지 않게)
+#   · 요청 종류는 미들웨어가 컨텍스트 변수로 표시 → 세션(app/db/routing.py)이 문장마다 확인
+#   · 요청 밖(CLI, 백그라운드 작업)은 주 DB
+# - 자기 쓰기 읽기(read-your-writes): 쓰기 성공 응답에 시각 쿠키를 붙이고,
+#   db_read_your_writes_seconds 안에 같은 클라이언트가 보낸 읽기는 주 DB
+# - 복제본 선택: 정상인 것 중 라운드로빈, 한 세션(트랜잭션)은 처음 고른 복제본을 계속 사용 (문장 간 시점 일치)
+# - 상태 확인: 고를 때 db_replica_check_interval 이 지났으면 가벼운 조회 한 번 (실패한 복제본도 같은 주기로 재확인)
+#   · 사용 중 연결 오류가 나면 바로 비정상 처리 (다음 요청부터 제외)
+#   · 정상 복제본이 없으면 주 DB 로 읽음
+# - 로컬 확인: 주 DB 와 복제본으로 SQLite 파일 두 개 (복제본은 파일 복사/.backup 으로 갱신)
+
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine, make_url
+
+from app.core.config import get_settings
+
+# 쓰기 시각 쿠키 이름
+RYW_COOKIE = "fastwms_last_write"
+
+_SAFE_METHODS = ("GET", "HEAD")
+
+# 현재 요청이 주 DB 로 읽어야 하는지 (요청 밖 기본값은 주 DB)
+_primary: ContextVar[bool] = ContextVar("db_read_primary", default=True)
+
+
+def primary_required() -> bool:
+    return _primary.get()
+
+
+def replica_urls() -> List[str]:
+    return [u.strip() for u in get_settings().db_replica_urls.split(",") if u.strip()]
+
+
+def replica_role(url: str) -> Optional[str]:
+    """파일 SQLite 복제본은 읽기 전용 연결(query_only)로 엶 (app/db/engine.py)"""
+    u = make_url(url)
+    return "reader" if u.get_backend_name() == "sqlite" and u.database not in (None, "", ":memory:") else None
+
+
+# ----------------------------------------------------------
+# 복제본 목록 + 상태
+# ----------------------------------------------------------
+class Replica:
+    def __init__(self, name: str, engine: Engine) -> None:
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.checked_at = 0.0
+        self.checking = False
+        self.picked = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+
+class ReplicaSet:
+    """정상 복제본 라운드로빈 + 주기적 상태 확인 (스레드 안전)"""
+
+    def __init__(self, replicas: List[Replica]) -> None:
+        self.replicas = replicas
+        self._lock = threading.Lock()
+        self._rr = itertools.count()
+        self.primary_fallbacks = 0
+        for r in replicas:
+            self._watch_errors(r)
+
+    def pick(self) -> Optional[Engine]:
+        """다음 정상 복제본 엔진 (없으면 None → 주 DB)"""
+        start = next(self._rr)
+        n = len(self.replicas)
+        for i in range(n):
+            r = self.replicas[(start + i) % n]
+            self._maybe_check(r)
+            if r.healthy:
+                r.picked += 1
+                return r.engine
+        self.primary_fallbacks += 1
+        return None
+
+    def _maybe_check(self, r: Replica) -> None:
+        # 주기가 지났으면 한 스레드만 확인, 나머지는 직전 상태 사용
+        with self._lock:
+            due = time.monotonic() - r.checked_at >= get_settings().db_replica_check_interval
+            if not due or r.checking:
+                return
+            r.checking = True
+        try:
+            self.check(r)
+        finally:
+            r.checking = False
+
+    def check(self, r: Replica) -> bool:
+        """연결 + 스키마 확인 조회 한 번 (결과를 상태에 반영)"""
+        from app.models.table_version import TableVersion
+
+        try:
+            with r.engine.connect() as conn:
+                conn.execute(select(TableVersion.table_name).limit(1)).all()
+            self._mark(r, None)
+        except Exception as exc:
+            self._mark(r, exc)
+        return r.healthy
+
+    def _mark(self, r: Replica, error: Optional[BaseException]) -> None:
+        with self._lock:
+            r.checked_at = time.monotonic()
+            r.healthy = error is None
+            if error is not None:
+                r.failures += 1
+                r.last_error = f"{type(error).__name__}: {error}"[:200]
+
+    def _watch_errors(self, r: Replica) -> None:
+        # 사용 중 연결 끊김/운영 오류는 다음 확인 주기를 기다리지 않고 제외
+        @event.listens_for(r.engine, "handle_error")
+        def _on_error(ctx) -> None:
+            if ctx.is_disconnect or type(ctx.original_exception).__name__ == "OperationalError":
+                self._mark(r, ctx.original_exception)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "replicas": [
+                {
+                    "name": r.name,
+                    "healthy": r.healthy,
+                    "picked": r.picked,
+                    "failures": r.failures,
+                    "last_error": r.last_error,
+                    "checked_ago_s": round(now - r.checked_at, 1) if r.checked_at else None,
+                }
+                for r in self.replicas
+            ],
+            "primary_fallbacks": self.primary_fallbacks,
+            "read_your_writes_seconds": get_settings().db_read_your_writes_seconds,
+        }
+
+
+# ----------------------------------------------------------
+# ASGI 미들웨어 (요청 종류 표시 + 쓰기 시각 쿠키)
+# ----------------------------------------------------------
+def _recent_write(scope) -> bool:
+    window = get_settings().db_read_your_writes_seconds
+    if window <= 0:
+        return False
+    for key, value in scope.get("headers", ()):
+        if key == b"cookie":
+            morsel = SimpleCookie(value.decode("latin-1")).get(RYW_COOKIE)
+            if morsel is not None:
+                try:
+                    return time.time() - float(morsel.value) < window
+                except ValueError:
+                    return False
+    return False
+
+
+class ReplicaRoutingMiddleware:
+    """GET/HEAD 는 복제본 허용 (최근 쓰기 쿠키가 있으면 주 DB), 그 외는 주 DB + 성공 시 쿠키 갱신"""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        safe = scope["method"] in _SAFE_METHODS
+        token = _primary.set(not safe or _recent_write(scope))
+        window = get_settings().db_read_your_writes_seconds
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and not safe and message["status"] < 400 and window > 0:
+                cookie = f"{RYW_COOKIE}={time.time():.3f}; Max-Age={int(window) + 1}; Path=/; HttpOnly; SameSite=Lax"
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _primary.reset(token)
+
+
+def install(app) -> None:
+    """복제본이 설정된 경우에만 미들웨어 장착"""
+    if replica_urls():
+        app.add_middleware(ReplicaRoutingMiddleware)
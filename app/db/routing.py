@@ -0,0 +1,65 @@
+# app/db/routing.py
+# 목적: 쓰기/읽기 엔진을 나눠 쓰는 세션 (SQLite wal 프로필, app/db/engine.py)
+# - 쓰기로 보는 것: flush, INSERT/UPDATE/DELETE, text() 문장, FOR UPDATE, 문장 없이 연결 요청(db.connection(), get_bind())
+#   → writer 엔진 (연결 1개, 프로세스 안 쓰기 직렬화)
+# - 그 외 SELECT → reader 엔진 (읽기 전용 연결 풀)
+#   · 복제본이 설정돼 있고 GET/HEAD 요청이면 복제본 (app/db/replicas.py), 한 트랜잭션은 같은 복제본
+# - 트랜잭션 안에서 한 번 writer 를 쓰면 그 트랜잭션이 끝날 때까지 읽기도 writer
+#   (자기 쓰기가 보여야 하는 흐름: flush 후 refresh, 잠금 UPDATE 후 SELECT 등)
+# - 쓰기 전 읽기는 reader 에서 하므로 writer 점유 시간이 짧음 (조건부 UPDATE 는 app/services/row_version.py)
+# - 라우터/서비스 코드는 그대로 (get_db/run_db 가 이 세션을 줌)
+# - wal 프로필이 아니면 writer/reader 가 같은 엔진 (복제본 분리만 사용)
+
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql.elements import TextClause
+
+from app.db import replicas as replica_routing
+
+
+def is_write(clause: Any) -> bool:
+    """문장이 쓰기(또는 쓰기 연결이 필요한 것)인지"""
+    if clause is None:
+        return True
+    if getattr(clause, "is_dml", False) or isinstance(clause, TextClause):
+        return True
+    return getattr(clause, "_for_update_arg", None) is not None
+
+
+class RoutingSession(Session):
+    """writer/reader(/복제본) 엔진 라우팅 세션 (sessionmaker(class_=RoutingSession, writer=..., reader=...))"""
+
+    def __init__(
+        self,
+        writer: Engine,
+        reader: Engine,
+        replicas: Optional["replica_routing.ReplicaSet"] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.writer = writer
+        self.reader = reader
+        self.replicas = replicas
+        self._use_writer = False
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper: Optional[Any] = None, clause: Optional[Any] = None, **kwargs: Any) -> Engine:
+        if self._use_writer or self._flushing or is_write(clause):
+            # 트랜잭션 시작(autobegin)은 get_bind 다음이라 여기서 바로 고정, 해제는 트랜잭션 종료 시
+            self._use_writer = True
+            return self.writer
+        if self.replicas is not None and not replica_routing.primary_required():
+            if self._replica is None:
+                self._replica = self.replicas.pick() or self.reader
+            return self._replica
+        return self.reader
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session: RoutingSession, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session._use_writer = False
+        session._replica = None
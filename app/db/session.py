@@ -1,31 +1,65 @@
 # app/db/session.py
-# 목적: 동기 SQLAlchemy 세션 + FastAPI 의존성 제공 (단일 진실 원천)
+# 목적: 동기/비동기 SQLAlchemy 세션 + FastAPI 의존성 제공 (단일 진실 원천)
+# - 기본은 동기 Session (스레드풀에서 실행)
+# - DB_ASYNC=true 이면 AsyncSession(aiosqlite/asyncmy) 사용
+# - 라우터는 get_db + run_db 조합만 쓰면 두 모드 모두 동일 코드로 동작함
+# - 엔진은 app/db/engine.py 팩토리로만 생성 (URL/풀 옵션은 설정에서 읽음)
+# - SQLITE_PROFILE=wal (파일 SQLite) 이면 쓰기 엔진(engine, 연결 1개) + 읽기 전용 엔진(read_engine)을 만들고
+#   세션이 문장 종류로 골라 씀 (app/db/routing.py), 아니면 엔진 하나
+# - DB_REPLICA_URLS 가 있으면 GET/HEAD 요청의 읽기는 복제본으로 (app/db/replicas.py, 같은 라우팅 세션)
 
-import os
-from typing import Generator
-from sqlalchemy import create_engine
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Generator, TypeVar
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
+from starlette.concurrency import run_in_threadpool
 from dotenv import load_dotenv  # ← 추가: .env 로드용
 
+from app.core.config import get_settings
+from app.db.engine import create_app_async_engine, create_app_engine, database_url, sqlite_profile_enabled
+from app.db.replicas import Replica, ReplicaSet, replica_role, replica_urls
+from app.db.routing import RoutingSession
+
+# 타입체커 전용 임포트
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 # .env 파일 로드
 load_dotenv()
 
-# .env에 정의된 연결 문자열 우선 사용
-DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URL")
+# 연결 문자열: SQLALCHEMY_DATABASE_URL → DATABASE_URL → SQLite 폴백 (Settings.database_url)
+DATABASE_URL = database_url()
+
+# 쓰기/읽기 엔진 분리 여부 (SQLite wal 프로필)
+SPLIT_READS = sqlite_profile_enabled(DATABASE_URL)
 
-# 백업: 환경변수에 없다면 SQLite로 폴백
-if not DATABASE_URL:
-    DATABASE_URL = "sqlite:///./app.db"
+# 읽기 복제본 URL 목록 (비어 있으면 복제본 라우팅 없음)
+REPLICA_URLS = replica_urls()
 
-# 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
-    pool_pre_ping=True,    # MariaDB 등 연결 유효성 체크용
+# 엔진 생성 (풀 크기/오버플로/재활용/타임아웃/pre-ping 은 설정값 적용)
+engine = create_app_engine(DATABASE_URL, role="writer" if SPLIT_READS else None)
+read_engine = create_app_engine(DATABASE_URL, name="reader", role="reader") if SPLIT_READS else engine
+
+# 복제본 엔진 (동기)
+replica_set = (
+    ReplicaSet([
+        Replica(f"replica{i}", create_app_engine(url, name=f"replica{i}", role=replica_role(url)))
+        for i, url in enumerate(REPLICA_URLS, 1)
+    ])
+    if REPLICA_URLS else None
 )
 
 # 세션팩토리
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+if SPLIT_READS or replica_set is not None:
+    SessionLocal = sessionmaker(
+        class_=RoutingSession,
+        writer=engine,
+        reader=read_engine,
+        replicas=replica_set,
+        autocommit=False,
+        autoflush=False,
+    )
+else:
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 # FastAPI 의존성 주입용 세션 생성기
 def get_session() -> Generator[Session, None, None]:
@@ -34,3 +68,97 @@ def get_session() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# ----------------------------------------------------------
+# 비동기 스택 (설정으로 선택)
+# ----------------------------------------------------------
+def _async_url_from_any(url_str: str) -> str:
+    """
+    동기 URL을 async 드라이버 URL로 변환함. (alembic/env.py 의 역방향)
+    sqlite -> sqlite+aiosqlite, mysql(+pymysql) -> mysql+asyncmy
+    """
+    url = make_url(url_str)
+    if url.get_backend_name() == "sqlite" and url.get_dialect().driver != "aiosqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    if url.get_backend_name() == "mysql" and url.get_dialect().driver != "asyncmy":
+        url = url.set(drivername="mysql+asyncmy")
+    return url.render_as_string(hide_password=False)
+
+
+USE_ASYNC = get_settings().db_async
+
+async_engine = None
+async_read_engine = None
+async_replica_set = None
+AsyncSessionLocal = None
+
+if USE_ASYNC:
+    # greenlet/async 드라이버가 필요하므로 비동기 모드일 때만 임포트함
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    ASYNC_DATABASE_URL = _async_url_from_any(DATABASE_URL)
+    async_engine = create_app_async_engine(ASYNC_DATABASE_URL, role="writer" if SPLIT_READS else None)
+    async_read_engine = (
+        create_app_async_engine(ASYNC_DATABASE_URL, name="async-reader", role="reader") if SPLIT_READS else async_engine
+    )
+    if REPLICA_URLS:
+        async_replica_set = ReplicaSet([
+            Replica(
+                f"async-replica{i}",
+                create_app_async_engine(_async_url_from_any(url), name=f"async-replica{i}", role=replica_role(url)).sync_engine,
+            )
+            for i, url in enumerate(REPLICA_URLS, 1)
+        ])
+    if SPLIT_READS or async_replica_set is not None:
+        # AsyncSession 도 내부 동기 세션의 get_bind 로 라우팅 (엔진은 sync_engine 으로 전달)
+        AsyncSessionLocal = async_sessionmaker(
+            sync_session_class=RoutingSession,
+            writer=async_engine.sync_engine,
+            reader=async_read_engine.sync_engine,
+            replicas=async_replica_set,
+            autoflush=False,
+        )
+    else:
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+
+
+# FastAPI 의존성 주입용 비동기 세션 생성기
+async def get_async_session() -> AsyncGenerator["AsyncSession", None]:
+    if AsyncSessionLocal is None:
+        raise RuntimeError("DB_ASYNC 비활성 상태임 (비동기 엔진 없음)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 라우터가 사용하는 의존성: 설정에 따라 동기/비동기 세션 주입함
+get_db = get_async_session if USE_ASYNC else get_session
+
+# 라우터 시그니처용 타입 별칭 (Session 또는 AsyncSession)
+DbSession = Any
+
+
+T = TypeVar("T")
+
+
+async def run_db(db: Any, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    동기 ORM 코드 fn(session, ...)을 현재 모드에 맞게 실행함.
+    - AsyncSession: run_sync로 이벤트 루프에서 실행 (스레드풀 점유 없음)
+    - Session: 스레드풀에서 실행 (기존 def 핸들러와 동일한 비용)
+    """
+    if hasattr(db, "run_sync"):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+async def run_in_session(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    요청 세션 밖(스트림, 백그라운드 작업)에서 전용 세션을 열어 fn(session, ...) 실행 후 닫음.
+    커밋은 fn 책임.
+    """
+    if USE_ASYNC:
+        async with AsyncSessionLocal() as db:
+            return await run_db(db, fn, *args, **kwargs)
+    with SessionLocal() as db:
+        return await run_db(db, fn, *args, **kwargs)
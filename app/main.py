@@ -7,7 +7,14 @@ from fastapi.templating import Jinja2Templates            # Jinja2 템플릿 엔
 import pathlib                                            # 경로 계산용
 
 from app.api.routes import stocks   # 새로 추가
+from app.api.routes import stocks_bulk
+from app.api.routes import stocks_feed
 from app.api.routes import categories
+from app.api.routes import warehouses
+from app.api.routes import reports
+from app.api.routes import ops
+from app.core import metrics
+from app.db import replicas
 
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -18,9 +25,21 @@ import os
 # 앱 생성
 app = FastAPI()
 
+# 요청 지연/SQL 계측 미들웨어 (설정 METRICS_ENABLED, METRICS_SERVER_TIMING)
+metrics.install(app)
+
+# 읽기 복제본 라우팅 미들웨어 (설정 DB_REPLICA_URLS 가 있을 때만)
+replicas.install(app)
+
 # 라우터 등록
+# - stocks_bulk, stocks_feed는 /api/stocks/{stock_id} 보다 먼저 매칭되도록 앞에 등록함
+app.include_router(stocks_bulk.router)
+app.include_router(stocks_feed.router)
 app.include_router(stocks.router)
 app.include_router(categories.router)
+app.include_router(warehouses.router)
+app.include_router(reports.router)
+app.include_router(ops.router)
 
 # --- ADD: 경로 기준 설정 (app 디렉터리 기준으로 고정) ---
 BASE_DIR = pathlib.Path(__file__).resolve().parent
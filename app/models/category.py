@@ -2,7 +2,7 @@
 from __future__ import annotations
 from typing import List, Optional
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String
+from sqlalchemy import Integer, String
 from app.db.base import Base
 
 # 타입체커 전용 임포트
@@ -23,15 +23,20 @@ class Category(Base):
     # - 검색 최적화를 위해 index 지정
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
 
+    # 행 버전 (낙관적 동시성 제어, 수정마다 +1, app/services/row_version.py)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
     # 연관 관계: 카테고리 → 재고(다대일의 1 측)
     # - Stock 모델에서 back_populates="category"로 대응 예정
+    # - 카테고리 조회 시 재고 전체를 끌고 오지 않도록 자동 로딩 금지함
+    #   (필요한 곳에서만 options(selectinload(Category.stocks))로 명시 로딩)
     stocks: Mapped[List["Stock"]] = relationship(
         "Stock",
         back_populates="category",
         foreign_keys="Stock.category_id",   # FK가 Stock.category_id임을 명시
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     # 표현용
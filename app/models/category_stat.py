@@ -0,0 +1,35 @@
+# app/models/category_stat.py
+from __future__ import annotations
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Integer, ForeignKey
+from app.db.base import Base
+
+# 카테고리별 재고 집계(롤업) 엔티티 정의함
+# - 목록 API의 총건수를 COUNT(*) 대신 이 카운터로 제공함
+# - 보고서 API(/api/reports)의 카테고리별 수량 합계/품목 수/품절·부족 분포도 이 행만 읽음
+# - 재고 생성/삭제/수정/증감 시 같은 트랜잭션에서 증감 (app/services/counts.py)
+# - 전체 값은 카테고리 행 합계로 계산 (전역 단일 행 갱신 경합 회피)
+class CategoryStat(Base):
+    __tablename__ = "CategoryStats"
+
+    # 카테고리 외래키 겸 기본키
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey("Category.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # 재고(SKU) 건수
+    stock_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 수량 합계
+    total_quantity: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+
+    # 품절(수량 0) 품목 수
+    zero_stock_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # 부족(1 이상 low_stock_threshold 이하) 품목 수
+    low_stock_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"CategoryStat(category_id={self.category_id!r}, stock_count={self.stock_count!r}, total_quantity={self.total_quantity!r})"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from typing import Optional
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, CheckConstraint, Index
 from app.db.base import Base
 
 # 타입체커 전용 임포트
@@ -13,6 +13,13 @@ if TYPE_CHECKING:
 # 재고 엔티티 정의함
 class Stock(Base):
     __tablename__ = "Stocks"    # RDS 실제 테이블명과 일치시킴
+    __table_args__ = (
+        # 수량 0 이상을 DB 레벨에서 보장 (증감 API의 동시 요청도 이 제약에서 최종 차단)
+        CheckConstraint("inventory >= 0", name="inventory_nonneg"),
+        # 카테고리 필터 + 이름/수량 정렬을 인덱스 순서대로 읽기 위한 복합 인덱스
+        Index("ix_Stocks_category_id_name", "category_id", "name"),
+        Index("ix_Stocks_category_id_inventory", "category_id", "inventory"),
+    )
 
     # 기본키
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -24,8 +31,9 @@ class Stock(Base):
     name: Mapped[str] = mapped_column(String(200), index=True, nullable=False)
 
     # 수량
-    # - 0 이상 정수
-    inventory: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # - 0 이상 정수 (CHECK 제약)
+    # - 수량 정렬용 인덱스
+    inventory: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
 
     # 카테고리 외래키
     # - 삭제 시 자식 행 처리: 상위에서 cascade 설정됨
@@ -42,6 +50,11 @@ class Stock(Base):
         lazy="joined",
     )
 
+    # 행 버전 (낙관적 동시성 제어)
+    # - 이 행을 바꾸는 모든 쓰기가 1씩 올림 (수정/증감/일괄)
+    # - 수정 요청은 기대 버전을 조건으로 UPDATE 한 문장 실행, 불일치면 충돌 (app/services/row_version.py)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+
     # 표현용
     def __repr__(self) -> str:
         return f"Stock(id={self.id!r}, name={self.name!r}, inventory={self.inventory!r}, category_id={self.category_id!r})"
@@ -0,0 +1,43 @@
+# app/models/stock_event.py
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Integer, String
+from app.db.base import Base
+from app.models.stock_movement import MovementId
+
+# 재고/카테고리 변경 피드 엔티티 정의함 (추가 전용, 보존 기간 지나면 정리)
+# - 쓰기 경로가 같은 트랜잭션에서 한 줄씩 남김 (app/services/change_feed.py)
+# - id 증가 순서 = 이벤트 순서, SSE 이벤트 id / 재개 기준(Last-Event-ID)으로 사용
+# - 변경 후 값(이름/수량/카테고리)을 함께 담아 클라이언트가 재조회 없이 행을 고칠 수 있게 함
+class StockEvent(Base):
+    __tablename__ = "StockEvents"
+
+    # 기본키 (이벤트 id)
+    id: Mapped[int] = mapped_column(MovementId, primary_key=True, autoincrement=True)
+
+    # 종류 (create / update / adjust / delete / category_create / category_update / category_delete)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    # 대상 재고 ID (카테고리 이벤트는 NULL)
+    stock_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # 변경 후 카테고리 ID (카테고리 이벤트는 대상 카테고리)
+    category_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # 카테고리가 바뀐 수정이면 변경 전 카테고리 ID (필터 구독자가 행 이탈을 알 수 있게)
+    prev_category_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # 변경 후 이름 (재고명 또는 카테고리명, 삭제는 NULL)
+    name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+
+    # 변경 후 수량 (재고 이벤트만)
+    inventory: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # 기록 시각 (UTC, naive) - 보존 기간 정리용
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"StockEvent(id={self.id!r}, kind={self.kind!r}, stock_id={self.stock_id!r}, category_id={self.category_id!r})"
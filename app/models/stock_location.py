@@ -0,0 +1,45 @@
+# app/models/stock_location.py
+from __future__ import annotations
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer
+from app.db.base import Base
+
+# 창고별 재고 수량 엔티티 정의함
+# - (warehouse_id, stock_id) 한 행 = 한 창고의 한 SKU 수량, 행이 있으면 그 창고 취급 품목 (0 이어도 유지)
+# - Stocks.inventory = 이 테이블의 재고별 합계, 같은 트랜잭션에서 증분 유지 (app/services/locations.py)
+# - 창고 범위 목록/검색은 이 테이블을 warehouse_id 범위로 읽고 페이지 행만 Stocks 에서 PK 로 가져옴
+# - category_id 는 Stocks 값 복제 (창고+카테고리 필터를 이 테이블 인덱스만으로 처리, 재고 카테고리 변경 시 함께 갱신)
+class StockLocation(Base):
+    __tablename__ = "StockLocations"
+    __table_args__ = (
+        # 수량 0 이상 (창고 지정 출고의 동시 요청도 최종 차단)
+        CheckConstraint("quantity >= 0", name="quantity_nonneg"),
+        # 창고 범위 + 수량 정렬 (정렬/키셋 조건이 인덱스만으로 끝남)
+        Index("ix_StockLocations_warehouse_id_quantity", "warehouse_id", "quantity", "stock_id"),
+        # 창고 범위 + 카테고리 필터 (id 순 정렬 포함)
+        Index("ix_StockLocations_warehouse_id_category_id", "warehouse_id", "category_id", "stock_id"),
+        # 재고별 창고 분포 조회 / 재고 삭제 / 카테고리 변경 반영
+        Index("ix_StockLocations_stock_id", "stock_id", "warehouse_id"),
+        # SQLite: 복합 PK 순서로 클러스터 저장 → 창고 하나의 행이 연속 페이지에 모임 (창고별 파티션)
+        {"sqlite_with_rowid": False},
+    )
+
+    # 복합 기본키 (warehouse_id, stock_id)
+    warehouse_id: Mapped[int] = mapped_column(
+        ForeignKey("Warehouses.id", ondelete="RESTRICT"),
+        primary_key=True,
+    )
+    stock_id: Mapped[int] = mapped_column(
+        ForeignKey("Stocks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # 재고 카테고리 (Stocks.category_id 복제)
+    category_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 이 창고의 수량
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"StockLocation(warehouse_id={self.warehouse_id!r}, stock_id={self.stock_id!r}, quantity={self.quantity!r})"
@@ -0,0 +1,39 @@
+# app/models/stock_movement.py
+from __future__ import annotations
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String
+from app.db.base import Base
+
+# 자동증가 BIGINT (SQLite는 INTEGER PRIMARY KEY 여야 rowid 자동증가)
+MovementId = BigInteger().with_variant(Integer, "sqlite")
+
+# 재고 수량 변동 원장 엔티티 정의함 (추가 전용, 수정/삭제 없음)
+# - 수량을 바꾸는 모든 쓰기 경로가 같은 트랜잭션에서 한 줄씩 남김 (app/services/ledger.py)
+# - 재고 삭제 후에도 감사 이력이 남도록 Stocks 에 외래키를 걸지 않음
+# - 시점 잔량 = 직전 스냅샷 잔량 + 스냅샷 이후 변동 합 (app/models/stock_snapshot.py)
+class StockMovement(Base):
+    __tablename__ = "StockMovements"
+    __table_args__ = (
+        # 재고별 스냅샷 이후 변동 재생(id > 워터마크) 범위 탐색용
+        Index("ix_StockMovements_stock_id_id", "stock_id", "id"),
+    )
+
+    # 기본키 (증가 순서 = 기록 순서, 스냅샷 워터마크로 사용)
+    id: Mapped[int] = mapped_column(MovementId, primary_key=True, autoincrement=True)
+
+    # 대상 재고 ID
+    stock_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 증감 수량 (양수: 입고, 음수: 출고)
+    delta: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 변동 사유 (create / update / adjust / delete / opening)
+    reason: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    # 기록 시각 (UTC, naive)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"StockMovement(id={self.id!r}, stock_id={self.stock_id!r}, delta={self.delta!r}, reason={self.reason!r})"
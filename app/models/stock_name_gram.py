@@ -0,0 +1,36 @@
+# app/models/stock_name_gram.py
+from __future__ import annotations
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, ForeignKey
+from sqlalchemy.dialects import mysql
+from app.db.base import Base
+
+# n-gram 문자열 타입
+# - MySQL/MariaDB는 기본 콜레이션이 대소문자/악센트 무시라 서로 다른 gram이 같은 PK로 충돌함
+#   → utf8mb4_bin 으로 바이너리 비교 강제함
+GramString = String(8).with_variant(mysql.VARCHAR(8, collation="utf8mb4_bin"), "mysql", "mariadb")
+
+# 물품명 n-gram 색인 엔티티 정의함
+# - 물품명(search.fold 로 접은 문자열)의 연속 N글자 조각 → 재고 id 역색인
+# - '%kw%' 검색 시 키워드의 모든 조각을 가진 재고만 후보로 좁힘 (app/services/search.py)
+class StockNameGram(Base):
+    __tablename__ = "StockNameGrams"
+    # SQLite: 복합 PK 자체를 클러스터 키로 저장 (rowid B-tree + PK 인덱스 이중 저장 방지)
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    # 복합 기본키 (gram, stock_id)
+    # - gram 선두 컬럼이라 gram 조회가 인덱스 범위 탐색으로 끝남
+    gram: Mapped[str] = mapped_column(GramString, primary_key=True)
+
+    # 재고 외래키
+    # - 재고 삭제 시 색인 행도 함께 삭제 (앱에서 명시 삭제, DB에서도 보장)
+    # - 재고 기준 삭제/재색인용 인덱스 부여
+    stock_id: Mapped[int] = mapped_column(
+        ForeignKey("Stocks.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"StockNameGram(gram={self.gram!r}, stock_id={self.stock_id!r})"
@@ -0,0 +1,29 @@
+# app/models/stock_snapshot.py
+from __future__ import annotations
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, DateTime, Integer
+from app.db.base import Base
+
+# 재고별 잔량 스냅샷 엔티티 정의함
+# - 주기 작업(python -m app.cli snapshot-inventory)이 변동이 있던 재고만 한 줄씩 추가
+# - movement_id: 이 스냅샷에 반영된 마지막 원장 id (워터마크)
+# - 시점 조회 시 재생할 변동은 워터마크 이후 분량으로 한정됨
+class StockSnapshot(Base):
+    __tablename__ = "StockSnapshots"
+
+    # 복합 기본키 (stock_id, movement_id)
+    # - 재고별 최신/특정 시점 이전 스냅샷을 인덱스 역순 탐색 한 번으로 찾음
+    stock_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # - movement_id 단독 인덱스: 직전 주기 워터마크(MAX) 조회용
+    movement_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+
+    # 워터마크까지 누적한 잔량
+    balance: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 워터마크 변동의 기록 시각 (이 시각 이후 조회에 사용 가능)
+    taken_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"StockSnapshot(stock_id={self.stock_id!r}, movement_id={self.movement_id!r}, balance={self.balance!r})"
@@ -0,0 +1,22 @@
+# app/models/table_version.py
+from __future__ import annotations
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, String
+from app.db.base import Base
+
+# 테이블 단위 변경 카운터 엔티티 정의함
+# - 쓰기 트랜잭션 안에서 해당 테이블 행의 version 을 1 증가 (app/services/versions.py)
+# - 현재 카테고리만 사용 (재고 토큰은 추가 전용 StockEvents 에서 유도해 쓰기 경합 없음)
+# - 조회 API는 이 값으로 약한 ETag 를 만들어 변경이 없으면 304 로 응답
+class TableVersion(Base):
+    __tablename__ = "TableVersions"
+
+    # 대상 테이블 이름 (Category, Stocks 행은 이전 버전 호환용으로만 남음)
+    table_name: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    # 변경 카운터
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"TableVersion(table_name={self.table_name!r}, version={self.version!r})"
@@ -0,0 +1,21 @@
+# app/models/warehouse.py
+from __future__ import annotations
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String
+from app.db.base import Base
+
+# 창고(사이트) 엔티티 정의함
+# - 재고 수량은 창고별 행(StockLocations)에 두고, Stocks.inventory 는 전 창고 합계로 유지 (app/services/locations.py)
+# - 창고 미지정 쓰기(생성/수정/일괄/가져오기/미지정 증감)는 기본 창고(설정 DEFAULT_WAREHOUSE_ID) 기준
+class Warehouse(Base):
+    __tablename__ = "Warehouses"
+
+    # 기본키
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    # 창고명 (중복 불가)
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+
+    # 표현용
+    def __repr__(self) -> str:
+        return f"Warehouse(id={self.id!r}, name={self.name!r})"
@@ -14,9 +14,16 @@ class CategoryCreate(CategoryBase):
 class CategoryUpdate(BaseModel):
     # 부분 업데이트 허용함
     name: str | None = Field(None, min_length=1, max_length=50)
+    # 기대 행 버전 (If-Match 헤더 대신 사용 가능, 불일치 시 409)
+    version: int | None = Field(None, ge=1)
 
 # 응답용 스키마 (ORM 객체 직렬화 허용)
 class CategoryOut(CategoryBase):
     id: int = Field(..., ge=1) # PK 양수 제한함
+    version: int = Field(..., ge=1) # 행 버전 (수정 시 If-Match 또는 바디 version 으로 전달)
     # SQLAlchemy 모델 -> 스키마 변환 허용함
     model_config = ConfigDict(from_attributes=True)
+
+# 목록 응답용 스키마 (with_counts=true 일 때만 stock_count 포함)
+class CategoryListItem(CategoryOut):
+    stock_count: int | None = Field(None, ge=0)
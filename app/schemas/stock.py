@@ -1,5 +1,5 @@
 # app/schemas/stock.py
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -24,6 +24,8 @@ class StockUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=200, description="물품명")
     inventory: Optional[int] = Field(None, ge=0, description="수량")
     category_id: Optional[int] = Field(None, ge=1, description="카테고리 ID")
+    # 기대 행 버전 (If-Match 헤더 대신 사용 가능, 불일치 시 409)
+    version: Optional[int] = Field(None, ge=1, description="기대 행 버전")
 
 
 # 조회 응답용
@@ -32,6 +34,7 @@ class StockRead(BaseModel):
     name: str
     inventory: int
     category_id: int
+    version: int
     # Spring의 StocksDTO(categoryName)와 유사하게 내려줄 필드
     category_name: Optional[str] = None
 
@@ -39,3 +42,61 @@ class StockRead(BaseModel):
     model_config = {
         "from_attributes": True  # Pydantic v2: orm_mode 대체
     }
+
+
+# 일괄 수정 항목 (id + 부분 수정 필드)
+class StockBulkUpdateItem(StockUpdate):
+    id: int = Field(..., ge=1, description="재고 ID")
+
+
+# 일괄 삭제 요청용
+class StockBulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, description="삭제할 재고 ID 목록")
+
+
+# 일괄 처리 항목별 결과
+class StockBulkItemResult(BaseModel):
+    index: int                      # 요청 배열 내 위치
+    id: Optional[int] = None        # 대상/생성된 재고 ID
+    ok: bool
+    error: Optional[str] = None
+
+
+# 일괄 처리 응답
+class StockBulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[StockBulkItemResult]
+
+
+# 수량 증감 요청용 (양수: 입고, 음수: 출고)
+class StockAdjust(BaseModel):
+    delta: int = Field(..., ge=-1_000_000_000, le=1_000_000_000, description="증감 수량")
+    # 창고 ID (없으면 창고 미지정: 합계 기준 판정, 입고는 기본 창고 / 출고는 기본 창고부터 차감)
+    warehouse_id: Optional[int] = Field(None, ge=1, description="창고 ID")
+
+
+# 일괄 증감 항목
+class StockAdjustItem(StockAdjust):
+    id: int = Field(..., ge=1, description="재고 ID")
+
+
+# 증감 응답 (변경 후 수량)
+class StockAdjustResult(BaseModel):
+    id: int
+    inventory: int                              # 전 창고 합계
+    warehouse_id: Optional[int] = None          # 창고 지정 증감이면 그 창고
+    warehouse_inventory: Optional[int] = None   # 그 창고의 변경 후 수량
+
+
+# 일괄 증감 항목별 결과
+class StockAdjustItemResult(StockBulkItemResult):
+    inventory: Optional[int] = None  # 변경 후 수량 (성공 시)
+    warehouse_inventory: Optional[int] = None  # 창고 지정 항목이면 그 창고의 변경 후 수량
+
+
+# 일괄 증감 응답
+class StockAdjustBulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[StockAdjustItemResult]
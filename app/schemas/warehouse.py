@@ -0,0 +1,15 @@
+# app/schemas/warehouse.py
+from pydantic import BaseModel, Field, ConfigDict
+
+# 생성 요청 바디용 스키마
+class WarehouseCreate(BaseModel):
+    # 창고 이름 (중복 불가)
+    name: str = Field(..., min_length=1, max_length=100)
+
+# 응답용 스키마 (ORM 객체 직렬화 허용)
+class WarehouseOut(BaseModel):
+    id: int = Field(..., ge=1)
+    name: str
+    # 단건 조회에서만 포함 (창고 취급 품목 수)
+    sku_count: int | None = Field(None, ge=0)
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,3 @@
+# 패키지 초기화 파일
+# 라우터 간 공유하는 도메인 로직(색인/집계 등) 모음
+__all__ = []
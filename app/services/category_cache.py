@@ -0,0 +1,148 @@
+# app/services/category_cache.py
+# 목적: 카테고리 id ↔ 이름 조회용 프로세스 내 LRU/TTL 캐시
+# - 재고 쓰기(생성/일괄)의 카테고리 검증과 목록 응답의 category_name 을 DB 조회 없이 해결
+# - 카테고리 변경 핸들러(app/api/routes/categories.py)가 커밋 직후 invalidate 호출
+#   (다른 워커 프로세스의 캐시는 TTL 만료로 수렴)
+# - 크기/TTL: 설정 category_cache_size / category_cache_ttl (TTL 0 이면 캐시 사용 안 함)
+# - 없는 id/이름은 캐시하지 않음 (생성 직후 바로 보이도록)
+# - 무효화 세대 번호: 조회 도중 무효화가 끼면 그 조회 결과는 캐시에 넣지 않음 (옛 이름 재적재 방지)
+# - stats(): 적중/미스/축출 건수, 적중률
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.category import Category
+
+_MISSING = object()
+
+
+class _LruTtl:
+    """크기 상한 + 항목별 만료 시각을 가진 LRU 사전 (스레드 안전)"""
+
+    def __init__(self) -> None:
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        settings = get_settings()
+        if settings.category_cache_ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + settings.category_cache_ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > settings.category_cache_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def discard_where(self, pred) -> None:
+        with self._lock:
+            for key in [k for k, (v, _) in self._data.items() if pred(k, v)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_names = _LruTtl()   # id → 이름
+_ids = _LruTtl()     # 이름 → id
+_generation = 0      # invalidate 호출마다 증가
+
+
+def get_names(db: Session, category_ids: Iterable[int]) -> Dict[int, str]:
+    """id 목록 → {id: 이름} (없는 id 는 빠짐, 미스는 IN 조회 한 번)"""
+    found: Dict[int, str] = {}
+    missing: Set[int] = set()
+    for cid in set(category_ids):
+        name = _names.get(cid)
+        if name is _MISSING:
+            missing.add(cid)
+        else:
+            found[cid] = name
+    if missing:
+        gen = _generation
+        rows = db.execute(select(Category.id, Category.name).where(Category.id.in_(missing))).all()
+        for cid, name in rows:
+            if gen == _generation:
+                _names.put(cid, name)
+                _ids.put(name, cid)
+            found[cid] = name
+    return found
+
+
+def get_name(db: Session, category_id: int) -> Optional[str]:
+    """id → 이름 (없으면 None)"""
+    return get_names(db, [category_id]).get(category_id)
+
+
+def get_id(db: Session, name: str) -> Optional[int]:
+    """이름 → id (없으면 None)"""
+    cid = _ids.get(name)
+    if cid is not _MISSING:
+        return cid
+    gen = _generation
+    cid = db.scalar(select(Category.id).where(Category.name == name))
+    if cid is not None and gen == _generation:
+        _ids.put(name, cid)
+        _names.put(cid, name)
+    return cid
+
+
+def existing_ids(db: Session, category_ids: Iterable[int]) -> Set[int]:
+    """존재하는 카테고리 id만 반환"""
+    return set(get_names(db, category_ids))
+
+
+def invalidate(category_id: Optional[int] = None) -> None:
+    """카테고리 하나(이전 이름 포함) 또는 전체 무효화 (커밋 직후 호출)"""
+    global _generation
+    _generation += 1
+    if category_id is None:
+        _names.clear()
+        _ids.clear()
+        return
+    _names.discard_where(lambda k, v: k == category_id)
+    _ids.discard_where(lambda k, v: v == category_id)
+
+
+def stats() -> Dict[str, Any]:
+    """적중/미스 통계 (id→이름, 이름→id 각각)"""
+    def one(c: _LruTtl) -> Dict[str, Any]:
+        total = c.hits + c.misses
+        return {
+            "size": len(c),
+            "hits": c.hits,
+            "misses": c.misses,
+            "evictions": c.evictions,
+            "hit_ratio": round(c.hits / total, 4) if total else None,
+        }
+
+    settings = get_settings()
+    return {
+        "capacity": settings.category_cache_size,
+        "ttl_seconds": settings.category_cache_ttl,
+        "by_id": one(_names),
+        "by_name": one(_ids),
+    }
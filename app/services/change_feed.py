@@ -0,0 +1,194 @@
+# app/services/change_feed.py
+# 목적: 재고/카테고리 변경 피드 (기록 + 조회 + 대기)
+# - record_stocks / record_category: 쓰기 경로(stock_sync, categories 라우터)가 커밋 전에 호출, executemany 한 번
+# - 기록한 세션은 커밋 직후 같은 워커의 구독자를 깨움 (after_commit 이벤트)
+#   · 다른 워커의 기록은 구독자가 change_feed_poll_seconds 주기로 확인
+# - read: id 이후 이벤트를 id 순으로 (카테고리 필터는 변경 전/후 카테고리 둘 다 매칭)
+#   · id 는 INSERT 시점에 매겨지지만 보이는 건 커밋 순서 (MySQL/InnoDB): 늦게 커밋되는 작은 id 가 있을 수 있음
+#   · 그래서 id 가 비는 자리(직전 id + 1 이 아님) 뒤의 이벤트는 change_feed_settle_seconds 가 지날 때까지 보류
+#     (그 사이 빈 id 가 커밋되면 순서대로 전달, 지나면 롤백/정리로 빈 것으로 보고 건너뜀)
+# - prune: 보존 시간이 지난 이벤트 삭제 (python -m app.cli prune-change-feed)
+
+import asyncio
+import json
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.stock_event import StockEvent
+from app.services import category_cache
+from app.services.ledger import utc_naive
+
+_DIRTY_KEY = "change_feed_dirty"
+
+# 재고 이벤트 종류
+CREATE, UPDATE, ADJUST, DELETE = "create", "update", "adjust", "delete"
+
+
+# ----------------------------------------------------------
+# 기록 (커밋은 호출자 책임)
+# ----------------------------------------------------------
+def record_stocks(db: Session, kind: str, rows: Iterable[Tuple[Any, Optional[int]]]) -> None:
+    """(StockRow, 변경 전 카테고리 ID 또는 None) 목록 기록 (삭제는 이름/수량 생략)"""
+    now = utc_naive()
+    params = [
+        {
+            "kind": kind,
+            "stock_id": r.id,
+            "category_id": r.category_id,
+            "prev_category_id": prev,
+            "name": None if kind == DELETE else r.name,
+            "inventory": None if kind == DELETE else r.inventory,
+            "created_at": now,
+        }
+        for r, prev in rows
+    ]
+    if params:
+        db.execute(insert(StockEvent.__table__), params)
+        db.info[_DIRTY_KEY] = True
+
+
+def record_category(db: Session, kind: str, category_id: int, name: Optional[str]) -> None:
+    """카테고리 생성/수정/삭제 기록 (kind: create | update | delete)"""
+    db.execute(
+        insert(StockEvent.__table__).values(
+            kind=f"category_{kind}", category_id=category_id, name=name, created_at=utc_naive()
+        )
+    )
+    db.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    # 세이브포인트 해제(begin_nested)도 after_commit 을 부르므로 바깥 트랜잭션 커밋만
+    if not session.in_nested_transaction() and session.info.pop(_DIRTY_KEY, False):
+        notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_after_rollback(session: Session) -> None:
+    # 세이브포인트 롤백(begin_nested)은 바깥 트랜잭션의 앞선 쓰기가 살아 있으므로 유지
+    if not session.in_nested_transaction():
+        session.info.pop(_DIRTY_KEY, None)
+
+
+# ----------------------------------------------------------
+# 같은 워커 구독자 깨우기
+#  - 커밋은 스레드풀(동기 세션) 또는 이벤트 루프(비동기 세션)에서 일어나므로 call_soon_threadsafe 로 전달
+#  - 구독자는 조회 전에 등록하고 조회 후 기다림 (조회와 대기 사이의 알림 유실 방지)
+# ----------------------------------------------------------
+_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+_waiters_lock = threading.Lock()
+
+
+def notify() -> None:
+    with _waiters_lock:
+        waiters = list(_waiters)
+    for loop, ev in waiters:
+        try:
+            loop.call_soon_threadsafe(ev.set)
+        except RuntimeError:   # 닫힌 루프
+            pass
+
+
+def subscribe() -> Tuple[asyncio.AbstractEventLoop, asyncio.Event]:
+    waiter = (asyncio.get_running_loop(), asyncio.Event())
+    with _waiters_lock:
+        _waiters.add(waiter)
+    return waiter
+
+
+def unsubscribe(waiter: Tuple[asyncio.AbstractEventLoop, asyncio.Event]) -> None:
+    with _waiters_lock:
+        _waiters.discard(waiter)
+
+
+async def wait(waiter: Tuple[asyncio.AbstractEventLoop, asyncio.Event], timeout: float) -> bool:
+    """알림 또는 timeout 까지 대기 (알림이면 True)"""
+    try:
+        await asyncio.wait_for(waiter[1].wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+# ----------------------------------------------------------
+# 조회
+# ----------------------------------------------------------
+def bounds(db: Session) -> Tuple[int, int]:
+    """(보존 중인 최소 id, 최대 id), 비어 있으면 (0, 0)"""
+    lo, hi = db.execute(select(func.min(StockEvent.id), func.max(StockEvent.id))).one()
+    return lo or 0, hi or 0
+
+
+def read(
+    db: Session, after_id: int, category_id: Optional[int], limit: int, settle_seconds: Optional[float] = None
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """
+    after_id 이후 이벤트 (id 순, 최대 limit 건) + 다음 조회 기준 id + 더 남았는지.
+    필터로 걸러진 이벤트도 기준 id 는 넘겨 같은 구간을 다시 읽지 않게 함.
+    빈 id 뒤의 이벤트는 기록 후 settle_seconds(기본 change_feed_settle_seconds)가 지나야 넘김 (그 전까지 보류).
+    """
+    if settle_seconds is None:
+        settle_seconds = get_settings().change_feed_settle_seconds
+    q = select(StockEvent).where(StockEvent.id > after_id).order_by(StockEvent.id).limit(limit)
+    rows = list(db.scalars(q))
+    more = len(rows) >= limit
+
+    # 빈 id 가 아직 커밋 전일 수 있으면 그 뒤는 다음 조회로 미룸
+    settled_at = utc_naive() - timedelta(seconds=settle_seconds)
+    expected = after_id + 1
+    for i, r in enumerate(rows):
+        if r.id != expected and r.created_at > settled_at:
+            rows, more = rows[:i], False
+            break
+        expected = r.id + 1
+    if not rows:
+        return [], after_id, False
+
+    last_id = rows[-1].id
+    if category_id is not None:
+        rows = [r for r in rows if category_id in (r.category_id, r.prev_category_id)]
+    names = category_cache.get_names(db, {r.category_id for r in rows if r.stock_id is not None and r.kind != DELETE})
+    return [_to_dict(r, names) for r in rows], last_id, more
+
+
+def _to_dict(r: StockEvent, names: Dict[int, str]) -> Dict[str, Any]:
+    if r.stock_id is None:
+        return {
+            "id": r.id,
+            "type": r.kind,
+            "category": {"id": r.category_id, "name": r.name},
+        }
+    stock: Dict[str, Any] = {"id": r.stock_id, "category_id": r.category_id}
+    if r.kind != DELETE:
+        stock.update(name=r.name, inventory=r.inventory, category_name=names.get(r.category_id))
+    data: Dict[str, Any] = {"id": r.id, "type": r.kind, "stock": stock}
+    if r.prev_category_id is not None:
+        data["prev_category_id"] = r.prev_category_id
+    return data
+
+
+def format_sse(data: Dict[str, Any]) -> str:
+    """SSE 메시지 한 건 (id 필드로 브라우저가 Last-Event-ID 를 기억)"""
+    return f"id: {data['id']}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+# ----------------------------------------------------------
+# 정리
+# ----------------------------------------------------------
+def prune(db: Session, retention_hours: int) -> int:
+    """
+    보존 시간이 지난 이벤트 삭제 (삭제 건수 반환, 커밋함).
+    마지막 이벤트는 남김: 테이블이 비면 SQLite 등은 id 를 다시 1부터 매겨 재개 기준이 어긋남.
+    """
+    cutoff = utc_naive() - timedelta(hours=retention_hours)
+    _, newest = bounds(db)
+    result = db.execute(
+        delete(StockEvent).where(StockEvent.created_at < cutoff, StockEvent.id < newest)
+    )
+    db.commit()
+    return result.rowcount or 0
@@ -0,0 +1,162 @@
+# app/services/counts.py
+# 목적: 목록 총건수 캐시 + 카테고리별 재고 집계(롤업)
+# - 카테고리별 재고 건수/수량 합계/품절·부족 품목 수를 CategoryStats 에 유지 (쓰기 트랜잭션 안에서 증감하므로 항상 정확)
+#   · stock_sync 훅이 (카테고리, 수량) 변경 전 값은 빼고 변경 후 값은 더함 → 카테고리당 UPDATE 한 문장
+#   · 부족 기준(low_stock_threshold)을 바꾸면 rebuild 로 재계산
+# - 필터 없는/카테고리 필터 목록은 카운터만 읽음 (PK 조회 또는 카테고리 수만큼 합계)
+# - 보고서(/api/reports, app/services/reports.py)도 이 행만 읽으므로 재고 수와 무관한 비용
+# - 키워드 필터 목록은 상한(count_keyword_limit)까지만 세고 초과 시 "1000+" 형태로 표시
+# - 페이지가 덜 찼으면 총건수가 이미 확정이므로 COUNT 자체를 생략함
+# - 창고 범위 목록은 창고 행 인덱스 범위 COUNT (app/services/locations.py)
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.category import Category
+from app.models.category_stat import CategoryStat
+from app.models.stock import Stock
+from app.services import locations
+
+# 집계 컬럼 (증감 벡터 순서)
+ROLLUP_COLUMNS = ("stock_count", "total_quantity", "zero_stock_count", "low_stock_count")
+
+
+def _rollup_exprs(inventory) -> List:
+    """집계 컬럼별 SQL 식 (rebuild / 카운터 행 보충용)"""
+    low = get_settings().low_stock_threshold
+    return [
+        func.count(Stock.id),
+        func.coalesce(func.sum(inventory), 0),
+        func.coalesce(func.sum(case((inventory == 0, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((inventory.between(1, low), 1), else_=0)), 0),
+    ]
+
+
+def _vector(inventory: int) -> Tuple[int, int, int, int]:
+    """재고 한 건의 집계 기여분"""
+    low = get_settings().low_stock_threshold
+    return 1, inventory, int(inventory == 0), int(0 < inventory <= low)
+
+
+# ----------------------------------------------------------
+# 카운터 유지 (재고 쓰기 경로에서 호출)
+# ----------------------------------------------------------
+def ensure_row(db: Session, category_id: int) -> None:
+    """카테고리 생성 시 카운터 행 추가함"""
+    db.execute(insert(CategoryStat).values(category_id=category_id, stock_count=0))
+
+
+def drop_row(db: Session, category_id: int) -> None:
+    """카테고리 삭제 시 카운터 행 제거함 (FK CASCADE 미적용 SQLite 대비)"""
+    db.execute(delete(CategoryStat).where(CategoryStat.category_id == category_id))
+
+
+def rollup_deltas(
+    added: Iterable[Tuple[int, int]] = (),
+    removed: Iterable[Tuple[int, int]] = (),
+) -> Dict[int, List[int]]:
+    """(category_id, inventory) 추가/제거 목록 → {category_id: 집계 증감 벡터} (변화 없는 카테고리 제외)"""
+    deltas: Dict[int, List[int]] = defaultdict(lambda: [0] * len(ROLLUP_COLUMNS))
+    for sign, entries in ((1, added), (-1, removed)):
+        for category_id, inventory in entries:
+            acc = deltas[category_id]
+            for i, v in enumerate(_vector(inventory)):
+                acc[i] += sign * v
+    return {c: d for c, d in deltas.items() if any(d)}
+
+
+def apply_deltas(db: Session, deltas: Dict[int, List[int]], pending: bool = False) -> None:
+    """
+    {category_id: 집계 증감 벡터} 반영함 (rollup_deltas 결과).
+    카운터 행이 없으면(마이그레이션 이전 카테고리 등) 현재 트랜잭션 기준 실제 값으로 채움.
+    pending: 재고 행 변경이 아직 테이블에 반영 전이면 True (삭제 전 호출) → 실제 값에 증감을 더해 채움.
+    """
+    for category_id, delta in deltas.items():
+        values = {
+            col: getattr(CategoryStat, col) + d
+            for col, d in zip(ROLLUP_COLUMNS, delta)
+            if d
+        }
+        if not values:
+            continue
+        result = db.execute(update(CategoryStat).where(CategoryStat.category_id == category_id).values(**values))
+        if result.rowcount == 0:
+            exact = db.execute(
+                select(*_rollup_exprs(Stock.inventory)).where(Stock.category_id == category_id)
+            ).one()
+            if pending:
+                exact = [v + d for v, d in zip(exact, delta)]
+            db.execute(insert(CategoryStat).values(category_id=category_id, **dict(zip(ROLLUP_COLUMNS, exact))))
+
+
+def rebuild(db: Session) -> int:
+    """카운터/집계 전체 재계산함 (복구용, 부족 기준 변경 시). 카테고리 수 반환."""
+    db.execute(delete(CategoryStat))
+    rows = db.execute(
+        select(Category.id, *_rollup_exprs(Stock.inventory))
+        .outerjoin(Stock, Stock.category_id == Category.id)
+        .group_by(Category.id)
+    ).all()
+    if rows:
+        db.execute(insert(CategoryStat), [{"category_id": r[0], **dict(zip(ROLLUP_COLUMNS, r[1:]))} for r in rows])
+    db.commit()
+    return len(rows)
+
+
+# ----------------------------------------------------------
+# 총건수 조회 (목록 경로에서 호출)
+# ----------------------------------------------------------
+def total_from_page(offset: int, row_count: int, size: int) -> Optional[int]:
+    """덜 찬 페이지면 총건수 확정 (offset + 행수). 가득 찬 페이지는 알 수 없으므로 None."""
+    if row_count < size and (row_count > 0 or offset == 0):
+        return offset + row_count
+    return None
+
+
+def stock_total(db: Session, category_id: Optional[int] = None) -> int:
+    """카운터 기준 재고 건수 (category_id 없으면 전체)"""
+    if category_id is not None:
+        return db.execute(
+            select(CategoryStat.stock_count).where(CategoryStat.category_id == category_id)
+        ).scalar() or 0
+    return db.execute(select(func.sum(CategoryStat.stock_count))).scalar() or 0
+
+
+def bounded_count(q, limit: int) -> Tuple[int, bool]:
+    """
+    limit+1 건까지만 세는 COUNT. (건수, 상한초과여부) 반환.
+    초과 시 건수는 limit 으로 잘림.
+    """
+    sub = q.with_entities(Stock.id).order_by(None).limit(limit + 1).subquery()
+    n = q.session.execute(select(func.count()).select_from(sub)).scalar() or 0
+    return min(n, limit), n > limit
+
+
+def listing_total(
+    db: Session,
+    q,
+    category_id: Optional[int],
+    keyword: Optional[str],
+    warehouse_id: Optional[int] = None,
+) -> Tuple[int, bool]:
+    """
+    목록 총건수 (건수, 상한초과여부).
+    - 키워드 없음: 카운터 조회 (창고 범위면 창고 인덱스 범위 COUNT)
+    - 키워드 있음: count_keyword_limit 상한 COUNT (0이면 정확한 COUNT)
+    """
+    if not keyword:
+        if warehouse_id is not None:
+            return locations.count(db, warehouse_id, category_id), False
+        return stock_total(db, category_id), False
+    limit = get_settings().count_keyword_limit
+    if limit <= 0:
+        return q.with_entities(func.count(Stock.id)).order_by(None).scalar() or 0, False
+    return bounded_count(q, limit)
+
+
+def format_total(total: int, capped: bool) -> str:
+    """X-Total-Count 헤더 값 ("1234" 또는 "1000+")"""
+    return f"{total}+" if capped else str(total)
@@ -0,0 +1,130 @@
+# app/services/group_commit.py
+# 목적: 수량 증감 묶음 커밋 큐 (선택 기능, 설정 INVENTORY_GROUP_COMMIT)
+# - 요청마다 커밋(fsync)하는 대신, 짧은 시간 동안 도착한 증감을 모아 트랜잭션 하나로 반영
+#   · 첫 요청 도착 후 inventory_group_commit_ms 동안 더 모으거나 inventory_group_commit_max_ops 에 닿으면 즉시 반영
+#   · 반영 중 도착한 요청은 다음 묶음으로 (한 워커에서 반영은 한 번에 하나)
+# - 같은 재고 요청은 합쳐 한 번만 기록, 판정은 도착 순서대로 (app/services/inventory.py adjust_many)
+#   · 창고 지정 요청도 같은 묶음에서 창고 수량까지 판정
+# - 호출자는 커밋이 끝난 뒤 응답 받음 (지속성은 요청별 커밋과 같음, 대신 묶음 대기만큼 지연 증가)
+# - 반영 자체가 실패(DB 오류)하면 그 묶음의 모든 요청이 같은 예외를 받음
+# - 큐는 워커 프로세스 + 이벤트 루프 단위, 대기 중인 요청이 없으면 작업 태스크도 없음
+
+import asyncio
+import weakref
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import run_in_session
+from app.services import inventory
+from app.services.inventory import AdjustError, Adjusted
+
+
+class _Op(NamedTuple):
+    stock_id: int
+    delta: int
+    warehouse_id: Optional[int]
+    future: "asyncio.Future[Adjusted]"
+
+
+def _apply(db: Session, ops: Sequence[Tuple[int, int, Optional[int]]]) -> List[Union[Adjusted, AdjustError]]:
+    try:
+        results = inventory.adjust_many(db, ops)
+        db.commit()
+        return results
+    except Exception:
+        db.rollback()
+        raise
+
+
+class _Lane:
+    """이벤트 루프 하나의 대기열 (작업 태스크는 대기열이 빌 때까지만 돎)"""
+
+    def __init__(self) -> None:
+        self.pending: List[_Op] = []
+        self.full = asyncio.Event()
+        self.task: Optional["asyncio.Task[None]"] = None
+
+
+class InventoryQueue:
+    """증감 요청을 모아 주기적으로 한 트랜잭션에 반영하는 큐"""
+
+    def __init__(self) -> None:
+        # 루프별 대기열 (테스트 클라이언트처럼 루프가 여럿이어도 서로 섞이지 않음)
+        self._lanes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Lane]" = weakref.WeakKeyDictionary()
+        self.flushes = self.ops = self.rows = self.rejected = self.failed_flushes = 0
+        self.max_batch = 0
+
+    async def submit(self, stock_id: int, delta: int, warehouse_id: Optional[int] = None) -> Adjusted:
+        """증감 요청 후 반영(커밋)될 때까지 대기, 증감 결과 반환 (실패 시 AdjustError)"""
+        loop = asyncio.get_running_loop()
+        lane = self._lanes.get(loop)
+        if lane is None:
+            lane = self._lanes[loop] = _Lane()
+
+        future: "asyncio.Future[Adjusted]" = loop.create_future()
+        lane.pending.append(_Op(stock_id, delta, warehouse_id, future))
+        if len(lane.pending) >= get_settings().inventory_group_commit_max_ops:
+            lane.full.set()
+        if lane.task is None or lane.task.done():
+            lane.task = loop.create_task(self._drain(lane))
+        return await future
+
+    async def _drain(self, lane: _Lane) -> None:
+        while lane.pending:
+            settings = get_settings()
+            max_ops = settings.inventory_group_commit_max_ops
+            if len(lane.pending) < max_ops:
+                try:
+                    await asyncio.wait_for(lane.full.wait(), settings.inventory_group_commit_ms / 1000)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch, lane.pending = lane.pending[:max_ops], lane.pending[max_ops:]
+            if len(lane.pending) < max_ops:
+                lane.full.clear()
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[_Op]) -> None:
+        try:
+            results = await run_in_session(_apply, [(op.stock_id, op.delta, op.warehouse_id) for op in batch])
+        except Exception as exc:
+            self.failed_flushes += 1
+            for op in batch:
+                if not op.future.done():
+                    op.future.set_exception(exc)
+            return
+
+        self.flushes += 1
+        self.ops += len(batch)
+        self.rows += len({op.stock_id for op in batch})
+        self.max_batch = max(self.max_batch, len(batch))
+        for op, result in zip(batch, results):
+            if op.future.done():   # 호출자가 먼저 끊김 (반영은 이미 커밋됨)
+                continue
+            if isinstance(result, AdjustError):
+                self.rejected += 1
+                op.future.set_exception(result)
+            else:
+                op.future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        settings = get_settings()
+        return {
+            "enabled": settings.inventory_group_commit,
+            "window_ms": settings.inventory_group_commit_ms,
+            "max_ops": settings.inventory_group_commit_max_ops,
+            "pending": sum(len(lane.pending) for lane in list(self._lanes.values())),
+            "flushes": self.flushes,
+            "ops": self.ops,
+            "rows_written": self.rows,
+            "rejected": self.rejected,
+            "failed_flushes": self.failed_flushes,
+            "avg_batch": round(self.ops / self.flushes, 2) if self.flushes else None,
+            "max_batch": self.max_batch,
+        }
+
+
+# 기본 큐 (POST /api/stocks/{id}/adjust 가 사용)
+inventory_queue = InventoryQueue()
@@ -0,0 +1,169 @@
+# app/services/inventory.py
+# 목적: 수량 증감(입고/출고 스캔)을 UPDATE 한 문장으로 원자 적용
+# - inventory = inventory + :delta, 조건 inventory + :delta >= 0 을 WHERE 에 두어
+#   동시 요청끼리 읽고-쓰기 경합 없이 DB 행 잠금만으로 직렬화됨 (조회 후 절대값 덮어쓰기 금지)
+# - 0 미만 방지는 Stocks 의 CHECK(inventory >= 0)가 최종 보장, WHERE 조건은 오류 대신 실패 사유를 알리기 위함
+# - RETURNING 지원 백엔드는 새 행을 같은 문장으로 받고, 미지원(MySQL 등)은 같은 트랜잭션에서 다시 조회
+#   (UPDATE 가 잡은 행 잠금이 커밋까지 유지되므로 다른 트랜잭션이 끼어들 수 없음)
+# - adjust_many: 여러 증감을 한 트랜잭션에서 (묶음 커밋 큐용, app/services/group_commit.py)
+#   · 대상 행을 먼저 잠그고 도착 순서대로 판정, 재고별 최종 수량만 한 번씩 기록 (같은 재고 요청 합침)
+# - 증감도 행 version 을 올림 (수정 요청의 낙관적 충돌 감지 대상, app/services/row_version.py)
+# - 창고 지정(warehouse_id): 재고 행을 먼저 잠그고(값 변화 없는 UPDATE) 창고 수량을 읽어 판정한 뒤에만 둘 다 기록
+#   · 잠금 순서는 창고 미지정과 같게 Stocks → StockLocations, 창고 행 쓰기는 모두 재고 행 잠금 뒤라 읽은 값이 커밋까지 그대로
+#   · 창고 행은 잠금 읽기(FOR UPDATE)로 읽음 (MySQL 반복 읽기 스냅샷이 잠금 전에 만들어졌어도 최신 커밋 값)
+#   · 판정 실패 시 아무것도 바꾸지 않음 → 일괄 증감은 실패 항목만 건너뛰고 이어서 커밋 (세이브포인트 미사용: pysqlite 는
+#     트랜잭션 첫 문장이 SAVEPOINT 면 RELEASE 가 실제 커밋이 됨)
+#   · 창고 미지정은 합계만 판정, 창고 행은 stock_sync 훅이 기본 창고부터 반영
+# - 커밋은 호출자 책임
+
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.models.stock import Stock
+from app.services import locations, stock_sync
+from app.services.stock_sync import StockRow
+
+_ROW_COLUMNS = (Stock.id, Stock.name, Stock.inventory, Stock.category_id, Stock.version)
+
+
+class AdjustError(Exception):
+    """증감 실패 (reason: "not_found" | "warehouse_not_found" | "insufficient")"""
+
+    def __init__(self, reason: str, stock_id: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.stock_id = stock_id
+
+
+class Adjusted(NamedTuple):
+    """증감 결과 (변경 후 재고 행 + 창고 지정이면 그 창고의 변경 후 수량)"""
+    row: StockRow
+    warehouse_inventory: Optional[int] = None
+
+
+def _add_total(db: Session, stock_id: int, delta: int) -> StockRow:
+    """합계(Stocks) 조건부 UPDATE, 변경 후 행 반환 (대상 없음/수량 부족이면 AdjustError)"""
+    stmt = (
+        update(Stock)
+        .where(Stock.id == stock_id, Stock.inventory + delta >= 0)
+        .values(inventory=Stock.inventory + delta, version=Stock.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+    row: Optional[StockRow] = None
+    if db.get_bind().dialect.update_returning:
+        r = db.execute(stmt.returning(*_ROW_COLUMNS)).first()
+        row = StockRow(*r) if r else None
+    elif db.execute(stmt).rowcount:
+        row = StockRow(*db.execute(select(*_ROW_COLUMNS).where(Stock.id == stock_id)).one())
+
+    if row is None:
+        # 갱신된 행이 없으면 대상 없음 / 수량 부족 구분
+        exists = db.scalar(select(Stock.id).where(Stock.id == stock_id))
+        raise AdjustError("not_found" if exists is None else "insufficient", stock_id)
+    return row
+
+
+def _lock(db: Session, stock_ids: Sequence[int]) -> int:
+    """값 변화 없는 UPDATE 로 재고 행(SQLite는 DB) 쓰기 잠금, 잠근 행 수 반환 (id 순서로 잠가 교착 없음)"""
+    return db.execute(
+        update(Stock)
+        .where(Stock.id.in_(sorted(stock_ids)))
+        .values(inventory=Stock.inventory)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def adjust(db: Session, stock_id: int, delta: int, warehouse_id: Optional[int] = None) -> Adjusted:
+    """재고 수량(창고 지정 시 그 창고 수량도)에 delta 를 더하고 변경 후 행을 반환함"""
+    if warehouse_id is None:
+        row = _add_total(db, stock_id, delta)
+        before = row._replace(inventory=row.inventory - delta, version=row.version - 1)
+        stock_sync.after_update(db, [(before, row)], reason="adjust")
+        return Adjusted(row)
+
+    if not _lock(db, [stock_id]):
+        raise AdjustError("not_found", stock_id)
+    if not locations.exists(db, warehouse_id):
+        raise AdjustError("warehouse_not_found", stock_id)
+    key = (warehouse_id, stock_id)
+    stored = locations.quantities(db, [key], for_update=True)
+    quantity = stored.get(key, 0) + delta
+    if quantity < 0:
+        raise AdjustError("insufficient", stock_id)
+
+    # 창고 수량이 충분하면 합계도 충분함 (불변식: 합계 = 창고별 수량 합)
+    row = _add_total(db, stock_id, delta)
+    locations.write(db, {key: quantity}, stored.keys(), {stock_id: row.category_id})
+    before = row._replace(inventory=row.inventory - delta, version=row.version - 1)
+    stock_sync.after_update(db, [(before, row)], reason="adjust", placed={stock_id: delta})
+    return Adjusted(row, quantity)
+
+
+def adjust_many(
+    db: Session, ops: Sequence[Tuple[int, int, Optional[int]]]
+) -> List[Union[Adjusted, AdjustError]]:
+    """
+    (stock_id, delta, warehouse_id) 목록을 순서대로 적용함. 항목별로 결과 또는 AdjustError 를 반환 (예외로 던지지 않음).
+    같은 재고의 여러 증감은 하나로 합쳐 UPDATE/원장/피드에 재고당 한 번씩만 반영.
+    창고 지정 항목은 합계와 그 창고 수량을 둘 다 판정, 미지정 항목은 합계만 판정.
+    """
+    ids = sorted({stock_id for stock_id, _, _ in ops})
+
+    # 잠금 먼저: 행 쓰기 잠금을 잡은 뒤 읽음 (읽은 값이 커밋까지 바뀌지 않음)
+    _lock(db, ids)
+    before: Dict[int, StockRow] = {
+        r.id: StockRow(*r) for r in db.execute(select(*_ROW_COLUMNS).where(Stock.id.in_(ids)))
+    }
+
+    # 창고 지정 항목의 창고 존재 여부 + 현재 창고 수량 (재고 행 잠금 뒤라 커밋까지 그대로)
+    warehouses = locations.existing(db, {w for _, _, w in ops if w is not None})
+    stored = locations.quantities(db, {(w, s) for s, _, w in ops if w in warehouses and s in before})
+    located = dict(stored)
+
+    balance = {stock_id: row.inventory for stock_id, row in before.items()}
+    placed: Dict[int, int] = defaultdict(int)
+    results: List[Union[Adjusted, AdjustError]] = []
+    for stock_id, delta, warehouse_id in ops:
+        row = before.get(stock_id)
+        if row is None:
+            results.append(AdjustError("not_found", stock_id))
+            continue
+        if warehouse_id is not None and warehouse_id not in warehouses:
+            results.append(AdjustError("warehouse_not_found", stock_id))
+            continue
+        new_balance = balance[stock_id] + delta
+        key = (warehouse_id, stock_id)
+        new_quantity = located.get(key, 0) + delta if warehouse_id is not None else None
+        if new_balance < 0 or (new_quantity is not None and new_quantity < 0):
+            results.append(AdjustError("insufficient", stock_id))
+            continue
+        balance[stock_id] = new_balance
+        if new_quantity is not None:
+            located[key] = new_quantity
+            placed[stock_id] += delta
+        results.append(Adjusted(row._replace(inventory=new_balance, version=row.version + 1), new_quantity))
+
+    # 합계가 그대로여도 창고 간 이동(지정 입고 + 미지정 출고 등)이 있으면 반영 대상
+    changes = [
+        (row, row._replace(inventory=balance[stock_id], version=row.version + 1))
+        for stock_id, row in before.items()
+        if balance[stock_id] != row.inventory or placed.get(stock_id)
+    ]
+    if changes:
+        db.execute(
+            update(Stock.__table__)
+            .where(Stock.__table__.c.id == bindparam("stock_id"))
+            .values(inventory=bindparam("balance"), version=Stock.__table__.c.version + 1),
+            [{"stock_id": new.id, "balance": new.inventory} for _, new in changes],
+        )
+        locations.write(
+            db,
+            {key: q for key, q in located.items() if stored.get(key) != q},
+            stored.keys(),
+            {stock_id: row.category_id for stock_id, row in before.items()},
+        )
+        stock_sync.after_update(db, changes, reason="adjust", placed=placed)
+    return results
@@ -0,0 +1,125 @@
+# app/services/ledger.py
+# 목적: 재고 수량 변동 원장 기록 + 시점 잔량 조회 + 주기 스냅샷
+# - record: stock_sync 훅에서 호출, 변동분(delta)을 executemany 한 번으로 추가 (커밋은 호출자 책임)
+# - balance_at: 시점 이전 마지막 스냅샷 + (그 스냅샷 ~ 다음 스냅샷) 구간 변동만 재생
+#   · 재생 범위가 스냅샷 주기 한 번 분량으로 한정되어 이력이 쌓여도 조회 비용 일정
+# - snapshot: 직전 주기 이후 변동이 있던 재고만 INSERT ... SELECT 한 문장으로 스냅샷 추가
+#   · settle_seconds 이전 변동까지만 포함 (늦게 커밋되는 작은 id 누락 방지)
+# - 시각은 모두 UTC naive 로 저장/비교
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.stock_movement import StockMovement
+from app.models.stock_snapshot import StockSnapshot
+
+# 스냅샷에 포함할 변동의 최소 경과 시간 (초)
+SETTLE_SECONDS = 60
+
+
+def utc_naive(value: Optional[datetime] = None) -> datetime:
+    """aware 시각은 UTC 로 변환, naive 는 UTC 로 간주 (None 이면 현재)"""
+    if value is None:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def record(db: Session, entries: Iterable[Tuple[int, int]], reason: str) -> None:
+    """(stock_id, delta) 목록을 원장에 추가 (delta 0 은 생략)"""
+    now = utc_naive()
+    params = [
+        {"stock_id": stock_id, "delta": delta, "reason": reason, "created_at": now}
+        for stock_id, delta in entries
+        if delta
+    ]
+    if params:
+        db.execute(insert(StockMovement.__table__), params)
+
+
+def balance_at(db: Session, stock_id: int, at: datetime) -> int:
+    """시점 at 의 잔량 (삭제된 재고도 이력으로 계산)"""
+    at = utc_naive(at)
+
+    # at 이전에 확정된 마지막 스냅샷 (없으면 0 에서 시작)
+    snap = db.execute(
+        select(StockSnapshot.movement_id, StockSnapshot.balance)
+        .where(StockSnapshot.stock_id == stock_id, StockSnapshot.taken_at <= at)
+        .order_by(StockSnapshot.movement_id.desc())
+        .limit(1)
+    ).first()
+    base_id, balance = (snap.movement_id, snap.balance) if snap else (0, 0)
+
+    # 재생 상한: at 이후 첫 스냅샷의 워터마크 (그 뒤 변동은 at 이후이므로 볼 필요 없음)
+    upper = db.scalar(
+        select(StockSnapshot.movement_id)
+        .where(StockSnapshot.stock_id == stock_id, StockSnapshot.movement_id > base_id, StockSnapshot.taken_at > at)
+        .order_by(StockSnapshot.movement_id)
+        .limit(1)
+    )
+
+    replay = select(func.coalesce(func.sum(StockMovement.delta), 0)).where(
+        StockMovement.stock_id == stock_id,
+        StockMovement.id > base_id,
+        StockMovement.created_at <= at,
+    )
+    if upper is not None:
+        replay = replay.where(StockMovement.id <= upper)
+    return balance + int(db.scalar(replay))
+
+
+def movements(db: Session, stock_id: int, before_id: Optional[int], size: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """재고 변동 이력 (id 역순, before_id 미만부터 size 건) + 다음 페이지 before_id"""
+    q = select(StockMovement).where(StockMovement.stock_id == stock_id)
+    if before_id is not None:
+        q = q.where(StockMovement.id < before_id)
+    rows = list(db.scalars(q.order_by(StockMovement.id.desc()).limit(size + 1)))
+    more = len(rows) > size
+    rows = rows[:size]
+    items = [
+        {"id": m.id, "delta": m.delta, "reason": m.reason, "created_at": m.created_at.isoformat()}
+        for m in rows
+    ]
+    return items, (rows[-1].id if more else None)
+
+
+def snapshot(db: Session, settle_seconds: int = SETTLE_SECONDS) -> int:
+    """직전 스냅샷 이후 변동이 있던 재고의 스냅샷 추가, 추가한 재고 수 반환 (커밋 포함)"""
+    cutoff = utc_naive() - timedelta(seconds=settle_seconds)
+    upto = db.scalar(select(func.max(StockMovement.id)).where(StockMovement.created_at <= cutoff))
+    if upto is None:
+        return 0
+    # 직전 주기 워터마크 = 기존 스냅샷의 최대 movement_id
+    since = db.scalar(select(func.coalesce(func.max(StockSnapshot.movement_id), 0)))
+    if upto <= since:
+        return 0
+
+    # 재고별 직전 스냅샷 잔량 (PK 역순 탐색 한 번)
+    prev_balance = (
+        select(StockSnapshot.balance)
+        .where(StockSnapshot.stock_id == StockMovement.stock_id)
+        .order_by(StockSnapshot.movement_id.desc())
+        .limit(1)
+        .correlate(StockMovement)
+        .scalar_subquery()
+    )
+    rows = (
+        select(
+            StockMovement.stock_id,
+            func.max(StockMovement.id),
+            func.coalesce(prev_balance, 0) + func.sum(StockMovement.delta),
+            func.max(StockMovement.created_at),
+        )
+        .where(StockMovement.id > since, StockMovement.id <= upto)
+        .group_by(StockMovement.stock_id)
+    )
+    result = db.execute(
+        insert(StockSnapshot).from_select(
+            ["stock_id", "movement_id", "balance", "taken_at"], rows
+        )
+    )
+    db.commit()
+    return result.rowcount
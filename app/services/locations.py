@@ -0,0 +1,230 @@
+# app/services/locations.py
+# 목적: 창고별 수량(StockLocations) 유지 + 재고별 합계(Stocks.inventory) 정합
+# - 불변식: Stocks.inventory = 그 재고의 창고별 수량 합, 모든 쓰기가 같은 트랜잭션에서 양쪽을 함께 바꿈
+# - 창고 지정 증감(inventory.adjust(warehouse_id=...))은 재고 행 잠금 뒤 해당 창고 행을 읽고 직접 기록 (quantities/write)
+#   나머지 쓰기 경로의 수량 변화는 stock_sync 훅에서 창고 미지정 분량으로 반영 (apply_unscoped)
+#   · 증가: 기본 창고(설정 default_warehouse_id)에 더함
+#   · 감소: 기본 창고부터 차감, 부족분은 창고 id 순으로 차감 (합계가 0 이상이면 항상 성공)
+# - 재고 생성은 기본 창고 행 추가, 삭제는 창고 행 선삭제, 카테고리 변경은 복제 컬럼 갱신
+# - 창고별 조회는 (warehouse_id, ...) 선두 인덱스 범위만 읽음 (app/models/stock_location.py)
+# - 커밋은 호출자 책임 (rebuild 제외)
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import bindparam, case, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.stock import Stock
+from app.models.stock_location import StockLocation
+from app.models.warehouse import Warehouse
+
+# 기본 창고 이름 (마이그레이션/rebuild 가 없으면 만듦)
+DEFAULT_WAREHOUSE_NAME = "기본 창고"
+
+_loc = StockLocation.__table__
+
+
+def default_id() -> int:
+    return get_settings().default_warehouse_id
+
+
+def exists(db: Session, warehouse_id: int) -> bool:
+    return db.scalar(select(Warehouse.id).where(Warehouse.id == warehouse_id)) is not None
+
+
+def existing(db: Session, warehouse_ids: Iterable[int]) -> set:
+    """주어진 창고 id 중 존재하는 것"""
+    ids = set(warehouse_ids)
+    if not ids:
+        return set()
+    return set(db.scalars(select(Warehouse.id).where(Warehouse.id.in_(ids))))
+
+
+def ensure_default(db: Session) -> None:
+    """기본 창고 행이 없으면 추가"""
+    if not exists(db, default_id()):
+        db.execute(insert(Warehouse).values(id=default_id(), name=DEFAULT_WAREHOUSE_NAME))
+
+
+# ----------------------------------------------------------
+# stock_sync 훅에서 호출
+# ----------------------------------------------------------
+def place(db: Session, rows: Sequence[Any]) -> None:
+    """새 재고를 기본 창고에 배치 (rows: StockRow)"""
+    if rows:
+        wid = default_id()
+        db.execute(
+            insert(_loc),
+            [{"warehouse_id": wid, "stock_id": r.id, "category_id": r.category_id, "quantity": r.inventory} for r in rows],
+        )
+
+
+def remove(db: Session, stock_ids: List[int]) -> None:
+    """재고 삭제 전 창고 행 삭제 (FK CASCADE 미적용 SQLite 대비)"""
+    if stock_ids:
+        db.execute(delete(_loc).where(_loc.c.stock_id.in_(stock_ids)))
+
+
+def recategorize(db: Session, pairs: Sequence[Tuple[int, int]]) -> None:
+    """(stock_id, 새 category_id) → 복제 컬럼 갱신"""
+    if pairs:
+        db.execute(
+            update(_loc).where(_loc.c.stock_id == bindparam("b_stock_id")).values(category_id=bindparam("b_category_id")),
+            [{"b_stock_id": s, "b_category_id": c} for s, c in pairs],
+        )
+
+
+def apply_unscoped(db: Session, entries: Sequence[Tuple[Any, int]]) -> None:
+    """
+    창고 미지정 수량 변화 반영 ((변경 후 StockRow, 증감) 목록).
+    증가는 기본 창고, 감소는 기본 창고 → 창고 id 순으로 차감.
+    """
+    entries = [(row, delta) for row, delta in entries if delta]
+    if not entries:
+        return
+    wid = default_id()
+    ids = [row.id for row, _ in entries]
+
+    # 관련 창고 행 한 번에 읽음 (재고당 창고 수만큼, 차감 순서대로)
+    held: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for stock_id, warehouse_id, quantity in db.execute(
+        select(_loc.c.stock_id, _loc.c.warehouse_id, _loc.c.quantity)
+        .where(_loc.c.stock_id.in_(ids))
+        .order_by(_loc.c.stock_id, case((_loc.c.warehouse_id == wid, 0), else_=1), _loc.c.warehouse_id)
+    ):
+        held[stock_id].append((warehouse_id, quantity))
+
+    updates: List[Dict[str, int]] = []
+    inserts: List[Dict[str, int]] = []
+    for row, delta in entries:
+        rows = held.get(row.id, [])
+        if delta > 0:
+            current = dict(rows).get(wid)
+            if current is None:
+                inserts.append({"warehouse_id": wid, "stock_id": row.id, "category_id": row.category_id, "quantity": delta})
+            else:
+                updates.append({"b_warehouse_id": wid, "b_stock_id": row.id, "b_quantity": current + delta})
+            continue
+        # 감소: 남은 차감량이 없어질 때까지 순서대로 (불변식이 깨진 데이터면 있는 만큼만, rebuild 로 복구)
+        need = -delta
+        for warehouse_id, quantity in rows:
+            if need <= 0:
+                break
+            take = min(quantity, need)
+            if take:
+                updates.append({"b_warehouse_id": warehouse_id, "b_stock_id": row.id, "b_quantity": quantity - take})
+                need -= take
+
+    if updates:
+        db.execute(
+            update(_loc)
+            .where(_loc.c.warehouse_id == bindparam("b_warehouse_id"), _loc.c.stock_id == bindparam("b_stock_id"))
+            .values(quantity=bindparam("b_quantity")),
+            updates,
+        )
+    if inserts:
+        db.execute(insert(_loc), inserts)
+
+
+# ----------------------------------------------------------
+# 창고 지정 증감 (inventory.adjust / adjust_many)
+# ----------------------------------------------------------
+def quantities(db: Session, keys: Iterable[Tuple[int, int]], for_update: bool = False) -> Dict[Tuple[int, int], int]:
+    """{(warehouse_id, stock_id): 수량} (행 없는 키는 빠짐, for_update: 잠금 읽기)"""
+    keys = set(keys)
+    if not keys:
+        return {}
+    stmt = select(_loc.c.warehouse_id, _loc.c.stock_id, _loc.c.quantity).where(
+        _loc.c.stock_id.in_({s for _, s in keys}),
+        _loc.c.warehouse_id.in_({w for w, _ in keys}),
+    )
+    rows = db.execute(stmt.with_for_update() if for_update else stmt)
+    return {(w, s): q for w, s, q in rows if (w, s) in keys}
+
+
+def write(db: Session, values: Dict[Tuple[int, int], int], existing_keys: Iterable[Tuple[int, int]], categories: Dict[int, int]) -> None:
+    """묶음 증감 결과 기록 ({(warehouse_id, stock_id): 최종 수량}, 기존 행 키, {stock_id: category_id})"""
+    existing_keys = set(existing_keys)
+    updates = [{"b_warehouse_id": w, "b_stock_id": s, "b_quantity": q} for (w, s), q in values.items() if (w, s) in existing_keys]
+    inserts = [
+        {"warehouse_id": w, "stock_id": s, "category_id": categories[s], "quantity": q}
+        for (w, s), q in values.items()
+        if (w, s) not in existing_keys
+    ]
+    if updates:
+        db.execute(
+            update(_loc)
+            .where(_loc.c.warehouse_id == bindparam("b_warehouse_id"), _loc.c.stock_id == bindparam("b_stock_id"))
+            .values(quantity=bindparam("b_quantity")),
+            updates,
+        )
+    if inserts:
+        db.execute(insert(_loc), inserts)
+
+
+# ----------------------------------------------------------
+# 조회
+# ----------------------------------------------------------
+def breakdown(db: Session, stock_id: int) -> List[Dict[str, int]]:
+    """재고의 창고별 수량 [{warehouse_id, inventory}] (ix_StockLocations_stock_id 범위)"""
+    rows = db.execute(
+        select(_loc.c.warehouse_id, _loc.c.quantity).where(_loc.c.stock_id == stock_id).order_by(_loc.c.warehouse_id)
+    )
+    return [{"warehouse_id": w, "inventory": q} for w, q in rows]
+
+
+def count(db: Session, warehouse_id: int, category_id: Optional[int] = None) -> int:
+    """창고 취급 품목 수 (창고 파티션 인덱스 범위 COUNT)"""
+    stmt = select(func.count()).select_from(_loc).where(_loc.c.warehouse_id == warehouse_id)
+    if category_id is not None:
+        stmt = stmt.where(_loc.c.category_id == category_id)
+    return db.scalar(stmt) or 0
+
+
+# ----------------------------------------------------------
+# 복구 (python -m app.cli rebuild-locations)
+# ----------------------------------------------------------
+def rebuild(db: Session) -> Dict[str, int]:
+    """
+    창고별 행/합계 불변식 복구.
+    - 기본 창고 없으면 추가, 창고 행이 하나도 없는 재고는 기본 창고에 전량 배치
+    - 복제 카테고리 재동기화
+    - 합계가 어긋난 재고는 기본 창고 수량으로 맞춤 (원장과 일치하는 Stocks.inventory 기준)
+      · 다른 창고 합이 이미 총량을 넘으면 맞출 수 없으므로 unresolved 로 셈
+    """
+    ensure_default(db)
+    wid = default_id()
+
+    missing = ~select(_loc.c.stock_id).where(_loc.c.stock_id == Stock.id).exists()
+    placed = db.execute(
+        insert(_loc).from_select(
+            ["warehouse_id", "stock_id", "category_id", "quantity"],
+            select(wid, Stock.id, Stock.category_id, Stock.inventory).where(missing),
+        )
+    ).rowcount
+
+    db.execute(
+        update(_loc)
+        .values(category_id=select(Stock.category_id).where(Stock.id == _loc.c.stock_id).scalar_subquery())
+    )
+
+    others = func.coalesce(func.sum(case((_loc.c.warehouse_id != wid, _loc.c.quantity), else_=0)), 0)
+    mismatched = db.execute(
+        select(Stock.id, Stock.inventory, Stock.category_id, others)
+        .join(_loc, _loc.c.stock_id == Stock.id)
+        .group_by(Stock.id, Stock.inventory, Stock.category_id)
+        .having(func.sum(_loc.c.quantity) != Stock.inventory)
+    ).all()
+    unresolved = 0
+    values: Dict[Tuple[int, int], int] = {}
+    categories: Dict[int, int] = {}
+    for stock_id, total, category_id, other in mismatched:
+        if other > total:
+            unresolved += 1
+            continue
+        values[(wid, stock_id)] = total - other
+        categories[stock_id] = category_id
+    write(db, values, quantities(db, values.keys()).keys(), categories)
+    db.commit()
+    return {"placed": placed, "fixed": len(values), "unresolved": unresolved}
@@ -0,0 +1,144 @@
+# app/services/page_cache.py
+# 목적: /stocks 화면 렌더 결과(HTML bytes) 캐시, stale-while-revalidate
+# - 키: (categoryId, keyword, page, size), 크기 상한 LRU (stocks_page_cache_size)
+#   · 본문은 요청 Host 와 무관해야 함 (템플릿의 정적 링크는 url_for(...).path 로 경로만 출력)
+# - 신선(fresh): 저장/재검증 후 stocks_page_cache_ttl 이내이고 무효화 세대가 같으면 DB 확인 없이 제공
+# - 그 뒤에는 변경 카운터(app/services/versions.py) 태그로 재검증, 같으면 본문 재사용, 다르면 다시 렌더
+#   · 재검증은 키마다 한 요청만 수행, 그동안 다른 요청은 직전 본문을 받음 (begin_refresh/end_refresh)
+# - 재고/카테고리 쓰기가 invalidate_on_commit 호출 → 커밋 직후 이 워커의 항목은 즉시 재검증 대상 (다른 워커는 TTL 뒤 태그로 수렴)
+#   · 커밋 전에 세대를 올리면 그 사이 시작한 렌더가 커밋 전 데이터를 새 세대로 저장해 TTL 동안 신선본으로 제공됨
+#     → 세대는 after_commit 이벤트에서 올림 (change_feed 알림과 같은 방식)
+#   · 항목은 지우지 않음: DB 장애 중에는 마지막 정상 본문을 "지난 데이터" 안내와 함께 제공 (stale_body)
+# - stats(): 적중/재검증/렌더/지난 본문 제공 건수
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+
+# 템플릿의 안내 자리 (stocks/index.html)
+STALE_MARKER = b"<!--stale-notice-->"
+STALE_NOTICE = (
+    '<div class="notice--stale" role="status">'
+    "데이터베이스 연결이 원활하지 않아 마지막으로 확인된 목록을 표시 중임 (최신 내용이 아닐 수 있음)"
+    "</div>"
+).encode("utf-8")
+
+
+class Entry(NamedTuple):
+    body: bytes
+    tag: str            # 렌더 시점 변경 카운터 태그
+    checked_at: float   # 마지막 저장/재검증 시각 (monotonic)
+    generation: int     # 저장 당시 무효화 세대
+
+
+_entries: "OrderedDict[Hashable, Entry]" = OrderedDict()
+_lock = threading.Lock()
+_refreshing: Set[Hashable] = set()
+_generation = 0
+_stats = {"hits": 0, "revalidated": 0, "rendered": 0, "stale_served": 0}
+
+_PENDING_KEY = "page_cache_invalidate"
+
+
+def lookup(key: Hashable) -> Optional[Entry]:
+    """저장된 항목 (신선도 무관, 없으면 None)"""
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+        return entry
+
+
+def is_fresh(entry: Entry) -> bool:
+    ttl = get_settings().stocks_page_cache_ttl
+    return ttl > 0 and entry.generation == _generation and time.monotonic() - entry.checked_at < ttl
+
+
+def generation() -> int:
+    """현재 무효화 세대 (렌더 시작 전에 읽어 store 에 넘김)"""
+    return _generation
+
+
+def store(key: Hashable, body: bytes, tag: str, gen: int) -> None:
+    """렌더/재검증 결과 저장 (gen: 렌더 시작 시점 세대, 그 사이 무효화됐으면 바로 재검증 대상)"""
+    settings = get_settings()
+    if settings.stocks_page_cache_ttl <= 0:
+        return
+    with _lock:
+        _entries[key] = Entry(body, tag, time.monotonic(), gen)
+        _entries.move_to_end(key)
+        while len(_entries) > settings.stocks_page_cache_size:
+            _entries.popitem(last=False)
+
+
+def begin_refresh(key: Hashable) -> bool:
+    """키 재검증 시작 (이미 다른 요청이 진행 중이면 False)"""
+    with _lock:
+        if key in _refreshing:
+            return False
+        _refreshing.add(key)
+        return True
+
+
+def end_refresh(key: Hashable) -> None:
+    with _lock:
+        _refreshing.discard(key)
+
+
+def count(kind: str) -> None:
+    """제공 결과 집계 (hits | revalidated | rendered | stale_served)"""
+    with _lock:
+        _stats[kind] += 1
+
+
+def stale_body(entry: Entry) -> bytes:
+    """지난 본문 + 안내 배너"""
+    return entry.body.replace(STALE_MARKER, STALE_NOTICE, 1)
+
+
+def invalidate() -> None:
+    """모든 항목을 재검증 대상으로 (본문은 장애 대비로 유지)"""
+    global _generation
+    _generation += 1
+
+
+def invalidate_on_commit(db: Session) -> None:
+    """재고/카테고리 쓰기가 커밋 전에 호출: 세션이 커밋되면 invalidate (롤백이면 무시)"""
+    db.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # 세이브포인트 해제(begin_nested)도 after_commit 을 부르므로 바깥 트랜잭션 커밋만
+    if not session.in_nested_transaction() and session.info.pop(_PENDING_KEY, False):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_after_rollback(session: Session) -> None:
+    # 세이브포인트 롤백(begin_nested)은 바깥 트랜잭션의 앞선 쓰기가 살아 있으므로 유지
+    if not session.in_nested_transaction():
+        session.info.pop(_PENDING_KEY, None)
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
+
+
+def stats() -> Dict[str, Any]:
+    settings = get_settings()
+    with _lock:
+        return {
+            "capacity": settings.stocks_page_cache_size,
+            "ttl_seconds": settings.stocks_page_cache_ttl,
+            "size": len(_entries),
+            "generation": _generation,
+            **_stats,
+        }
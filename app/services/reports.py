@@ -0,0 +1,92 @@
+# app/services/reports.py
+# 목적: 대시보드용 재고 보고서 조회 (/api/reports)
+# - 모두 카테고리 집계 행(CategoryStats)만 읽음 → 재고 행 수와 무관 (카테고리 수에 비례)
+#   · 집계는 재고 쓰기 트랜잭션이 함께 증감 (app/services/counts.py), 커밋된 재고와 항상 일치
+#   · 부족 기준(low_stock_threshold)을 바꾸거나 값이 어긋나면 python -m app.cli rebuild-counts
+# - 재고 분포 구간: zero(0), low(1 ~ 기준), ok(기준 초과)
+
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.models.category import Category
+from app.models.category_stat import CategoryStat
+
+# 카테고리별 보고서 정렬 키 (모두 내림차순, 동률은 category_id)
+CATEGORY_SORTS = {
+    "id": CategoryStat.category_id,
+    "sku_count": CategoryStat.stock_count,
+    "total_quantity": CategoryStat.total_quantity,
+    "zero_stock": CategoryStat.zero_stock_count,
+    "low_stock": CategoryStat.low_stock_count,
+}
+
+_SUMS = (
+    func.coalesce(func.sum(CategoryStat.stock_count), 0),
+    func.coalesce(func.sum(CategoryStat.total_quantity), 0),
+    func.coalesce(func.sum(CategoryStat.zero_stock_count), 0),
+    func.coalesce(func.sum(CategoryStat.low_stock_count), 0),
+)
+
+
+def _figures(sku_count: int, total_quantity: int, zero: int, low: int) -> Dict[str, int]:
+    return {
+        "sku_count": int(sku_count),
+        "total_quantity": int(total_quantity),
+        "zero_stock_count": int(zero),
+        "low_stock_count": int(low),
+    }
+
+
+def summary(db: Session) -> Dict[str, Any]:
+    """전체 합계 (카테고리 행 합)"""
+    row = db.execute(select(func.count(CategoryStat.category_id), *_SUMS)).one()
+    return {
+        "categories": row[0],
+        **_figures(*row[1:]),
+        "low_stock_threshold": get_settings().low_stock_threshold,
+    }
+
+
+def by_category(db: Session, page: int, size: int, sort: str) -> Tuple[List[Dict[str, Any]], int]:
+    """카테고리별 수량 합계/품목 수/품절·부족 수 (정렬 키 내림차순). (항목, 전체 카테고리 수) 반환."""
+    key = CATEGORY_SORTS[sort]
+    rows = db.execute(
+        select(
+            CategoryStat.category_id,
+            Category.name,
+            CategoryStat.stock_count,
+            CategoryStat.total_quantity,
+            CategoryStat.zero_stock_count,
+            CategoryStat.low_stock_count,
+        )
+        .join(Category, Category.id == CategoryStat.category_id)
+        .order_by(key.desc(), CategoryStat.category_id.desc())
+        .offset((page - 1) * size)
+        .limit(size)
+    ).all()
+    metrics.add_rows(len(rows))
+    total = db.scalar(select(func.count(CategoryStat.category_id))) or 0
+    items = [{"category_id": r[0], "category_name": r[1], **_figures(*r[2:])} for r in rows]
+    return items, total
+
+
+def stock_levels(db: Session, category_id: Optional[int] = None) -> Dict[str, Any]:
+    """재고 분포 히스토그램 (전체 또는 카테고리 하나)"""
+    stmt = select(*_SUMS)
+    if category_id is not None:
+        stmt = stmt.where(CategoryStat.category_id == category_id)
+    sku_count, _, zero, low = (int(v) for v in db.execute(stmt).one())
+    threshold = get_settings().low_stock_threshold
+    return {
+        "category_id": category_id,
+        "low_stock_threshold": threshold,
+        "sku_count": sku_count,
+        "buckets": [
+            {"bucket": "zero", "min": 0, "max": 0, "count": zero},
+            {"bucket": "low", "min": 1, "max": threshold, "count": low},
+            {"bucket": "ok", "min": threshold + 1, "max": None, "count": sku_count - zero - low},
+        ],
+    }
@@ -0,0 +1,87 @@
+# app/services/row_version.py
+# 목적: 행 version 컬럼 기반 낙관적 동시성 제어 (재고/카테고리 수정)
+# - 클라이언트는 단건 조회 응답의 ETag 를 If-Match 헤더로, 또는 version 을 바디로 돌려보냄
+#   · 단건 조회 ETag 는 행 version 이 앞자리 (재고 W/"3.2": 재고 version 3 + 카테고리 version 2, 카테고리 W/"2")
+#   · If-Match 는 태그의 앞자리만 비교 ("3", W/"3", 3 도 허용), 행 version 으로 읽을 수 없는 태그는 불일치(412)
+#   · 둘 다 없으면 기존처럼 마지막 쓰기 우선 (화면 스크립트 등 기존 호출 호환)
+# - 쓰기는 조건부 UPDATE 한 문장: SET ..., version = version + 1 WHERE id = ? AND version = ?
+#   · 잠금(SELECT ... FOR UPDATE) 없이 영향 행 수로 충돌 감지, 변경 후 값은 계산하므로 refresh 조회 없음
+# - 충돌 응답: If-Match 불일치는 412 Precondition Failed, 바디 version 불일치는 409 Conflict
+# - 변경 전 값은 잠금 없는 SELECT 로 읽고 그 version 을 조건으로 쓰므로, 부가 테이블(원장/카운터)에 넘기는 전/후 쌍이 항상 실제와 일치
+#   · 기대 version 이 없는 요청은 그 사이 다른 쓰기가 끼면 다시 읽어 재시도 (UPDATE_RETRIES 회)
+
+from typing import Any, Dict, NamedTuple, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+# 기대 version 없는 요청의 재시도 횟수
+UPDATE_RETRIES = 3
+
+
+class VersionConflict(Exception):
+    """조건부 UPDATE 충돌 (current: 알려진 현재 version, 모르면 None)"""
+
+    def __init__(self, current: Optional[int] = None):
+        super().__init__("version conflict")
+        self.current = current
+
+
+class Expected(NamedTuple):
+    """요청이 기대하는 version + 출처 (If-Match 헤더면 True)"""
+    version: Optional[int]
+    from_header: bool
+
+
+# 어떤 행 version 과도 일치하지 않는 If-Match (목록용 변경 토큰 등)
+NO_MATCH = -1
+
+
+def etag(version: int, *parts: int) -> str:
+    """단건 조회 약한 ETag (행 version + 응답에 섞인 다른 행 version)"""
+    return 'W/"' + ".".join(str(v) for v in (version, *parts)) + '"'
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    """If-Match 값 → 기대 version ("*" 또는 없음은 None, 행 version 태그가 없으면 NO_MATCH)"""
+    if value is None or value.strip() in ("", "*"):
+        return None
+    for tag in value.split(","):
+        head = tag.strip().removeprefix("W/").strip('"').split(".", 1)[0]
+        if head.isdigit():
+            return int(head)
+    return NO_MATCH
+
+
+def expected(if_match: Optional[str], body_version: Optional[int]) -> Expected:
+    """If-Match 헤더 우선, 없으면 바디 version"""
+    header_version = parse_if_match(if_match)
+    if header_version is not None:
+        return Expected(header_version, True)
+    return Expected(body_version, False)
+
+
+def check(exp: Expected, current: int) -> None:
+    """읽은 현재 version 이 기대와 다르면 충돌"""
+    if exp.version is not None and exp.version != current:
+        raise VersionConflict(current)
+
+
+def update_if(db: Session, model: Any, row_id: int, version: int, values: Dict[str, Any]) -> bool:
+    """id + version 조건부 UPDATE (version + 1 포함), 반영됐으면 True"""
+    result = db.execute(
+        update(model)
+        .where(model.id == row_id, model.version == version)
+        .values(**values, version=model.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def conflict_error(exc: VersionConflict, exp: Expected) -> HTTPException:
+    """충돌 → 412(If-Match) 또는 409(바디 version)"""
+    detail = "다른 요청이 먼저 수정함"
+    if exc.current is not None:
+        detail += f" (현재 version {exc.current})"
+    code = status.HTTP_412_PRECONDITION_FAILED if exp.from_header else status.HTTP_409_CONFLICT
+    return HTTPException(status_code=code, detail=detail)
@@ -0,0 +1,140 @@
+# app/services/search.py
+# 목적: 물품명 부분 문자열 검색용 n-gram 색인 유지/조회
+# - 물품명을 접기(fold) 후 연속 NGRAM_N 글자 조각으로 나눠 StockNameGrams 테이블에 역색인함
+# - '%kw%' 검색 시 키워드 조각을 모두 가진 재고만 후보로 좁힌 뒤 기존 ILIKE로 재확인함
+#   → 결과는 ILIKE와 동일, 스캔 범위는 후보 집합 크기로 제한됨
+# - 키워드가 NGRAM_N 글자 미만이거나 LIKE 특수문자 포함, 또는 설정 비활성 시 ILIKE 단독 폴백
+# - 접기 규칙은 DB 콜레이션이 같다고 보는 글자를 같은 문자열로 보내야 함 (좁으면 후보 누락)
+#   · 대소문자(casefold), 악센트(NFKD 후 결합 문자 제거), 호환 문자(전각 등, NFKD)
+#   · MySQL *_ai_ci 가 기본 글자와 같게 보는 획 글자(ø, đ, ł 등)는 표로 보충
+#   · 이보다 넓게 같다고 보는 콜레이션을 쓰면 SEARCH_NGRAM_ENABLED=false 로 ILIKE 단독 사용
+#   · 규칙을 바꾸면 기존 색인도 바꿔야 함 (새 마이그레이션 또는 rebuild-search-index)
+
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set, Tuple
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.stock import Stock
+from app.models.stock_name_gram import StockNameGram
+
+# 조각 길이: 한글 2음절 단어가 흔하므로 바이그램 사용함
+NGRAM_N = 2
+
+# LIKE 와일드카드/이스케이프 문자 (포함 시 조각 분해가 ILIKE 의미와 달라져 폴백함)
+_LIKE_SPECIAL = ("%", "_", "\\")
+
+
+def enabled() -> bool:
+    """n-gram 색인 사용 여부 (색인 테이블 없는 백엔드는 설정으로 끔)"""
+    return get_settings().search_ngram_enabled
+
+
+# 분해(NFKD)로 기본 글자가 나오지 않지만 악센트 무시 콜레이션이 기본 글자와 같게 보는 글자
+# (넓게 접는 쪽은 후보만 늘고 ILIKE 재확인으로 걸러지므로 안전함)
+_FOLD_EXTRA = {"ø": "o", "đ": "d", "ð": "d", "ł": "l", "ħ": "h", "ŧ": "t", "ı": "i", "æ": "ae", "œ": "oe"}
+
+
+@lru_cache(maxsize=8192)
+def _fold_char(ch: str) -> str:
+    base = "".join(c for c in unicodedata.normalize("NFKD", ch) if not unicodedata.combining(c))
+    # 한글 음절은 NFKD 로 자모가 되므로 NFC 로 다시 합침 (조각 단위를 음절로 유지)
+    base = unicodedata.normalize("NFC", base).casefold()
+    return "".join(_FOLD_EXTRA.get(c, c) for c in base)
+
+
+def fold(text: str) -> str:
+    """
+    검색 비교용 접기. 글자 단위로 접으므로 ILIKE로 일치하는 이름의 접힌 문자열은
+    접힌 키워드를 항상 포함함 (콜레이션이 같게 보는 글자가 같은 문자열로 접히는 한).
+    """
+    if text.isascii():
+        return text.lower()
+    return "".join(map(_fold_char, text))
+
+
+def name_grams(text: str) -> Set[str]:
+    """문자열 → 접힌 n-gram 집합"""
+    s = fold(text)
+    return {s[i:i + NGRAM_N] for i in range(len(s) - NGRAM_N + 1)}
+
+
+def _keyword_grams(keyword: str) -> Optional[Set[str]]:
+    # None 반환 시 색인 사용 불가 → ILIKE 폴백
+    if any(ch in keyword for ch in _LIKE_SPECIAL):
+        return None
+    return name_grams(keyword) or None
+
+
+def apply_keyword_filter(q, keyword: str):
+    """
+    Query/Select 에 이름 부분 일치 조건 적용함.
+    색인 사용 가능 시 후보 id 서브쿼리 + ILIKE 재확인, 아니면 ILIKE 단독.
+    """
+    grams = _keyword_grams(keyword) if enabled() else None
+    if grams:
+        # (gram, stock_id) PK라 count()가 곧 일치한 조각 종류 수
+        candidates = (
+            select(StockNameGram.stock_id)
+            .where(StockNameGram.gram.in_(sorted(grams)))
+            .group_by(StockNameGram.stock_id)
+            .having(func.count() == len(grams))
+        )
+        q = q.filter(Stock.id.in_(candidates))
+    return q.filter(Stock.name.ilike(f"%{keyword}%"))
+
+
+# ----------------------------------------------------------
+# 색인 유지 (재고 생성/수정/삭제 경로에서 같은 트랜잭션으로 호출)
+# ----------------------------------------------------------
+def index_names(db: Session, rows: Iterable[Tuple[int, str]]) -> None:
+    """(stock_id, name) 목록의 조각을 executemany 한 번으로 추가함"""
+    if not enabled():
+        return
+    # PK 순서로 정렬해 넣으면 B-tree 페이지를 순차적으로 채워 삽입 비용이 줄어듦
+    params = sorted((g, stock_id) for stock_id, name in rows for g in name_grams(name))
+    if not params:
+        return
+    # 행 수가 이름 길이 × 재고 수만큼 많으므로 문장을 한 번만 컴파일해 드라이버 executemany 직접 호출
+    # (행별 파라미터 처리 비용이 대량 가져오기의 대부분이었음)
+    conn = db.connection()
+    compiled = insert(StockNameGram.__table__).compile(dialect=conn.dialect)
+    if not conn.dialect.positional:
+        params = [dict(zip(("gram", "stock_id"), p)) for p in params]
+    conn.exec_driver_sql(str(compiled), params)
+
+
+def unindex(db: Session, stock_ids: List[int]) -> None:
+    """재고 id 목록의 조각 전부 삭제함"""
+    if not enabled() or not stock_ids:
+        return
+    db.execute(delete(StockNameGram).where(StockNameGram.stock_id.in_(stock_ids)))
+
+
+def reindex(db: Session, rows: List[Tuple[int, str]]) -> None:
+    """이름 변경된 재고의 조각 교체함"""
+    unindex(db, [stock_id for stock_id, _ in rows])
+    index_names(db, rows)
+
+
+def rebuild_index(db: Session, chunk_size: int = 1000) -> int:
+    """
+    색인 전체 재구축함 (설정 재활성화/복구용).
+    재고를 id 키셋으로 chunk_size 건씩 읽으며 채움. 처리한 재고 수 반환.
+    (같은 연결에서 쓰기와 섞이므로 서버 사이드 커서 대신 키셋 청크 사용)
+    """
+    db.execute(delete(StockNameGram))
+    total, last_id = 0, 0
+    while True:
+        chunk = db.execute(
+            select(Stock.id, Stock.name).where(Stock.id > last_id).order_by(Stock.id).limit(chunk_size)
+        ).all()
+        if not chunk:
+            break
+        index_names(db, chunk)
+        total += len(chunk)
+        last_id = chunk[-1][0]
+    db.commit()
+    return total
@@ -0,0 +1,112 @@
+# app/services/stock_bulk.py
+# 목적: 재고 일괄 쓰기 (executemany 청크 단위, 호출자 트랜잭션 안에서 실행)
+# - 일괄 API(/api/stocks/bulk)와 CSV 가져오기가 공용으로 사용함
+# - 부가 테이블(색인/카운터 등)은 stock_sync로 한 번에 반영함
+# - 수정은 읽은 행 version 을 조건으로 쓰고 version + 1 (사이에 다른 쓰기가 끼면 VersionConflict)
+# - 커밋은 호출자 책임
+
+from typing import Dict, Iterable, List, Sequence, Set
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.stock import Stock
+from app.services import category_cache, stock_sync
+from app.services.row_version import VersionConflict
+from app.services.stock_sync import StockRow
+
+
+def _chunks(seq: Sequence, size: int) -> Iterable[Sequence]:
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
+def valid_category_ids(db: Session, category_ids: Set[int]) -> Set[int]:
+    """존재하는 카테고리 id만 반환 (카테고리 캐시, 미스만 IN 조회 한 번)"""
+    return category_cache.existing_ids(db, category_ids)
+
+
+def fetch_rows(db: Session, stock_ids: Iterable[int]) -> Dict[int, StockRow]:
+    """id 목록의 현재 행을 청크 단위 IN 조회로 읽음"""
+    ids = list(set(stock_ids))
+    rows: Dict[int, StockRow] = {}
+    for chunk in _chunks(ids, get_settings().bulk_chunk_size):
+        for r in db.execute(
+            select(Stock.id, Stock.name, Stock.inventory, Stock.category_id, Stock.version).where(
+                Stock.id.in_(chunk)
+            )
+        ):
+            rows[r.id] = StockRow(*r)
+    return rows
+
+
+def insert_rows(db: Session, items: List[dict]) -> List[int]:
+    """
+    {"name", "inventory", "category_id"} 목록을 청크별 executemany 로 추가함.
+    요청 순서대로 생성된 id 목록 반환.
+    - RETURNING 으로 생성 행을 그대로 받아 부가 테이블에 반영
+    - 자동증가 id는 한 INSERT 문 안에서 행 순서대로 증가하므로 id 정렬 = 요청 순서
+      (sort_by_parameter_order 는 SQLite에서 행별 INSERT로 떨어져 쓰지 않음)
+    - RETURNING 미지원 백엔드(MySQL 등)는 ORM flush 로 폴백 (행별 INSERT)
+    """
+    ids: List[int] = []
+    dialect = db.get_bind().dialect
+    for chunk in _chunks(items, get_settings().bulk_chunk_size):
+        if dialect.insert_executemany_returning:
+            result = db.execute(
+                insert(Stock).returning(Stock.id, Stock.name, Stock.inventory, Stock.category_id, Stock.version),
+                list(chunk),
+            )
+            rows = sorted((StockRow(*r) for r in result), key=lambda r: r.id)
+        else:
+            objs = [Stock(**item) for item in chunk]
+            db.add_all(objs)
+            db.flush()
+            rows = [stock_sync.row_of(o) for o in objs]
+        stock_sync.after_insert(db, rows)
+        ids.extend(r.id for r in rows)
+    return ids
+
+
+def update_rows(db: Session, changes: List[tuple]) -> None:
+    """
+    (변경 전, 변경 후) StockRow 쌍을 executemany UPDATE 로 반영함.
+    변경 전 version 을 조건으로 쓰고 1 올림, 영향 행 수가 모자라면 VersionConflict (호출자가 롤백)
+    (executemany 영향 행 수를 믿을 수 없는 드라이버는 확인 생략)
+    """
+    t = Stock.__table__
+    stmt = (
+        update(t)
+        .where(t.c.id == bindparam("b_id"), t.c.version == bindparam("b_version"))
+        .values(
+            name=bindparam("b_name"),
+            inventory=bindparam("b_inventory"),
+            category_id=bindparam("b_category_id"),
+            version=t.c.version + 1,
+        )
+    )
+    checked = db.get_bind().dialect.supports_sane_multi_rowcount
+    for chunk in _chunks(changes, get_settings().bulk_chunk_size):
+        result = db.execute(
+            stmt,
+            [
+                {
+                    "b_id": new.id,
+                    "b_version": old.version,
+                    "b_name": new.name,
+                    "b_inventory": new.inventory,
+                    "b_category_id": new.category_id,
+                }
+                for old, new in chunk
+            ],
+        )
+        if checked and result.rowcount != len(chunk):
+            raise VersionConflict()
+        stock_sync.after_update(db, [(old, new._replace(version=old.version + 1)) for old, new in chunk])
+
+
+def delete_rows(db: Session, rows: List[StockRow]) -> None:
+    """행 목록을 청크별 IN 삭제함 (부가 테이블 먼저 정리)"""
+    for chunk in _chunks(rows, get_settings().bulk_chunk_size):
+        stock_sync.after_delete(db, chunk)
+        db.execute(delete(Stock).where(Stock.id.in_([r.id for r in chunk])))
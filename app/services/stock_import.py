@@ -0,0 +1,134 @@
+# app/services/stock_import.py
+# 목적: CSV 스트리밍 재고 가져오기
+# - 파일을 한 줄씩 파싱하며 chunk_size 건씩 모아 stock_bulk.insert_rows 로 추가, 청크마다 커밋
+# - 카테고리 이름/id 는 카테고리 캐시로 해석, 가져오기 한 번 동안은 결과(없음 포함)를 로컬 사전에 메모
+# - 잘못된 줄은 줄번호와 사유를 기록하고 계속 진행 (오류 목록은 max_errors 까지만 보관)
+# - 메모리는 청크 크기 + 오류 상한에만 비례 (파일 크기와 무관)
+#
+# CSV 형식 (첫 줄 헤더 필수, UTF-8/BOM 허용)
+#   name,inventory,category          ← category: 카테고리 이름
+#   name,inventory,category_id       ← 또는 카테고리 id
+#   (내보내기 CSV의 category_name 열도 카테고리 이름으로 인식)
+
+import csv
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.services import category_cache, stock_bulk
+
+# 카테고리 이름 열로 인식하는 헤더
+_CATEGORY_NAME_COLUMNS = ("category", "category_name")
+
+
+def _parse_row(
+    row: Dict[str, Optional[str]],
+    by_name: Callable[[str], Optional[int]],
+    valid_id: Callable[[int], bool],
+) -> Tuple[Optional[dict], Optional[str]]:
+    """CSV 한 줄 → (insert 파라미터, 오류 사유)"""
+    name = (row.get("name") or "").strip()
+    if not name or len(name) > 200:
+        return None, "name은 1~200자여야 함"
+
+    try:
+        inventory = int((row.get("inventory") or "0").strip())
+    except ValueError:
+        return None, "inventory는 정수여야 함"
+    if inventory < 0:
+        return None, "inventory는 0 이상이어야 함"
+
+    raw_id = (row.get("category_id") or "").strip()
+    if raw_id:
+        try:
+            category_id = int(raw_id)
+        except ValueError:
+            return None, "category_id는 정수여야 함"
+        if not valid_id(category_id):
+            return None, f"존재하지 않는 category_id: {category_id}"
+    else:
+        cat_name = next(((row.get(c) or "").strip() for c in _CATEGORY_NAME_COLUMNS if row.get(c)), "")
+        if not cat_name:
+            return None, "category 또는 category_id 필요"
+        category_id = by_name(cat_name)
+        if category_id is None:
+            return None, f"존재하지 않는 카테고리: {cat_name}"
+
+    return {"name": name, "inventory": inventory, "category_id": category_id}, None
+
+
+def import_csv(
+    db: Session,
+    lines: Iterable[str],
+    chunk_size: Optional[int] = None,
+    max_errors: int = 1000,
+) -> Dict[str, Any]:
+    """
+    텍스트 줄 스트림(파일 객체 등)을 읽어 재고 추가함.
+    반환: { inserted, failed, errors: [{line, error}], errors_truncated }
+    """
+    chunk_size = chunk_size or get_settings().bulk_chunk_size
+
+    # 카테고리 해석 메모 (없는 이름/id도 기억해 잘못된 줄마다 DB를 다시 보지 않음)
+    names: Dict[str, Optional[int]] = {}
+    ids: Dict[int, bool] = {}
+
+    def by_name(name: str) -> Optional[int]:
+        if name not in names:
+            names[name] = category_cache.get_id(db, name)
+        return names[name]
+
+    def valid_id(category_id: int) -> bool:
+        if category_id not in ids:
+            ids[category_id] = category_cache.get_name(db, category_id) is not None
+        return ids[category_id]
+
+    inserted = failed = 0
+    errors: List[Dict[str, Any]] = []
+
+    def record(line: int, message: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append({"line": line, "error": message})
+
+    chunk: List[dict] = []
+    chunk_lines: List[int] = []
+
+    def flush() -> None:
+        nonlocal inserted
+        if not chunk:
+            return
+        try:
+            stock_bulk.insert_rows(db, chunk)
+            db.commit()
+            inserted += len(chunk)
+        except Exception as exc:
+            # 청크 단위 실패: 해당 줄만 실패 처리하고 다음 청크 계속
+            db.rollback()
+            for line in chunk_lines:
+                record(line, f"저장 실패: {type(exc).__name__}")
+        chunk.clear()
+        chunk_lines.clear()
+
+    reader = csv.DictReader(lines)
+    if not reader.fieldnames or "name" not in reader.fieldnames:
+        raise ValueError("CSV 헤더에 name 열이 필요함")
+
+    for row in reader:
+        params, error = _parse_row(row, by_name, valid_id)
+        if error:
+            record(reader.line_num, error)
+            continue
+        chunk.append(params)
+        chunk_lines.append(reader.line_num)
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    return {
+        "inserted": inserted,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }
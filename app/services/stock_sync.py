@@ -0,0 +1,85 @@
+# app/services/stock_sync.py
+# 목적: 재고 쓰기 경로의 부가 테이블 동기화 단일 창구
+# - 생성/수정/삭제 핸들러는 행을 바꾼 직후(커밋 전) 여기 함수만 호출함
+# - 검색 색인, 카테고리 집계(건수/수량/품절·부족), 창고별 수량, 수량 변동 원장, 변경 피드(ETag 토큰 겸용) 등 파생 데이터가 같은 트랜잭션에서 함께 반영됨
+#   · 창고별 수량: 창고 지정 증감이 이미 반영한 분량(placed)을 뺀 나머지를 창고 미지정 변화로 반영 (app/services/locations.py)
+# - /stocks 화면 캐시는 커밋 직후 프로세스 내 무효화 (재검증은 변경 카운터 태그로)
+
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session
+
+from app.services import change_feed, counts, ledger, locations, page_cache, search
+
+
+# 재고 행 스냅샷 (ORM 객체 대신 값으로 전달해 일괄 경로와 공용)
+class StockRow(NamedTuple):
+    id: int
+    name: str
+    inventory: int
+    category_id: int
+    version: int = 1   # 행 버전 (버전을 다루지 않는 경로는 기본값)
+
+
+def row_of(obj) -> StockRow:
+    """ORM Stock → StockRow"""
+    return StockRow(obj.id, obj.name, obj.inventory, obj.category_id, obj.version)
+
+
+def _changed(db: Session) -> None:
+    """재고 변경 신호 (화면 캐시, 커밋 직후 무효화. ETag 토큰은 변경 피드 이벤트에서 유도)"""
+    page_cache.invalidate_on_commit(db)
+
+
+def after_insert(db: Session, rows: Sequence[StockRow]) -> None:
+    """새 재고 반영 (id 확정 후 호출)"""
+    search.index_names(db, [(r.id, r.name) for r in rows])
+
+    counts.apply_deltas(db, counts.rollup_deltas(added=[(r.category_id, r.inventory) for r in rows]))
+
+    locations.place(db, rows)
+    ledger.record(db, [(r.id, r.inventory) for r in rows], "create")
+    change_feed.record_stocks(db, change_feed.CREATE, [(r, None) for r in rows])
+    if rows:
+        _changed(db)
+
+
+def after_update(
+    db: Session,
+    changes: Sequence[Tuple[StockRow, StockRow]],
+    reason: str = "update",
+    placed: Optional[Dict[int, int]] = None,
+) -> None:
+    """(변경 전, 변경 후) 쌍 반영 (reason: 원장 변동 사유, placed: 창고 행에 이미 반영한 재고별 수량)"""
+    search.reindex(db, [(new.id, new.name) for old, new in changes if old.name != new.name])
+
+    # 카테고리/수량이 바뀐 재고만 집계 이동 (변경 전 값 제거 + 변경 후 값 추가)
+    moved = [(old, new) for old, new in changes if (old.category_id, old.inventory) != (new.category_id, new.inventory)]
+    counts.apply_deltas(db, counts.rollup_deltas(
+        added=[(new.category_id, new.inventory) for _, new in moved],
+        removed=[(old.category_id, old.inventory) for old, _ in moved],
+    ))
+
+    locations.recategorize(db, [(new.id, new.category_id) for old, new in changes if old.category_id != new.category_id])
+    placed = placed or {}
+    locations.apply_unscoped(db, [(new, new.inventory - old.inventory - placed.get(new.id, 0)) for old, new in changes])
+    ledger.record(db, [(new.id, new.inventory - old.inventory) for old, new in changes], reason)
+    change_feed.record_stocks(
+        db,
+        change_feed.ADJUST if reason == "adjust" else change_feed.UPDATE,
+        [(new, old.category_id if old.category_id != new.category_id else None) for old, new in changes if old != new],
+    )
+    if changes:
+        _changed(db)
+
+
+def after_delete(db: Session, rows: Sequence[StockRow]) -> None:
+    """삭제될 재고 반영 (행 삭제 전 호출: 색인 FK 선삭제)"""
+    search.unindex(db, [r.id for r in rows])
+    locations.remove(db, [r.id for r in rows])
+
+    counts.apply_deltas(db, counts.rollup_deltas(removed=[(r.category_id, r.inventory) for r in rows]), pending=True)
+
+    ledger.record(db, [(r.id, -r.inventory) for r in rows], "delete")
+    change_feed.record_stocks(db, change_feed.DELETE, [(r, None) for r in rows])
+    if rows:
+        _changed(db)
@@ -0,0 +1,79 @@
+# app/services/versions.py
+# 목적: 변경 토큰 기반 조건부 GET (약한 ETag / 304)
+# - 재고: 추가 전용 변경 피드(StockEvents, app/services/change_feed.py)에서 유도, 제자리 갱신 없음
+#   · 모든 재고 쓰기가 stock_sync 훅에서 같은 트랜잭션으로 이벤트를 남기므로 별도 카운터 행을 잠그지 않음
+#     (전역 단일 행 UPDATE 는 MySQL 에서 모든 재고 쓰기를 커밋까지 한 줄로 세움)
+#   · 토큰 = 최대 id + 최근 RECENT_WINDOW 구간의 행 수
+#     id 는 커밋 순서대로 보이지 않으므로(InnoDB), 작은 id 가 늦게 커밋돼 최대 id 가 그대로여도 행 수가 바뀜
+# - 카테고리: 테이블 변경 카운터(TableVersions) 행, 쓰기 경로가 커밋 전에 bump (카테고리 쓰기는 드물어 경합 없음)
+# - etag: PK 범위/PK 조회만으로 태그 생성 → 일치하면 페이지 쿼리 없이 304
+# - 토큰을 먼저 읽고 본문을 읽으므로, 그 사이 쓰기가 끼면 태그가 본문보다 낡음 (다음 요청에서 갱신, 안전한 방향)
+# - 재고 응답은 category_name 을 포함하므로 재고 태그에 카테고리 카운터도 섞음
+
+from typing import Dict, Optional
+from fastapi import Response
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.stock_event import StockEvent
+from app.models.table_version import TableVersion
+
+STOCKS = "Stocks"
+CATEGORIES = "Category"
+
+# 재고 토큰에서 행 수를 세는 최근 id 구간 (늦은 커밋 감지 범위, PK 범위 COUNT 비용 상한)
+RECENT_WINDOW = 1024
+
+
+def bump(db: Session, table_name: str) -> None:
+    """테이블 변경 카운터 1 증가 (행이 없으면 생성, 카테고리 쓰기 경로용)"""
+    result = db.execute(
+        update(TableVersion)
+        .where(TableVersion.table_name == table_name)
+        .values(version=TableVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.execute(insert(TableVersion).values(table_name=table_name, version=1))
+
+
+_newest = select(func.max(StockEvent.id)).scalar_subquery()
+_STOCKS_TOKEN = select(func.count(), func.max(StockEvent.id)).where(StockEvent.id > _newest - RECENT_WINDOW)
+
+
+def stocks_token(db: Session) -> str:
+    """재고 변경 토큰 (변경 피드 최대 id + 최근 구간 행 수, 비어 있으면 "0")"""
+    recent, hi = db.execute(_STOCKS_TOKEN).one()
+    return f"{hi}.{recent}" if hi else "0"
+
+
+def current(db: Session) -> Dict[str, int]:
+    """{테이블 이름: 카운터} (TableVersions)"""
+    return dict(db.execute(select(TableVersion.table_name, TableVersion.version)).all())
+
+
+def etag(db: Session, *table_names: str) -> str:
+    """지정 테이블 토큰들로 약한 ETag 생성"""
+    counters = current(db) if any(t != STOCKS for t in table_names) else {}
+    tokens = [stocks_token(db) if t == STOCKS else counters.get(t, 0) for t in table_names]
+    return 'W/"' + "-".join(f"{t[0].lower()}{v}" for t, v in zip(table_names, tokens)) + '"'
+
+
+def matches(if_none_match: Optional[str], tag: str) -> bool:
+    """If-None-Match 값이 태그와 약한 비교로 일치하는지"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = tag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == bare for t in if_none_match.split(","))
+
+
+def not_modified(tag: str) -> Response:
+    """304 응답 (본문 없음)"""
+    return Response(status_code=304, headers={"ETag": tag, "Cache-Control": "no-cache"})
+
+
+def set_headers(response: Response, tag: str) -> None:
+    """200 응답에 태그 부착 (no-cache: 브라우저가 매번 If-None-Match 로 재검증)"""
+    response.headers["ETag"] = tag
+    response.headers["Cache-Control"] = "no-cache"
@@ -1,5 +1,5 @@
 // 상품 목록 페이지 JS 컨트롤러
-// 역할: API 연동, 검색·필터·페이지 이동, 정렬, 토스트 호출
+// 역할: API 연동, 검색·필터·페이지 이동, 정렬, 토스트 호출, 실시간 변경 반영
 
 document.addEventListener("DOMContentLoaded", () => {
   const tableBody = document.getElementById("stocksTbody");
@@ -19,16 +19,21 @@ document.addEventListener("DOMContentLoaded", () => {
   const pageSize = 20;
   let totalPages = 1;
   let currentSort = { field: "id", order: "desc" };
+  // 키셋 커서 (서버 응답의 next_cursor / prev_cursor)
+  let nextCursor = null;
+  let prevCursor = null;
 
   // ==============================
   // API 호출 (목록/검색)
+  //  - cursor 지정 시 키셋 모드로 조회 (page는 화면 표시용으로만 유지)
   // ==============================
-  async function fetchStocks(page = 1) {
+  async function fetchStocks(page = 1, cursor = null) {
     const params = new URLSearchParams({
-      page,
       size: pageSize,
       sort: `${currentSort.field}:${currentSort.order}`,
     });
+    if (cursor) params.set("cursor", cursor);
+    else params.set("page", page);
 
     const categoryId = categorySelect.value;
     const keyword = keywordInput.value.trim();
@@ -45,7 +50,14 @@ document.addEventListener("DOMContentLoaded", () => {
       if (!res.ok) throw new Error(`HTTP ${res.status}`);
       const data = await res.json();
       renderTable(data.items || []);
-      updatePagination(data.page, data.total_pages);
+      nextCursor = data.next_cursor || null;
+      prevCursor = data.prev_cursor || null;
+      // 키셋 모드 응답에는 page/total_pages 없음 → 기존 값 유지
+      updatePagination(data.page ?? page, data.total_pages ?? totalPages);
+      // 키워드 검색 총건수가 상한에서 잘린 경우 "+" 표시
+      if (data.total_capped) pageInfo.textContent += "+";
+      // 변경 피드 구독 (카테고리 필터가 바뀌었을 때만 다시 연결)
+      connectFeed();
     } catch (err) {
       console.error("목록 조회 실패:", err);
       showToast("데이터를 불러오지 못했습니다.", "error");
@@ -63,18 +75,111 @@ document.addEventListener("DOMContentLoaded", () => {
     }
 
     for (const s of items) {
-      const row = document.createElement("tr");
-      row.innerHTML = `
-        <td>${s.id}</td>
-        <td>${escapeHtml(s.name)}</td>
-        <td>${s.inventory}</td>
-        <td>${escapeHtml(s.category_name || "-")}</td>
-        <td>
-          <button data-id="${s.id}" class="btn-edit">수정</button>
-          <button data-id="${s.id}" class="btn-delete">삭제</button>
-        </td>
-      `;
-      tableBody.appendChild(row);
+      tableBody.appendChild(buildRow(s));
+    }
+  }
+
+  // 행 하나 생성 (변경 피드가 id로 찾아 고칠 수 있게 data-id / data-category-id 부여)
+  function buildRow(s) {
+    const row = document.createElement("tr");
+    row.dataset.id = s.id;
+    row.dataset.categoryId = s.category_id;
+    row.innerHTML = `
+      <td>${s.id}</td>
+      <td>${escapeHtml(s.name)}</td>
+      <td>${s.inventory}</td>
+      <td>${escapeHtml(s.category_name || "-")}</td>
+      <td>
+        <button data-id="${s.id}" class="btn-edit">수정</button>
+        <button data-id="${s.id}" class="btn-delete">삭제</button>
+      </td>
+    `;
+    return row;
+  }
+
+  // ==============================
+  // 실시간 변경 피드 (SSE: data-endpoint-events)
+  //  - 화면에 보이는 행만 제자리 갱신/제거 (목록 재조회 없음)
+  //  - 새 상품은 기본 정렬(id:desc) 첫 페이지 + 키워드 없음일 때만 맨 위에 추가
+  //  - 연결이 끊기면 EventSource 가 Last-Event-ID 로 이어받음, reset 이면 현재 페이지 재조회
+  // ==============================
+  const feedUrl = table.dataset.endpointEvents;
+  let feed = null;
+  let feedCategory = null;
+
+  function connectFeed() {
+    if (!feedUrl || typeof EventSource === "undefined") return;
+    const categoryId = categorySelect.value || "";
+    if (feed && feedCategory === categoryId) return;
+    if (feed) feed.close();
+    feedCategory = categoryId;
+    feed = new EventSource(categoryId ? `${feedUrl}?categoryId=${encodeURIComponent(categoryId)}` : feedUrl);
+    feed.onmessage = (e) => {
+      try {
+        applyChange(JSON.parse(e.data));
+      } catch (err) {
+        console.error("변경 이벤트 처리 실패:", err);
+      }
+    };
+  }
+
+  function findRow(id) {
+    return tableBody.querySelector(`tr[data-id="${id}"]`);
+  }
+
+  function fillRow(row, s) {
+    row.dataset.categoryId = s.category_id;
+    row.cells[1].textContent = s.name;
+    row.cells[2].textContent = s.inventory;
+    row.cells[3].textContent = s.category_name || "-";
+    // 바뀐 행 잠깐 강조
+    row.style.transition = "background-color .6s ease";
+    row.style.backgroundColor = "#fff3cd";
+    setTimeout(() => { row.style.backgroundColor = ""; }, 600);
+  }
+
+  function applyChange(ev) {
+    const filterId = categorySelect.value ? Number(categorySelect.value) : null;
+
+    switch (ev.type) {
+      case "update":
+      case "adjust": {
+        const row = findRow(ev.stock.id);
+        if (!row) return;
+        // 다른 카테고리로 옮겨져 현재 필터에서 벗어난 행은 제거
+        if (filterId !== null && ev.stock.category_id !== filterId) row.remove();
+        else fillRow(row, ev.stock);
+        return;
+      }
+      case "delete": {
+        const row = findRow(ev.stock.id);
+        if (row) row.remove();
+        return;
+      }
+      case "create": {
+        const s = ev.stock;
+        const isDefaultView = currentPage === 1 && currentSort.field === "id" && currentSort.order === "desc"
+          && !keywordInput.value.trim();
+        if (!isDefaultView || findRow(s.id)) return;
+        if (filterId !== null && s.category_id !== filterId) return;
+        if (!tableBody.querySelector("tr[data-id]")) tableBody.innerHTML = "";
+        const row = buildRow(s);
+        tableBody.prepend(row);
+        fillRow(row, s);
+        while (tableBody.rows.length > pageSize) tableBody.lastElementChild.remove();
+        return;
+      }
+      case "category_update": {
+        tableBody.querySelectorAll(`tr[data-category-id="${ev.category.id}"]`).forEach(row => {
+          row.cells[3].textContent = ev.category.name;
+        });
+        const opt = [...categorySelect.options].find(o => o.value === String(ev.category.id));
+        if (opt) opt.textContent = ev.category.name;
+        return;
+      }
+      case "reset":
+        fetchStocks(currentPage);
+        return;
     }
   }
 
@@ -86,8 +191,8 @@ document.addEventListener("DOMContentLoaded", () => {
     totalPages = total;
     pageInfo.textContent = `${page} / ${total}`;
     document.getElementById("firstPage").disabled = page <= 1;
-    document.getElementById("prevPage").disabled = page <= 1;
-    document.getElementById("nextPage").disabled = page >= total;
+    document.getElementById("prevPage").disabled = page <= 1 && !prevCursor;
+    document.getElementById("nextPage").disabled = page >= total && !nextCursor;
     document.getElementById("lastPage").disabled = page >= total;
   }
 
@@ -119,7 +224,9 @@ document.addEventListener("DOMContentLoaded", () => {
   // 이벤트: 페이지 이동
   // ==============================
   // 페이지 이동을 한곳에서 처리함
-  const goPage = (p) => {
+  // - 이전/다음은 커서가 있으면 키셋 모드로 이동 (깊은 페이지도 OFFSET 비용 없음)
+  // - 처음/끝은 페이지 번호로 이동
+  const goPage = (p, cursor = null) => {
     const sortStr = `${currentSort.field}:${currentSort.order}`;
     updateUrl({
       categoryId: categorySelect.value || "",
@@ -127,12 +234,12 @@ document.addEventListener("DOMContentLoaded", () => {
       page: p,
       sort: sortStr,
     });
-    fetchStocks(p);
+    fetchStocks(p, cursor);
   };
 
   document.getElementById("firstPage").onclick = () => goPage(1);
-  document.getElementById("prevPage").onclick  = () => goPage(Math.max(1, currentPage - 1));
-  document.getElementById("nextPage").onclick  = () => goPage(Math.min(totalPages, currentPage + 1));
+  document.getElementById("prevPage").onclick  = () => goPage(Math.max(1, currentPage - 1), prevCursor);
+  document.getElementById("nextPage").onclick  = () => goPage(Math.min(totalPages, currentPage + 1), nextCursor);
   document.getElementById("lastPage").onclick  = () => goPage(totalPages);
 
   // ==============================
@@ -0,0 +1,5 @@
+# benchmarks/__init__.py
+# 재고/카테고리 엔드포인트 성능 측정 패키지
+# - dataset.py: 합성 창고 데이터(한글/영문 물품명) 시드 (app/models 테이블 + 파생 데이터 재구축)
+# - scenarios.py: 앱을 프로세스 안에서(ASGI) 직접 호출하는 측정 시나리오
+# - __main__.py: python -m benchmarks run / compare
@@ -0,0 +1,214 @@
+# benchmarks/__main__.py
+# 사용:
+#   python -m benchmarks run [--stocks 1000000 --categories 1000] [--requests 200 --concurrency 8] [--out result.json]
+#   python -m benchmarks compare baseline.json current.json [--threshold 0.15]
+#   python -m benchmarks group-commit [--ops 400 --concurrency 1,8,32,128 --windows 2,5,10] [--out result.json]
+#
+# - run: SQLite 파일(--db, 기본 ./bench.db)에 시드 후 시나리오 실행, 결과 JSON 출력(--out 이 있으면 파일에도 저장)
+#   · 같은 크기/seed 로 시드된 파일이 있으면 재사용 (--reseed 로 강제)
+#   · --async 는 DB_ASYNC=true 모드로 측정
+#   · --sqlite-profile wal 은 SQLITE_PROFILE=wal (WAL + 단일 쓰기 연결/읽기 전용 풀) 로 측정, 기본은 default
+# - compare: 두 결과의 시나리오별 p95/처리량 비교, 임계값 넘는 회귀가 있으면 종료 코드 1
+# - group-commit: 수량 증감 요청별 커밋 vs 묶음 커밋의 처리량/커밋 수/지연을 동시 요청 수별로 비교
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _prepare_env(args: argparse.Namespace) -> str:
+    url = f"sqlite:///{os.path.abspath(args.db)}"
+    # 앱 임포트 전에 연결/모드 설정 (엔진은 임포트 시 생성됨)
+    os.environ["SQLALCHEMY_DATABASE_URL"] = url
+    os.environ["DB_ASYNC"] = "true" if args.use_async else "false"
+    os.environ["SQLITE_PROFILE"] = args.sqlite_profile
+    os.environ.setdefault("METRICS_ENABLED", "false")
+    return url
+
+
+def _meta(args: argparse.Namespace, seed_meta: Dict[str, Any]) -> Dict[str, Any]:
+    import sqlalchemy
+
+    return {
+        "git_rev": _git_rev(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "db_mode": "async" if args.use_async else "sync",
+        "sqlite_profile": args.sqlite_profile,
+        "dataset": seed_meta,
+    }
+
+
+def _emit(report: Dict[str, Any], out: str) -> None:
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    print(text)
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    url = _prepare_env(args)
+
+    import asyncio
+
+    import httpx
+
+    from benchmarks import dataset, scenarios
+
+    print(f"시드 준비: 카테고리 {args.categories}, 재고 {args.stocks} ...", file=sys.stderr)
+    seed_meta = dataset.seed(url, args.categories, args.stocks, seed_value=args.seed, force=args.reseed)
+    print(f"시드 완료 ({'재사용' if seed_meta['reused'] else str(seed_meta['seed_seconds']) + 's'})", file=sys.stderr)
+
+    from app.main import app
+
+    names: List[str] = args.scenarios.split(",") if args.scenarios else list(scenarios.SCENARIOS)
+    unknown = [n for n in names if n not in scenarios.SCENARIOS]
+    if unknown:
+        print(f"알 수 없는 시나리오: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    async def main() -> Dict[str, Any]:
+        ctx = scenarios.Context(stocks=args.stocks, categories=args.categories, size=args.size)
+        transport = httpx.ASGITransport(app=app)
+        results: Dict[str, Any] = {}
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await scenarios.prepare(client, ctx)
+            for name in names:
+                print(f"  {name} ...", file=sys.stderr)
+                results[name] = await scenarios.run_scenario(
+                    client, name, ctx, args.requests, args.concurrency, args.seed, warmup=args.warmup
+                )
+        return results
+
+    results = asyncio.run(main())
+    meta = _meta(args, seed_meta)
+    meta.update(requests_per_scenario=args.requests, concurrency=args.concurrency, page_size=args.size)
+    _emit({"meta": meta, "scenarios": results}, args.out)
+    return 1 if any(r["errors"] for r in results.values()) else 0
+
+
+def _cmd_group_commit(args: argparse.Namespace) -> int:
+    url = _prepare_env(args)
+
+    import asyncio
+
+    import httpx
+
+    from benchmarks import dataset, group_commit
+
+    print(f"시드 준비: 카테고리 {args.categories}, 재고 {args.stocks} ...", file=sys.stderr)
+    seed_meta = dataset.seed(url, args.categories, args.stocks, seed_value=args.seed, force=args.reseed)
+
+    from app.main import app
+
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+    windows = [float(w) for w in args.windows.split(",") if w]
+    # 핫 재고: 시드 id 는 1부터 연속
+    stock_ids = list(range(1, min(args.hot, args.stocks) + 1))
+
+    async def main() -> Dict[str, Any]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await group_commit.sweep(client, stock_ids, args.ops, levels, windows, args.seed)
+
+    results = asyncio.run(main())
+    meta = _meta(args, seed_meta)
+    meta.update(ops_per_run=args.ops, hot_stocks=len(stock_ids))
+    _emit({"meta": meta, "group_commit": results}, args.out)
+
+    print(f"{'mode':14} {'conc':>5} {'ops/s':>9} {'commits/s':>10} {'ops/commit':>10} {'p50':>8} {'p95':>8} {'p99':>8}", file=sys.stderr)
+    for label, by_level in results.items():
+        for level, r in by_level.items():
+            lat = r["latency_ms"]
+            print(
+                f"{label:14} {level:>5} {r['ops_per_s']:9.1f} {r['commits_per_s']:10.1f} "
+                f"{r['ops_per_commit'] or 0:10.2f} {lat['p50']:8.2f} {lat['p95']:8.2f} {lat['p99']:8.2f}",
+                file=sys.stderr,
+            )
+    return 1 if any(r["errors"] for by_level in results.values() for r in by_level.values()) else 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding="utf-8") as f:
+        base = json.load(f)["scenarios"]
+    with open(args.current, encoding="utf-8") as f:
+        cur = json.load(f)["scenarios"]
+
+    regressed = False
+    print(f"{'scenario':28} {'p95 base':>10} {'p95 now':>10} {'Δp95':>8} {'rps base':>10} {'rps now':>10} {'Δrps':>8}")
+    for name in [n for n in base if n in cur]:
+        b, c = base[name], cur[name]
+        bp, cp = b["latency_ms"]["p95"], c["latency_ms"]["p95"]
+        br, cr = b["throughput_rps"], c["throughput_rps"]
+        dp = (cp - bp) / bp if bp else 0.0
+        dr = (cr - br) / br if br else 0.0
+        bad = dp > args.threshold or dr < -args.threshold
+        regressed |= bad
+        print(f"{name:28} {bp:10.2f} {cp:10.2f} {dp:+8.1%} {br:10.1f} {cr:10.1f} {dr:+8.1%}{'  ← 회귀' if bad else ''}")
+    return 1 if regressed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="FastWMS 엔드포인트 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="시드 후 시나리오 실행")
+    p.add_argument("--db", default="bench.db", help="SQLite 파일 경로")
+    p.add_argument("--categories", type=int, default=1000)
+    p.add_argument("--stocks", type=int, default=100000)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--reseed", action="store_true", help="기존 시드 파일 무시하고 다시 생성")
+    p.add_argument("--requests", type=int, default=200, help="시나리오당 요청 수")
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--warmup", type=int, default=10)
+    p.add_argument("--size", type=int, default=20, help="목록/검색 페이지 크기")
+    p.add_argument("--scenarios", default="", help="쉼표 구분 시나리오 이름 (기본: 전체)")
+    p.add_argument("--async", dest="use_async", action="store_true", help="DB_ASYNC=true 모드로 측정")
+    p.add_argument("--sqlite-profile", choices=("default", "wal"), default="default", help="SQLITE_PROFILE 값")
+    p.add_argument("--out", default="", help="결과 JSON 저장 경로")
+    p.set_defaults(func=_cmd_run)
+
+    p = sub.add_parser("compare", help="두 결과 비교 (회귀 시 종료 코드 1)")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=0.15, help="허용 변화율 (기본 15%%)")
+    p.set_defaults(func=_cmd_compare)
+
+    p = sub.add_parser("group-commit", help="수량 증감 요청별 커밋 vs 묶음 커밋 비교")
+    p.add_argument("--db", default="bench.db", help="SQLite 파일 경로")
+    p.add_argument("--categories", type=int, default=100)
+    p.add_argument("--stocks", type=int, default=10000)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--reseed", action="store_true", help="기존 시드 파일 무시하고 다시 생성")
+    p.add_argument("--ops", type=int, default=400, help="모드/동시 수준별 증감 요청 수")
+    p.add_argument("--concurrency", default="1,8,32,128", help="쉼표 구분 동시 요청 수 목록")
+    p.add_argument("--windows", default="2,5,10", help="쉼표 구분 묶음 대기 시간(ms) 목록")
+    p.add_argument("--hot", type=int, default=50, help="증감 대상 재고 수 (id 1..N)")
+    p.add_argument("--async", dest="use_async", action="store_true", help="DB_ASYNC=true 모드로 측정")
+    p.add_argument("--sqlite-profile", choices=("default", "wal"), default="default", help="SQLITE_PROFILE 값")
+    p.add_argument("--out", default="", help="결과 JSON 저장 경로")
+    p.set_defaults(func=_cmd_group_commit)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
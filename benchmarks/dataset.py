@@ -0,0 +1,134 @@
+# benchmarks/dataset.py
+# 목적: 재현 가능한 합성 창고 데이터 시드
+# - 같은 seed/크기면 항상 같은 데이터 (random.Random(seed))
+# - 카테고리/재고는 app/models 의 테이블에 Core executemany 로 청크 단위 추가
+# - 파생 데이터(카테고리 카운터, 물품명 n-gram 색인, 카테고리 변경 카운터)는 서비스의 재구축 함수로 채움
+# - 시드 정보는 <db>.meta.json 에 기록해 같은 조건(크기/seed/모델 스키마)이면 재시드 생략
+
+import hashlib
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Iterator, List
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.engine import create_app_engine
+from app.models.category import Category
+from app.models.stock import Stock
+
+# 물품명 재료 (한글/영문 혼합, 실제 창고 품목과 비슷한 분포)
+KO_NOUNS = [
+    "사과", "배", "우유", "라면", "생수", "커피", "휴지", "세제", "장갑", "볼트", "너트", "케이블",
+    "충전기", "마스크", "박스", "테이프", "노트", "볼펜", "수세미", "샴푸", "비누", "간장", "식용유", "쌀",
+]
+KO_ADJS = ["대용량", "미니", "프리미엄", "유기농", "저지방", "무선", "고속", "친환경", "일회용", "업소용"]
+EN_NOUNS = [
+    "cable", "charger", "bolt", "nut", "glove", "tape", "box", "notebook", "pen", "bottle",
+    "filter", "sensor", "adapter", "battery", "label", "pallet", "bracket", "hinge", "valve", "switch",
+]
+EN_BRANDS = ["Acme", "Nova", "Orion", "Zenith", "Hanbit", "Daon", "Sejong", "Pioneer", "Apex", "Mirae"]
+SIZES = ["500ml", "1L", "2L", "1kg", "5kg", "M6", "M8", "S", "M", "L", "XL", "10개입", "30매", "2m", "USB-C"]
+COLORS = ["블랙", "화이트", "레드", "블루", "그레이", "black", "white", "silver"]
+
+CATEGORY_GROUPS = ["식품", "생활", "공구", "전자", "사무", "포장", "Food", "Hardware", "Office", "Electronics"]
+CATEGORY_SUBS = ["일반", "신선", "대형", "소형", "수입", "특가", "General", "Bulk", "Spare", "Import"]
+
+
+def stock_name(rng: random.Random) -> str:
+    """한글/영문 물품명 하나 생성"""
+    style = rng.random()
+    if style < 0.45:
+        parts = [rng.choice(KO_ADJS), rng.choice(KO_NOUNS), rng.choice(SIZES)]
+    elif style < 0.8:
+        parts = [rng.choice(EN_BRANDS), rng.choice(EN_NOUNS), rng.choice(SIZES)]
+    else:
+        parts = [rng.choice(EN_BRANDS), rng.choice(KO_NOUNS), rng.choice(EN_NOUNS), rng.choice(COLORS)]
+    return " ".join(parts) + f" {rng.randint(1, 9999):04d}"
+
+
+def category_names(n: int) -> List[str]:
+    """유일한 카테고리 이름 n개"""
+    return [
+        f"{CATEGORY_GROUPS[i % len(CATEGORY_GROUPS)]}-{CATEGORY_SUBS[(i // len(CATEGORY_GROUPS)) % len(CATEGORY_SUBS)]} {i:05d}"
+        for i in range(n)
+    ]
+
+
+def _stock_rows(rng: random.Random, n: int, category_count: int) -> Iterator[Dict[str, Any]]:
+    # 카테고리 크기가 고르지 않도록 앞쪽 카테고리에 더 몰리게 함 (실제 분포 근사)
+    for _ in range(n):
+        cid = min(category_count, int(rng.paretovariate(1.2))) if rng.random() < 0.3 else rng.randint(1, category_count)
+        yield {"name": stock_name(rng), "inventory": rng.choice((0, 0, 1, 5, 10, 20, 50, 100, rng.randint(0, 5000))), "category_id": cid}
+
+
+def _schema_fingerprint() -> str:
+    """모델 테이블/컬럼 구성 해시 (스키마가 바뀌면 기존 시드 파일을 재사용하지 않음)"""
+    cols = sorted(f"{t.name}.{c.name}:{c.type}" for t in Base.metadata.tables.values() for c in t.columns)
+    return hashlib.sha1("\n".join(cols).encode()).hexdigest()[:12]
+
+
+def seed(url: str, categories: int, stocks: int, seed_value: int = 42, chunk_size: int = 10000, force: bool = False) -> Dict[str, Any]:
+    """
+    SQLite 파일에 데이터 시드. 이미 같은 조건으로 시드돼 있으면 생략.
+    반환: 시드 메타 정보 (크기, seed, 소요 시간)
+    """
+    path = url.split("///", 1)[-1]
+    meta_path = path + ".meta.json"
+    wanted = {"categories": categories, "stocks": stocks, "seed": seed_value, "schema": _schema_fingerprint()}
+    if not force and os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if {k: meta.get(k) for k in wanted} == wanted:
+            return {**meta, "reused": True}
+
+    for p in (path, meta_path, path + "-wal", path + "-shm"):
+        if os.path.exists(p):
+            os.remove(p)
+
+    from app.services import counts, locations, search, versions
+
+    rng = random.Random(seed_value)
+    engine = create_app_engine(url, name="bench-seed")
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        t = time.perf_counter()
+        db.execute(insert(Category.__table__), [{"name": n} for n in category_names(categories)])
+        rows = _stock_rows(rng, stocks, categories)
+        while True:
+            chunk = [r for _, r in zip(range(chunk_size), rows)]
+            if not chunk:
+                break
+            db.execute(insert(Stock.__table__), chunk)
+        db.commit()
+        timings["rows_s"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        counts.rebuild(db)
+        db.commit()
+        timings["counters_s"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        locations.rebuild(db)
+        timings["locations_s"] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        search.rebuild_index(db, chunk_size=chunk_size)
+        timings["search_index_s"] = time.perf_counter() - t
+
+        versions.bump(db, versions.CATEGORIES)
+        db.commit()
+        db.execute(text("ANALYZE"))
+        db.commit()
+    engine.dispose()
+
+    meta = {**wanted, "seed_seconds": round(time.perf_counter() - started, 2),
+            **{k: round(v, 2) for k, v in timings.items()}}
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return {**meta, "reused": False}
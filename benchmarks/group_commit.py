@@ -0,0 +1,100 @@
+# benchmarks/group_commit.py
+# 목적: 수량 증감(/api/stocks/{id}/adjust) 요청별 커밋 vs 묶음 커밋 비교
+# - 동시 요청 수를 늘려 가며 같은 부하를 두 모드(direct, group@Nms)로 실행
+# - 커밋 수는 엔진 "commit" 이벤트로 셈 (요청 처리량 ops/s 와 초당 커밋 commits/s 를 같이 봄)
+# - 증감 대상은 소수의 핫 재고(--hot)에서 고름 (같은 재고 동시 증감 = 스캐너 몰림 상황)
+# - 모드 전환은 설정 객체 값을 바꿔서 함 (앱 재시작 없이 같은 프로세스에서 비교)
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Sequence
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.scenarios import _percentile
+
+
+async def measure(
+    client: httpx.AsyncClient, stock_ids: Sequence[int], ops: int, concurrency: int, seed: int
+) -> Dict[str, Any]:
+    """+1 증감 ops 건을 동시 concurrency 로 실행, 처리량/지연/커밋 수 반환"""
+    from app.db import session as db_session
+
+    engine = db_session.async_engine.sync_engine if db_session.USE_ASYNC else db_session.engine
+    commits = 0
+
+    def _on_commit(conn: Any) -> None:
+        nonlocal commits
+        commits += 1
+
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    errors: List[str] = []
+    remaining = ops
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            stock_id = rng.choice(stock_ids)
+            t = time.perf_counter()
+            resp = await client.post(f"/api/stocks/{stock_id}/adjust", json={"delta": 1})
+            latencies.append((time.perf_counter() - t) * 1000)
+            if resp.status_code != 200:
+                errors.append(f"{resp.status_code} {stock_id}")
+
+    event.listen(engine, "commit", _on_commit)
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        wall = time.perf_counter() - started
+    finally:
+        event.remove(engine, "commit", _on_commit)
+
+    ms = sorted(latencies)
+    return {
+        "ops": len(ms),
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "ops_per_s": round(len(ms) / wall, 1) if wall > 0 else 0.0,
+        "commits": commits,
+        "commits_per_s": round(commits / wall, 1) if wall > 0 else 0.0,
+        "ops_per_commit": round(len(ms) / commits, 2) if commits else None,
+        "latency_ms": {
+            "p50": round(_percentile(ms, 0.50), 3),
+            "p95": round(_percentile(ms, 0.95), 3),
+            "p99": round(_percentile(ms, 0.99), 3),
+        },
+    }
+
+
+async def sweep(
+    client: httpx.AsyncClient,
+    stock_ids: Sequence[int],
+    ops: int,
+    concurrency_levels: Sequence[int],
+    windows_ms: Sequence[float],
+    seed: int,
+) -> Dict[str, Dict[str, Any]]:
+    """모드(direct, group@창)별 × 동시 요청 수별 결과 {"direct": {"8": {...}}, "group@5ms": {...}}"""
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    saved = (settings.inventory_group_commit, settings.inventory_group_commit_ms)
+    modes = [("direct", False, settings.inventory_group_commit_ms)]
+    modes += [(f"group@{w:g}ms", True, w) for w in windows_ms]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for label, enabled, window in modes:
+            settings.inventory_group_commit = enabled
+            settings.inventory_group_commit_ms = window
+            results[label] = {}
+            for c in concurrency_levels:
+                results[label][str(c)] = await measure(client, stock_ids, ops, c, seed)
+    finally:
+        settings.inventory_group_commit, settings.inventory_group_commit_ms = saved
+    return results
@@ -0,0 +1,177 @@
+# benchmarks/scenarios.py
+# 목적: 엔드포인트별 측정 시나리오 + 실행기
+# - 앱을 httpx ASGITransport 로 프로세스 안에서 호출 (네트워크/서버 오버헤드 제외, 앱+DB 비용만 측정)
+# - 시나리오는 (rng, ctx) → 요청 하나를 만드는 함수, 정의 순서대로 실행
+#   (CRUD 는 create 가 만든 id 를 update/adjust/delete 가 이어서 사용)
+# - 결과: 처리량(req/s), 지연 p50/p95/p99/평균/최대(ms), 오류 수
+
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.dataset import EN_NOUNS, KO_NOUNS, stock_name
+
+PAGE_SIZE = 20
+
+
+@dataclass
+class Context:
+    """시나리오 공용 상태 (데이터 크기, 깊은 페이지 커서, CRUD 용 id)"""
+    stocks: int
+    categories: int
+    size: int = PAGE_SIZE
+    max_id: int = 0
+    deep_page: int = 1
+    deep_cursor: str = ""
+    created: List[int] = field(default_factory=list)
+
+
+# 요청 = (메서드, 경로, 쿼리, JSON 바디, 허용 상태 코드)
+Request = Tuple[str, str, Optional[Dict[str, Any]], Optional[Any], Tuple[int, ...]]
+Scenario = Callable[[random.Random, Context], Request]
+
+
+def _get(path: str, params: Optional[Dict[str, Any]] = None, ok: Tuple[int, ...] = (200,)) -> Request:
+    return ("GET", path, params, None, ok)
+
+
+def _rand_category(rng: random.Random, ctx: Context) -> int:
+    return rng.randint(1, ctx.categories)
+
+
+def _take_created(ctx: Context, pop: bool = False) -> int:
+    if not ctx.created:
+        raise RuntimeError("crud_create 시나리오를 먼저 실행해야 함")
+    return ctx.created.pop() if pop else ctx.created[len(ctx.created) // 2]
+
+
+def _mixed_rw(rng: random.Random, ctx: Context) -> Request:
+    """읽기 80% (단건/카테고리 목록/검색) + 쓰기 20% (증감/이름 수정), 대상은 시드 재고 전체에서 무작위"""
+    stock_id = rng.randint(1, ctx.max_id)
+    x = rng.random()
+    if x < 0.1:
+        return ("POST", f"/api/stocks/{stock_id}/adjust", None, {"delta": 1}, (200, 404))
+    if x < 0.2:
+        return ("PUT", f"/api/stocks/{stock_id}", None, {"name": stock_name(rng)}, (200, 404))
+    return rng.choice((SCENARIOS["get_stock"], SCENARIOS["list_category"], SCENARIOS["search_en"]))(rng, ctx)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "list_first_page": lambda rng, ctx: _get("/api/stocks", {"page": 1, "size": ctx.size}),
+    "list_deep_offset": lambda rng, ctx: _get("/api/stocks", {"page": ctx.deep_page, "size": ctx.size}),
+    "list_deep_cursor": lambda rng, ctx: _get("/api/stocks", {"cursor": ctx.deep_cursor, "size": ctx.size}),
+    "list_category": lambda rng, ctx: _get("/api/stocks", {"categoryId": _rand_category(rng, ctx), "size": ctx.size}),
+    "list_sorted_name": lambda rng, ctx: _get(
+        "/api/stocks/search", {"categoryId": _rand_category(rng, ctx), "sort": "name:asc", "size": ctx.size}
+    ),
+    "search_ko": lambda rng, ctx: _get("/api/stocks/search", {"keyword": rng.choice(KO_NOUNS), "size": ctx.size}),
+    "search_en": lambda rng, ctx: _get("/api/stocks/search", {"keyword": rng.choice(EN_NOUNS), "size": ctx.size}),
+    "search_deep": lambda rng, ctx: _get(
+        "/api/stocks/search", {"keyword": rng.choice(EN_NOUNS), "page": 10, "size": ctx.size}
+    ),
+    "get_stock": lambda rng, ctx: _get(f"/api/stocks/{rng.randint(1, ctx.max_id)}", ok=(200, 404)),
+    "html_stocks_page": lambda rng, ctx: _get("/stocks", {"page": 0, "size": ctx.size}),
+    "categories_with_counts": lambda rng, ctx: _get("/api/categories", {"with_counts": "true", "size": 100}),
+    # 대시보드 보고서 (집계 행만 읽음, 재고 수와 무관해야 함)
+    "report_summary": lambda rng, ctx: _get("/api/reports/summary"),
+    "report_categories": lambda rng, ctx: _get("/api/reports/categories", {"size": 100}),
+    "report_stock_levels": lambda rng, ctx: _get("/api/reports/stock-levels", {"categoryId": _rand_category(rng, ctx)}),
+    "crud_create": lambda rng, ctx: (
+        "POST", "/api/stocks", None,
+        {"name": stock_name(rng), "inventory": rng.randint(0, 100), "category_id": _rand_category(rng, ctx)},
+        (201,),
+    ),
+    "crud_update": lambda rng, ctx: (
+        "PUT", f"/api/stocks/{_take_created(ctx)}", None, {"name": stock_name(rng)}, (200,),
+    ),
+    "crud_adjust": lambda rng, ctx: (
+        "POST", f"/api/stocks/{_take_created(ctx)}/adjust", None, {"delta": 1}, (200,),
+    ),
+    "crud_delete": lambda rng, ctx: (
+        "DELETE", f"/api/stocks/{_take_created(ctx, pop=True)}", None, None, (204,),
+    ),
+    # 동시 읽기/쓰기 혼합 (SQLite 잠금 경합, SQLITE_PROFILE 비교용)
+    "mixed_rw": _mixed_rw,
+}
+
+
+async def prepare(client: httpx.AsyncClient, ctx: Context) -> None:
+    """깊은 페이지 번호/커서, 최대 id 확보"""
+    first = (await client.get("/api/stocks", params={"page": 1, "size": 1})).json()
+    ctx.max_id = first["items"][0]["id"] if first["items"] else 1
+    ctx.deep_page = max(1, ctx.stocks // ctx.size // 2)
+    deep = (await client.get("/api/stocks", params={"page": ctx.deep_page, "size": ctx.size})).json()
+    ctx.deep_cursor = deep.get("next_cursor") or ""
+
+
+def _percentile(sorted_ms: List[float], q: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    idx = min(len(sorted_ms) - 1, max(0, int(round(q * (len(sorted_ms) - 1)))))
+    return sorted_ms[idx]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    ctx: Context,
+    requests: int,
+    concurrency: int,
+    seed: int,
+    warmup: int = 0,
+) -> Dict[str, Any]:
+    """시나리오 하나를 requests 회 실행 (동시 concurrency), 통계 반환"""
+    scenario = SCENARIOS[name]
+    rng = random.Random(f"{seed}:{name}")
+
+    async def one(record: Optional[List[float]], errors: List[str]) -> None:
+        method, path, params, body, ok = scenario(rng, ctx)
+        t = time.perf_counter()
+        resp = await client.request(method, path, params=params, json=body)
+        elapsed = (time.perf_counter() - t) * 1000
+        if resp.status_code not in ok:
+            errors.append(f"{resp.status_code} {method} {path}")
+        elif name == "crud_create":
+            ctx.created.append(resp.json()["id"])
+        if record is not None:
+            record.append(elapsed)
+
+    # 워밍업 (캐시/커넥션 풀 채움, 통계 제외) - CRUD 는 데이터가 바뀌므로 생략
+    if not name.startswith("crud_"):
+        for _ in range(warmup):
+            await one(None, [])
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await one(latencies, errors)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    wall = time.perf_counter() - started
+
+    ms = sorted(latencies)
+    return {
+        "requests": len(ms),
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "throughput_rps": round(len(ms) / wall, 1) if wall > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(ms, 0.50), 3),
+            "p95": round(_percentile(ms, 0.95), 3),
+            "p99": round(_percentile(ms, 0.99), 3),
+            "mean": round(statistics.fmean(ms), 3) if ms else 0.0,
+            "max": round(ms[-1], 3) if ms else 0.0,
+        },
+    }
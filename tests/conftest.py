@@ -0,0 +1,123 @@
+# tests/conftest.py
+# 목적: 임시 SQLite 파일 DB 위에서 앱 전체(TestClient)를 띄우는 공용 픽스처
+# - 엔진/세션 모드(동기/비동기)는 app 을 import 할 때 설정으로 정해지므로 환경변수를 먼저 세팅함
+#   · 동기: python -m pytest tests
+#   · 비동기: DB_ASYNC=true python -m pytest tests
+# - DB 는 세션 동안 하나 (테스트마다 고유 이름으로 데이터를 만들고, 불변식은 테이블 전체로 검사)
+
+import os
+import tempfile
+import uuid
+
+_tmpdir = tempfile.mkdtemp(prefix="fastwms-test-")
+os.environ["SQLALCHEMY_DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'test.db')}"
+os.environ.setdefault("DB_ASYNC", "false")
+os.environ["DB_REPLICA_URLS"] = ""
+os.environ["INVENTORY_GROUP_COMMIT"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import case, func, select
+
+from app.db.base import Base
+from app.db.session import SessionLocal, USE_ASYNC, engine
+from app.main import app
+from app.models.category import Category
+from app.models.category_stat import CategoryStat
+from app.models.stock import Stock
+from app.models.stock_location import StockLocation
+from app.services import locations
+
+
+def pytest_report_header(config):
+    return f"db: {os.environ['SQLALCHEMY_DATABASE_URL']} ({'async' if USE_ASYNC else 'sync'} session)"
+
+
+@pytest.fixture(scope="session")
+def client():
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        locations.ensure_default(db)
+        db.commit()
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def db():
+    with SessionLocal() as session:
+        yield session
+
+
+def unique(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+
+
+def make_category(client: TestClient) -> int:
+    r = client.post("/api/categories", json={"name": unique("cat")})
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def make_stock(client: TestClient, category_id: int, inventory: int = 0, name: str = None) -> int:
+    r = client.post(
+        "/api/stocks",
+        json={"name": name or unique("stock"), "inventory": inventory, "category_id": category_id},
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+def make_warehouse(client: TestClient) -> int:
+    r = client.post("/api/warehouses", json={"name": unique("wh")})
+    assert r.status_code == 201, r.text
+    return r.json()["id"]
+
+
+# ----------------------------------------------------------
+# 불변식 (파생 테이블을 원본에서 직접 다시 계산해 비교)
+# ----------------------------------------------------------
+def location_mismatches(db):
+    """Stocks.inventory != 창고별 수량 합 인 재고 [(id, inventory, 합)]"""
+    located = (
+        select(StockLocation.stock_id, func.sum(StockLocation.quantity).label("total"))
+        .group_by(StockLocation.stock_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(Stock.id, Stock.inventory, func.coalesce(located.c.total, 0))
+        .outerjoin(located, located.c.stock_id == Stock.id)
+    ).all()
+    return [tuple(r) for r in rows if r[1] != r[2]]
+
+
+def rollup_mismatches(db, low_threshold: int):
+    """CategoryStats 와 Stocks 재계산 값이 다른 카테고리 [(id, 저장값, 재계산값)]"""
+    inventory = Stock.inventory
+    exact = {
+        r[0]: tuple(int(v) for v in r[1:])
+        for r in db.execute(
+            select(
+                Category.id,
+                func.count(Stock.id),
+                func.coalesce(func.sum(inventory), 0),
+                func.coalesce(func.sum(case((inventory == 0, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((inventory.between(1, low_threshold), 1), else_=0)), 0),
+            )
+            .outerjoin(Stock, Stock.category_id == Category.id)
+            .group_by(Category.id)
+        )
+    }
+    stored = {
+        r[0]: tuple(int(v) for v in r[1:])
+        for r in db.execute(
+            select(
+                CategoryStat.category_id,
+                CategoryStat.stock_count,
+                CategoryStat.total_quantity,
+                CategoryStat.zero_stock_count,
+                CategoryStat.low_stock_count,
+            )
+        )
+    }
+    return [(c, stored.get(c), v) for c, v in exact.items() if stored.get(c) != v]
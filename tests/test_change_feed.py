@@ -0,0 +1,78 @@
+# tests/test_change_feed.py
+# 재고/카테고리 변경 피드 (app/services/change_feed.py, /api/stocks/events)
+# - 쓰기 경로마다 id 순 이벤트, 카테고리 필터, 빈 id 뒤 이벤트 보류(늦은 커밋 대기)
+
+from datetime import timedelta
+
+from sqlalchemy import insert
+
+from app.core.config import get_settings
+from app.models.stock_event import StockEvent
+from app.services import change_feed
+from app.services.ledger import utc_naive
+from tests.conftest import make_category, make_stock
+
+
+def _types(events):
+    return [e["type"] for e in events]
+
+
+def test_writes_are_recorded_in_order_per_category(client, db):
+    src, dst = make_category(client), make_category(client)
+    _, start = change_feed.bounds(db)
+
+    sid = make_stock(client, src, 5)
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": 2})
+    client.put(f"/api/stocks/{sid}", json={"category_id": dst})
+    client.delete(f"/api/stocks/{sid}")
+
+    events, last_id, more = change_feed.read(db, start, src, 100)
+    assert _types(events) == ["create", "adjust", "update"] and not more
+    assert events[1]["stock"]["inventory"] == 7
+    assert events[2]["prev_category_id"] == src
+    # 옮긴 뒤 카테고리는 수정/삭제를 받음
+    assert _types(change_feed.read(db, start, dst, 100)[0]) == ["update", "delete"]
+    assert last_id == change_feed.bounds(db)[1]
+
+
+def test_sse_resumes_after_last_event_id(client, db, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "change_feed_max_stream_seconds", 0.3)
+    monkeypatch.setattr(settings, "change_feed_poll_seconds", 0.1)
+    cid = make_category(client)
+    _, start = change_feed.bounds(db)
+    sid = make_stock(client, cid, 1)
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": 1})
+
+    r = client.get("/api/stocks/events", params={"categoryId": cid}, headers={"Last-Event-ID": str(start)})
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/event-stream")
+    ids = [int(line[4:]) for line in r.text.splitlines() if line.startswith("id: ")]
+    assert len(ids) == 2 and ids == sorted(ids) and ids[0] > start
+
+
+def test_events_behind_a_recent_gap_wait_until_it_settles(db):
+    table = StockEvent.__table__
+    _, base = change_feed.bounds(db)
+
+    def add(offset, age=0.0):
+        db.execute(insert(table).values(
+            id=base + offset, kind="update", stock_id=0, category_id=0, name="gap", inventory=0,
+            created_at=utc_naive() - timedelta(seconds=age),
+        ))
+        db.commit()
+
+    def ids(after, **kw):
+        events, last_id, _ = change_feed.read(db, after, None, 100, **kw)
+        return [e["id"] - base for e in events], last_id - base
+
+    for offset in (1, 2, 4):
+        add(offset)
+    assert ids(base) == ([1, 2], 2)
+    assert ids(base + 2) == ([], 2)
+    add(3)  # 늦게 커밋된 작은 id → 순서대로 전달
+    assert ids(base + 2) == ([3, 4], 4)
+
+    add(6, age=30)  # 오래된 빈 id(5) → 롤백으로 보고 건너뜀
+    add(8)          # 최근 빈 id(7) → 보류
+    assert ids(base + 4) == ([6], 6)
+    assert ids(base + 6, settle_seconds=0) == ([8], 8)
@@ -0,0 +1,51 @@
+# tests/test_group_commit.py
+# 수량 증감 묶음 커밋 큐 (app/services/group_commit.py)
+# - 같은 틱에 들어온 요청은 한 트랜잭션, 판정은 도착 순서대로, 실패 항목만 거절
+
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.core.config import get_settings
+from app.models.stock_movement import StockMovement
+from app.services import group_commit
+from app.services.inventory import AdjustError
+from tests.conftest import location_mismatches, make_category, make_stock, make_warehouse
+
+
+def test_one_flush_judges_ops_in_arrival_order(client, db):
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    a, b = make_stock(client, cid, 5), make_stock(client, cid, 1)
+    queue = group_commit.InventoryQueue()
+
+    async def submit_all():
+        ops = [(a, 1, None)] * 10 + [(b, -1, None)] * 3 + [(a, 2, wid), (a, -3, wid), (999999, 1, None)]
+        return await asyncio.gather(*[queue.submit(*op) for op in ops], return_exceptions=True)
+
+    # 앱 이벤트 루프에서 실행 (엔진/세션 모드와 같은 루프)
+    results = client.portal.call(submit_all)
+
+    assert queue.stats()["flushes"] == 1 and queue.stats()["ops"] == 16
+    assert [r.row.inventory for r in results[:10]] == list(range(6, 16))
+    assert results[10].row.inventory == 0
+    assert [r.reason for r in results[11:13]] == ["insufficient", "insufficient"]
+    assert results[13].warehouse_inventory == 2 and results[13].row.inventory == 17
+    assert isinstance(results[14], AdjustError) and results[14].reason == "insufficient"
+    assert results[15].reason == "not_found"
+
+    assert client.get(f"/api/stocks/{a}").json()["inventory"] == 17
+    ledger = db.scalar(select(func.sum(StockMovement.delta)).where(StockMovement.stock_id == a))
+    assert ledger == 17
+    assert location_mismatches(db) == []
+
+
+def test_adjust_endpoint_uses_queue_when_enabled(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "inventory_group_commit", True)
+    sid = make_stock(client, make_category(client), 1)
+    flushes = group_commit.inventory_queue.stats()["flushes"]
+
+    r = client.post(f"/api/stocks/{sid}/adjust", json={"delta": 2})
+    assert r.status_code == 200 and r.json()["inventory"] == 3
+    assert client.post(f"/api/stocks/{sid}/adjust", json={"delta": -9}).status_code == 409
+    assert group_commit.inventory_queue.stats()["flushes"] == flushes + 2
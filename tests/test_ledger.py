@@ -0,0 +1,74 @@
+# tests/test_ledger.py
+# 수량 변동 원장과 시점 잔량 (app/services/ledger.py)
+# - 원장 합계 = 현재 수량, 스냅샷 앞뒤 어느 시점이든 balance_at 이 당시 수량
+
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+
+from app.models.stock import Stock
+from app.models.stock_movement import StockMovement
+from app.services import ledger
+from tests.conftest import make_category, make_stock
+
+
+def _now_iso() -> str:
+    # 원장 created_at 과 같은 시각으로 겹치지 않도록 앞뒤로 잠깐 쉼
+    time.sleep(0.01)
+    value = datetime.now(timezone.utc).isoformat()
+    time.sleep(0.01)
+    return value
+
+
+def _balance(client, sid, at):
+    r = client.get(f"/api/stocks/{sid}/balance", params={"at": at})
+    assert r.status_code == 200, r.text
+    return r.json()["inventory"]
+
+
+def test_balance_at_replays_across_snapshots(client, db):
+    cid = make_category(client)
+    sid = make_stock(client, cid, 10)
+    make_stock(client, cid)  # 삭제할 id 가 최대값이면 SQLite 가 다음 INSERT 에 재사용함 (원장이 섞임)
+    t0 = _now_iso()
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": -3})
+    assert ledger.snapshot(db, settle_seconds=0) >= 1
+    t1 = _now_iso()
+    client.put(f"/api/stocks/{sid}", json={"inventory": 20})
+    client.post("/api/stocks/bulk/adjust", json=[{"id": sid, "delta": 5}])
+    t2 = _now_iso()
+    assert ledger.snapshot(db, settle_seconds=0) >= 1
+    assert client.delete(f"/api/stocks/{sid}").status_code == 204
+    t3 = _now_iso()
+
+    assert [_balance(client, sid, t) for t in (t0, t1, t2, t3)] == [10, 7, 25, 0]
+    assert _balance(client, sid, "2000-01-01T00:00:00") == 0
+
+
+def test_movements_page_newest_first(client):
+    sid = make_stock(client, make_category(client), 10)
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": -3})
+    client.put(f"/api/stocks/{sid}", json={"inventory": 20})
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": 2})
+
+    first = client.get(f"/api/stocks/{sid}/movements", params={"size": 2}).json()
+    assert [(x["reason"], x["delta"]) for x in first["items"]] == [("adjust", 2), ("update", 13)]
+    rest = client.get(f"/api/stocks/{sid}/movements", params={"before_id": first["next_before_id"]}).json()
+    assert [x["delta"] for x in rest["items"]] == [-3, 10] and rest["next_before_id"] is None
+
+
+def test_ledger_sums_match_inventory(client, db):
+    cid = make_category(client)
+    ids = [make_stock(client, cid, 3) for _ in range(3)]
+    client.post("/api/stocks/bulk/adjust", json=[{"id": i, "delta": 2} for i in ids])
+    client.patch("/api/stocks/bulk", json=[{"id": ids[0], "inventory": 9}])
+    client.post(f"/api/stocks/{ids[1]}/adjust", json={"delta": -6})  # 부족 → 원장 기록 없음
+
+    sums = dict(db.execute(
+        select(StockMovement.stock_id, func.sum(StockMovement.delta))
+        .where(StockMovement.stock_id.in_(ids))
+        .group_by(StockMovement.stock_id)
+    ).all())
+    current = dict(db.execute(select(Stock.id, Stock.inventory).where(Stock.id.in_(ids))).all())
+    assert sums == current == {ids[0]: 9, ids[1]: 5, ids[2]: 5}
@@ -0,0 +1,61 @@
+# tests/test_metrics.py
+# 요청 계측 (app/core/metrics.py): 라우트 템플릿 라벨, 상태별 요청 수, 요청당 SQL 수
+# - 지표는 프로세스 누적값이라 요청 전후 차이로 비교
+
+import re
+
+from tests.conftest import make_category, make_stock
+
+
+def _metric(client, name: str, **labels) -> float:
+    """/api/ops/metrics 에서 이름과 라벨이 모두 맞는 첫 값 (없으면 0)"""
+    text = client.get("/api/ops/metrics").text
+    for line in text.splitlines():
+        m = re.match(rf"{re.escape(name)}\{{(.*)\}} (\S+)$", line)
+        if m and all(f'{k}="{v}"' in m.group(1) for k, v in labels.items()):
+            return float(m.group(2))
+    return 0.0
+
+
+def test_requests_are_labelled_by_route_template(client):
+    sid = make_stock(client, make_category(client), 1)
+    route = "/api/stocks/{stock_id}"
+    ok_before = _metric(client, "http_requests_total", method="GET", route=route, status="2xx")
+    missing_before = _metric(client, "http_requests_total", method="GET", route=route, status="4xx")
+
+    client.get(f"/api/stocks/{sid}")
+    client.get(f"/api/stocks/{sid}")
+    client.get("/api/stocks/999999")
+
+    assert _metric(client, "http_requests_total", method="GET", route=route, status="2xx") == ok_before + 2
+    assert _metric(client, "http_requests_total", method="GET", route=route, status="4xx") == missing_before + 1
+    # 경로 매개변수 값이 라벨로 새지 않음
+    assert f'route="/api/stocks/{sid}"' not in client.get("/api/ops/metrics").text
+
+
+def test_sql_queries_are_counted_per_request(client):
+    sid = make_stock(client, make_category(client), 1)
+    route = "/api/stocks/{stock_id}/adjust"
+    count_before = _metric(client, "http_request_db_queries_count", method="POST", route=route)
+    sum_before = _metric(client, "http_request_db_queries_sum", method="POST", route=route)
+
+    assert client.post(f"/api/stocks/{sid}/adjust", json={"delta": 1}).status_code == 200
+
+    assert _metric(client, "http_request_db_queries_count", method="POST", route=route) == count_before + 1
+    assert _metric(client, "http_request_db_queries_sum", method="POST", route=route) > sum_before
+    assert _metric(client, "http_request_duration_seconds_count", method="POST", route=route) >= 1
+
+
+def test_rows_count_column_and_streamed_reads(client):
+    cid = make_category(client)
+    for _ in range(4):
+        make_stock(client, cid, 1)
+    listing = _metric(client, "http_request_db_rows_total", method="GET", route="/api/stocks")
+    export = _metric(client, "http_request_db_rows_total", method="GET", route="/api/stocks/export")
+
+    # 컬럼 튜플 조회(목록)와 스트리밍 청크(내보내기) 모두 읽은 행으로 셈
+    client.get("/api/stocks", params={"categoryId": cid, "size": 3})
+    exported = client.get("/api/stocks/export", params={"categoryId": cid}).text.splitlines()[1:]
+
+    assert _metric(client, "http_request_db_rows_total", method="GET", route="/api/stocks") >= listing + 3
+    assert _metric(client, "http_request_db_rows_total", method="GET", route="/api/stocks/export") == export + len(exported) == export + 4
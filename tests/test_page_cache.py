@@ -0,0 +1,81 @@
+# tests/test_page_cache.py
+# /stocks 화면 캐시 (app/services/page_cache.py)와 DB 회로 차단기 (app/db/breaker.py)
+# - 본문은 Host 와 무관, 쓰기는 커밋 후에만 무효화, DB 장애 중에는 마지막 본문을 안내와 함께 제공
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import get_settings
+from app.db.breaker import OPEN, db_breaker
+from app.db.session import SessionLocal
+from app.services import page_cache, stock_sync, versions
+from tests.conftest import make_category, make_stock
+
+
+def test_cached_body_does_not_depend_on_host(client):
+    cid = make_category(client)
+    r = client.get("/stocks", params={"categoryId": cid}, headers={"Host": "evil.example"})
+    assert r.status_code == 200 and "evil.example" not in r.text
+
+    again = client.get("/stocks", params={"categoryId": cid})
+    assert again.headers["x-cache"] == "HIT"
+    assert "/static/js/stocks.js" in again.text and "evil.example" not in again.text
+
+
+def test_invalidation_waits_for_commit(client):
+    with SessionLocal() as db:
+        g = page_cache.generation()
+        stock_sync._changed(db)
+        assert page_cache.generation() == g
+        db.rollback()
+        assert page_cache.generation() == g
+        stock_sync._changed(db)
+        db.commit()
+        assert page_cache.generation() == g + 1
+
+
+def test_write_makes_next_render_fresh(client):
+    cid = make_category(client)
+    assert client.get("/stocks", params={"categoryId": cid}).headers["x-cache"] == "MISS"
+    assert client.get("/stocks", params={"categoryId": cid}).headers["x-cache"] == "HIT"
+
+    make_stock(client, cid, 1)
+    assert client.get("/stocks", params={"categoryId": cid}).headers["x-cache"] == "MISS"
+    # 쓰기 없이 무효화만 된 경우는 태그가 같아 본문 재사용
+    page_cache.invalidate()
+    assert client.get("/stocks", params={"categoryId": cid}).headers["x-cache"] == "REVALIDATED"
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "db_breaker_threshold", 2)
+    monkeypatch.setattr(settings, "db_breaker_cooldown", 60.0)
+    yield db_breaker
+    db_breaker.success()
+
+
+def test_db_failure_serves_stale_body_and_opens_breaker(client, breaker, monkeypatch):
+    cid = make_category(client)
+    assert client.get("/stocks", params={"categoryId": cid}).headers["x-cache"] == "MISS"
+
+    # 재검증 첫 쿼리(변경 카운터)가 DB 오류를 냄
+    calls = []
+
+    def etag(*args, **kwargs):
+        calls.append(1)
+        raise OperationalError("SELECT 1", {}, Exception("db down"))
+
+    monkeypatch.setattr(versions, "etag", etag)
+    page_cache.invalidate()  # 신선도 만료 → 다음 요청은 재검증
+
+    # 실패 2회 → 차단, 그동안 마지막 본문 + 안내
+    for _ in range(2):
+        r = client.get("/stocks", params={"categoryId": cid})
+        assert r.headers["x-cache"] == "STALE" and "notice--stale" in r.text
+    assert breaker.state == OPEN and len(calls) == 2
+
+    # 차단 중에는 DB 를 건드리지 않음
+    rejected = breaker.stats()["rejected_total"]
+    assert client.get("/stocks", params={"categoryId": cid}).headers["x-cache"] == "STALE"
+    assert len(calls) == 2 and breaker.stats()["rejected_total"] == rejected + 1
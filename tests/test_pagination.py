@@ -0,0 +1,63 @@
+# tests/test_pagination.py
+# 키셋(cursor) 페이지네이션: 목록/검색 순회, 이전 페이지, page 모드에서 cursor 로 전환
+
+from tests.conftest import make_category, make_stock, unique
+
+
+def _walk(client, path, params):
+    """cursor 로 끝까지 넘기며 페이지별 응답을 모음"""
+    pages, cursor = [], ""
+    while cursor is not None:
+        r = client.get(path, params={**params, "cursor": cursor})
+        assert r.status_code == 200, r.text
+        pages.append(r.json())
+        cursor = pages[-1]["next_cursor"]
+    return pages
+
+
+def _ids(page):
+    return [x["id"] for x in page["items"]]
+
+
+def test_cursor_walks_listing_newest_first_without_gaps(client):
+    cid = make_category(client)
+    ids = [make_stock(client, cid, 1) for _ in range(7)]
+
+    pages = _walk(client, "/api/stocks", {"categoryId": cid, "size": 3})
+    seen = [i for p in pages for i in _ids(p)]
+    assert seen == sorted(ids, reverse=True)
+    assert pages[0]["prev_cursor"] is None and pages[-1]["next_cursor"] is None
+
+    # 마지막 페이지의 prev_cursor → 바로 앞 페이지
+    back = client.get("/api/stocks", params={"categoryId": cid, "size": 3, "cursor": pages[-1]["prev_cursor"]}).json()
+    assert _ids(back) == _ids(pages[-2])
+
+
+def test_cursor_is_stable_across_inserts(client):
+    cid = make_category(client)
+    ids = [make_stock(client, cid, 1) for _ in range(4)]
+
+    first = client.get("/api/stocks", params={"categoryId": cid, "size": 2, "cursor": ""}).json()
+    make_stock(client, cid, 1)  # 앞쪽(더 큰 id)에 새 행이 생겨도 다음 페이지가 밀리지 않음
+    second = client.get("/api/stocks", params={"categoryId": cid, "size": 2, "cursor": first["next_cursor"]}).json()
+    assert _ids(first) + _ids(second) == sorted(ids, reverse=True)
+
+
+def test_search_cursor_and_page_mode_handoff(client):
+    cid = make_category(client)
+    prefix = unique("kp")
+    ids = [make_stock(client, cid, 1, name=f"{prefix}-{i}") for i in range(5)]
+    make_stock(client, cid, 1)  # 키워드 불일치
+
+    pages = _walk(client, "/api/stocks/search", {"keyword": prefix, "size": 2})
+    assert [i for p in pages for i in _ids(p)] == sorted(ids, reverse=True)
+
+    # page 모드 응답의 next_cursor 로 이어서 cursor 모드
+    page1 = client.get("/api/stocks/search", params={"keyword": prefix, "size": 2, "page": 1}).json()
+    nxt = client.get("/api/stocks/search", params={"keyword": prefix, "size": 2, "cursor": page1["next_cursor"]}).json()
+    assert _ids(nxt) == sorted(ids, reverse=True)[2:4]
+
+
+def test_malformed_cursor_is_400(client):
+    assert client.get("/api/stocks", params={"cursor": "zzz"}).status_code == 400
+    assert client.get("/api/stocks/search", params={"cursor": "zzz"}).status_code == 400
@@ -0,0 +1,91 @@
+# tests/test_replica_routing.py
+# 읽기 복제본 라우팅 (app/db/replicas.py, app/db/routing.py)
+# - GET/HEAD 요청의 읽기만 복제본, 잠금 읽기/쓰기 이후 읽기는 주 DB, 최근 쓰기 쿠키가 있으면 주 DB
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db import replicas
+from app.db.base import Base
+from app.db.replicas import RYW_COOKIE, Replica, ReplicaRoutingMiddleware, ReplicaSet
+from app.db.routing import RoutingSession
+from app.db.session import engine
+from app.models.stock import Stock
+from tests.conftest import make_category, make_stock
+
+
+@pytest.fixture
+def stale_replica(tmp_path):
+    """스키마만 있는 빈 복제본 (복제 지연으로 아직 아무 행도 못 받은 상태)"""
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(replica_engine)
+    yield replica_engine
+    replica_engine.dispose()
+
+
+@pytest.fixture
+def replica_reads():
+    """GET 요청 안처럼 복제본 읽기 허용"""
+    token = replicas._primary.set(False)
+    yield
+    replicas._primary.reset(token)
+
+
+def test_reads_use_replica_until_the_transaction_needs_primary(client, stale_replica, replica_reads):
+    sid = make_stock(client, make_category(client), 3)
+    Session = sessionmaker(
+        class_=RoutingSession, writer=engine, reader=engine, replicas=ReplicaSet([Replica("r", stale_replica)])
+    )
+    inventory = select(Stock.inventory).where(Stock.id == sid)
+
+    with Session() as db:
+        assert db.scalar(inventory) is None
+        db.rollback()
+        # 잠금 읽기는 주 DB, 그 트랜잭션의 이후 읽기도 주 DB
+        assert db.scalar(inventory.with_for_update()) == 3
+        assert db.scalar(inventory) == 3
+        db.rollback()
+        assert db.scalar(inventory) is None
+
+    # 요청 밖(CLI, 백그라운드 작업)은 주 DB
+    replicas._primary.set(True)
+    with Session() as db:
+        assert db.scalar(inventory) == 3
+
+
+def test_unreachable_replica_falls_back_to_primary():
+    bad = create_engine("sqlite:////nonexistent/dir/replica.db")
+    replica_set = ReplicaSet([Replica("bad", bad)])
+    assert replica_set.pick() is None
+    stats = replica_set.stats()
+    assert stats["primary_fallbacks"] == 1 and stats["replicas"][0]["healthy"] is False
+    bad.dispose()
+
+
+def test_recent_write_cookie_pins_reads_to_primary(monkeypatch):
+    monkeypatch.setattr(get_settings(), "db_read_your_writes_seconds", 5.0)
+    mini = FastAPI()
+
+    @mini.get("/read")
+    async def read():
+        return {"primary": replicas.primary_required()}
+
+    @mini.post("/write")
+    async def write():
+        return {"primary": replicas.primary_required()}
+
+    mini.add_middleware(ReplicaRoutingMiddleware)
+    with TestClient(mini) as c:
+        assert c.get("/read").json()["primary"] is False
+        r = c.post("/write")
+        assert r.json()["primary"] is True and RYW_COOKIE in r.headers["set-cookie"]
+        assert c.get("/read").json()["primary"] is True
+
+        c.cookies.set(RYW_COOKIE, f"{time.time() - 60:.3f}")
+        assert c.get("/read").json()["primary"] is False
@@ -0,0 +1,61 @@
+# tests/test_reports.py
+# 보고서 엔드포인트 (/api/reports)와 증분 집계 (CategoryStats, app/services/counts.py)
+
+from sqlalchemy import func, select, update
+
+from app.cli import main as cli_main
+from app.core.config import get_settings
+from app.models.category_stat import CategoryStat
+from app.models.stock import Stock
+from tests.conftest import make_category, make_stock, rollup_mismatches
+
+
+def test_stock_levels_follow_writes(client):
+    threshold = get_settings().low_stock_threshold
+    cid = make_category(client)
+    zero, low, ok = make_stock(client, cid, 0), make_stock(client, cid, 1), make_stock(client, cid, threshold + 5)
+
+    def buckets():
+        body = client.get("/api/reports/stock-levels", params={"categoryId": cid}).json()
+        return body["sku_count"], [b["count"] for b in body["buckets"]]
+
+    assert buckets() == (3, [1, 1, 1])
+    client.post(f"/api/stocks/{zero}/adjust", json={"delta": threshold})       # zero → low
+    client.put(f"/api/stocks/{ok}", json={"inventory": 0})                      # ok → zero
+    client.post("/api/stocks/bulk/adjust", json=[{"id": low, "delta": threshold}])  # low → ok
+    assert buckets() == (3, [1, 1, 1])
+    client.delete(f"/api/stocks/{low}")
+    assert buckets() == (2, [1, 1, 0])
+
+    row = next(x for x in client.get("/api/reports/categories", params={"size": 500, "sort": "id"}).json()["items"]
+               if x["category_id"] == cid)
+    assert (row["sku_count"], row["total_quantity"], row["zero_stock_count"]) == (2, threshold, 1)
+
+
+def test_summary_matches_stocks_table(client, db):
+    make_stock(client, make_category(client), 4)
+    summary = client.get("/api/reports/summary").json()
+    count, total = db.execute(select(func.count(Stock.id), func.coalesce(func.sum(Stock.inventory), 0))).one()
+    assert (summary["sku_count"], summary["total_quantity"]) == (count, total)
+
+
+def test_reports_are_conditional_and_validated(client):
+    r = client.get("/api/reports/summary")
+    tag = r.headers["etag"]
+    assert client.get("/api/reports/summary", headers={"If-None-Match": tag}).status_code == 304
+    make_stock(client, make_category(client), 1)
+    assert client.get("/api/reports/summary", headers={"If-None-Match": tag}).status_code == 200
+
+    assert client.get("/api/reports/categories", params={"sort": "name"}).status_code == 400
+    assert client.get("/api/reports/stock-levels", params={"categoryId": 999999}).status_code == 404
+
+
+def test_rebuild_restores_corrupted_rollups(client, db):
+    make_stock(client, make_category(client), 3)
+    db.execute(update(CategoryStat).values(total_quantity=0, low_stock_count=99))
+    db.commit()
+    assert rollup_mismatches(db, get_settings().low_stock_threshold)
+
+    assert cli_main(["rebuild-rollups"]) == 0
+    db.expire_all()
+    assert rollup_mismatches(db, get_settings().low_stock_threshold) == []
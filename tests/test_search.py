@@ -0,0 +1,57 @@
+# tests/test_search.py
+# 물품명 n-gram 색인 검색이 ILIKE 단독 검색과 같은 결과를 내는지 (app/services/search.py)
+
+import pytest
+
+from app.core.config import get_settings
+from app.services import search
+from tests.conftest import make_category, make_stock, unique
+
+
+@pytest.mark.parametrize(
+    "name, keyword",
+    [
+        ("Café Latte", "cafe"),
+        ("ØRSTED cable", "orsted"),
+        ("ＦＵＬＬ width", "full"),
+        ("Straße", "STRASSE"),
+        ("한글 상자", "글 상"),
+    ],
+)
+def test_folded_keyword_grams_are_in_name(name, keyword):
+    # 악센트/대소문자/전각을 같게 보는 콜레이션에서 일치하는 쌍은 후보에서 빠지면 안 됨
+    assert search.name_grams(keyword) <= search.name_grams(name)
+
+
+def _search_ids(client, keyword):
+    r = client.get("/api/stocks/search", params={"keyword": keyword, "size": 100})
+    assert r.status_code == 200, r.text
+    return sorted(x["id"] for x in r.json()["items"])
+
+
+def test_ngram_results_equal_ilike_results(client, monkeypatch):
+    cid = make_category(client)
+    tag = unique("ng")
+    names = ["Box", "box-large", "Café", "CAFE", "한글상자", "상자 한글", "ＢＯＸ", "b_x", "100%"]
+    for n in names:
+        make_stock(client, cid, 1, name=f"{tag} {n}")
+    renamed = make_stock(client, cid, 1, name=f"{tag} old")
+    client.put(f"/api/stocks/{renamed}", json={"name": f"{tag} new box"})
+
+    keywords = [tag, "box", "BOX", "ox", "caf", "café", "한글", "상자", "b_x", "0%", "old", "new", "x"]
+    with_index = {k: _search_ids(client, k) for k in keywords}
+    monkeypatch.setattr(search, "enabled", lambda: False)
+    assert {k: _search_ids(client, k) for k in keywords} == with_index
+    assert with_index[tag]
+
+
+def test_blank_keyword_counts_like_no_keyword(client, monkeypatch):
+    cid = make_category(client)
+    for _ in range(3):
+        make_stock(client, cid, 1)
+    monkeypatch.setattr(get_settings(), "count_keyword_limit", 1)
+
+    plain = client.get("/api/stocks/search", params={"size": 1}).json()
+    blank = client.get("/api/stocks/search", params={"size": 1, "keyword": "   "}).json()
+    assert not blank["total_capped"]
+    assert (blank["total_pages"], blank["items"]) == (plain["total_pages"], plain["items"])
@@ -0,0 +1,150 @@
+# tests/test_stock_invariants.py
+# 쓰기 경로가 섞여도 파생 데이터가 원본과 일치하는지
+# - Stocks.inventory = 창고별 수량 합 (app/services/locations.py)
+# - CategoryStats 집계 = Stocks 재계산 (app/services/counts.py)
+
+import random
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.core.config import get_settings
+from app.models.category_stat import CategoryStat
+from app.models.stock import Stock
+from app.models.stock_location import StockLocation
+from app.services import inventory
+from tests.conftest import (
+    location_mismatches,
+    make_category,
+    make_stock,
+    make_warehouse,
+    rollup_mismatches,
+    unique,
+)
+
+
+def _assert_invariants(db):
+    assert location_mismatches(db) == []
+    assert rollup_mismatches(db, get_settings().low_stock_threshold) == []
+
+
+def test_mixed_writes_keep_locations_and_rollups_exact(client, db):
+    rng = random.Random(25)
+    cats = [make_category(client) for _ in range(3)]
+    warehouses = [None, make_warehouse(client), make_warehouse(client)]
+    ids = [make_stock(client, rng.choice(cats), rng.randint(0, 15)) for _ in range(8)]
+
+    r = client.post("/api/stocks/bulk", json=[
+        {"name": unique("bulk"), "inventory": rng.randint(0, 15), "category_id": rng.choice(cats)} for _ in range(5)
+    ])
+    assert r.status_code == 200, r.text
+    ids += [x["id"] for x in r.json()["results"] if x["ok"]]
+
+    for _ in range(60):
+        sid = rng.choice(ids)
+        op = rng.random()
+        if op < 0.45:
+            client.post(f"/api/stocks/{sid}/adjust", json={"delta": rng.randint(-6, 6), "warehouse_id": rng.choice(warehouses)})
+        elif op < 0.6:
+            client.put(f"/api/stocks/{sid}", json={"inventory": rng.randint(0, 20)})
+        elif op < 0.7:
+            client.put(f"/api/stocks/{sid}", json={"category_id": rng.choice(cats)})
+        elif op < 0.85:
+            client.post("/api/stocks/bulk/adjust", json=[
+                {"id": rng.choice(ids), "delta": rng.randint(-8, 8), "warehouse_id": rng.choice(warehouses)} for _ in range(4)
+            ])
+        else:
+            client.patch("/api/stocks/bulk", json=[{"id": sid, "inventory": rng.randint(0, 12)}])
+
+    for sid in ids[:2]:
+        assert client.delete(f"/api/stocks/{sid}").status_code == 204
+    r = client.request("DELETE", "/api/stocks/bulk", json={"ids": ids[2:4]})
+    assert r.status_code == 200, r.text
+
+    _assert_invariants(db)
+
+
+def test_scoped_adjust_rejects_without_touching_total(client, db):
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    sid = make_stock(client, cid, 5)
+    before = client.get(f"/api/stocks/{sid}").json()
+
+    # 합계는 충분하지만 그 창고에는 없음 → 409, 합계/version 그대로
+    r = client.post(f"/api/stocks/{sid}/adjust", json={"delta": -1, "warehouse_id": wid})
+    assert r.status_code == 409
+    after = client.get(f"/api/stocks/{sid}").json()
+    assert (after["inventory"], after["version"]) == (before["inventory"], before["version"])
+
+    r = client.post("/api/stocks/bulk/adjust", json=[
+        {"id": sid, "delta": 3, "warehouse_id": wid},
+        {"id": sid, "delta": -4, "warehouse_id": wid},
+        {"id": sid, "delta": -1},
+    ])
+    assert [x["ok"] for x in r.json()["results"]] == [True, False, True]
+    detail = client.get(f"/api/stocks/{sid}").json()
+    assert detail["inventory"] == 7
+    assert {x["warehouse_id"]: x["inventory"] for x in detail["locations"]}[wid] == 3
+
+    _assert_invariants(db)
+
+
+def test_scoped_adjust_is_undone_by_outer_rollback(client, db):
+    # 바깥 트랜잭션이 실패하면 합계와 창고 행 모두 그대로여야 함 (중간 커밋 없음)
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    sid = make_stock(client, cid, 10)
+
+    def snapshot():
+        db.expire_all()
+        rows = db.execute(
+            select(StockLocation.warehouse_id, StockLocation.quantity).where(StockLocation.stock_id == sid)
+        ).all()
+        return db.get(Stock, sid).inventory, sorted(map(tuple, rows))
+
+    before = snapshot()
+    db.rollback()
+    assert inventory.adjust(db, sid, 3, warehouse_id=wid).warehouse_inventory == 3
+    db.rollback()
+    assert snapshot() == before
+
+    # 판정 실패 후에도 같은 트랜잭션에서 이어 쓰고 커밋할 수 있음 (일괄 증감 경로)
+    db.rollback()
+    with pytest.raises(inventory.AdjustError) as exc:
+        inventory.adjust(db, sid, -1, warehouse_id=wid)
+    assert exc.value.reason == "insufficient"
+    inventory.adjust(db, sid, 2, warehouse_id=wid)
+    db.commit()
+    total, rows = snapshot()
+    assert total == 12 and dict(rows)[wid] == 2
+
+    _assert_invariants(db)
+
+
+def test_category_delete_removes_its_stocks_everywhere(client, db):
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    prefix = unique("catdel")
+    ids = [make_stock(client, cid, 4, name=f"{prefix}-{i}") for i in range(3)]
+    client.post(f"/api/stocks/{ids[0]}/adjust", json={"delta": 2, "warehouse_id": wid})
+
+    assert client.delete(f"/api/categories/{cid}").status_code == 204
+    assert all(client.get(f"/api/stocks/{sid}").status_code == 404 for sid in ids)
+    assert client.get("/api/stocks/search", params={"keyword": prefix}).json()["items"] == []
+
+    db.expire_all()
+    assert db.scalars(select(StockLocation.stock_id).where(StockLocation.stock_id.in_(ids))).all() == []
+    assert db.get(CategoryStat, cid) is None
+    _assert_invariants(db)
+
+
+def test_missing_counter_row_is_rebuilt_exactly_on_delete(client, db):
+    cid = make_category(client)
+    ids = [make_stock(client, cid, 5) for _ in range(3)]
+    db.execute(delete(CategoryStat).where(CategoryStat.category_id == cid))
+    db.commit()
+
+    assert client.delete(f"/api/stocks/{ids[0]}").status_code == 204
+    db.expire_all()
+    row = db.get(CategoryStat, cid)
+    assert (row.stock_count, row.total_quantity) == (2, 10)
@@ -0,0 +1,63 @@
+# tests/test_versioning.py
+# 낙관적 동시성 제어(409/412)와 조건부 GET(ETag/304)
+# - app/services/row_version.py, app/services/versions.py
+
+from tests.conftest import make_category, make_stock
+
+
+def test_body_version_conflict_is_409(client):
+    sid = make_stock(client, make_category(client), 1)
+    version = client.get(f"/api/stocks/{sid}").json()["version"]
+
+    assert client.put(f"/api/stocks/{sid}", json={"name": "a", "version": version}).status_code == 200
+    r = client.put(f"/api/stocks/{sid}", json={"name": "b", "version": version})
+    assert r.status_code == 409
+
+
+def test_detail_etag_round_trips_as_if_match(client):
+    sid = make_stock(client, make_category(client), 1)
+    tag = client.get(f"/api/stocks/{sid}").headers["etag"]
+
+    assert client.get(f"/api/stocks/{sid}", headers={"If-None-Match": tag}).status_code == 304
+    assert client.put(f"/api/stocks/{sid}", json={"name": "a"}, headers={"If-Match": tag}).status_code == 200
+    # 같은 태그 재사용 → 이미 바뀜
+    assert client.put(f"/api/stocks/{sid}", json={"name": "b"}, headers={"If-Match": tag}).status_code == 412
+    # 증감도 version 을 올림
+    tag = client.get(f"/api/stocks/{sid}").headers["etag"]
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": 1})
+    assert client.put(f"/api/stocks/{sid}", json={"name": "c"}, headers={"If-Match": tag}).status_code == 412
+
+
+def test_non_row_if_match_is_412(client):
+    sid = make_stock(client, make_category(client), 1)
+    list_tag = client.get("/api/stocks").headers["etag"]
+
+    for value in (list_tag, '"not-a-version"'):
+        r = client.put(f"/api/stocks/{sid}", json={"name": "x"}, headers={"If-Match": value})
+        assert r.status_code == 412, value
+    assert client.put(f"/api/stocks/{sid}", json={"name": "x"}, headers={"If-Match": "*"}).status_code == 200
+
+
+def test_category_rename_changes_stock_etag_but_not_if_match(client):
+    cid = make_category(client)
+    sid = make_stock(client, cid, 1)
+    stock_tag = client.get(f"/api/stocks/{sid}").headers["etag"]
+    cat_tag = client.get(f"/api/categories/{cid}").headers["etag"]
+
+    assert client.get(f"/api/categories/{cid}", headers={"If-None-Match": cat_tag}).status_code == 304
+    assert client.patch(f"/api/categories/{cid}", json={"name": f"renamed-{cid}"}, headers={"If-Match": cat_tag}).status_code == 200
+    assert client.patch(f"/api/categories/{cid}", json={"name": f"again-{cid}"}, headers={"If-Match": cat_tag}).status_code == 412
+
+    # 상세 본문(category_name)이 바뀌었으므로 304 아님, 재고 행 version 은 그대로라 If-Match 통과
+    assert client.get(f"/api/stocks/{sid}", headers={"If-None-Match": stock_tag}).status_code == 200
+    assert client.put(f"/api/stocks/{sid}", json={"name": "y"}, headers={"If-Match": stock_tag}).status_code == 200
+
+
+def test_list_etag_changes_on_write(client):
+    sid = make_stock(client, make_category(client), 1)
+    tag = client.get("/api/stocks").headers["etag"]
+
+    assert client.get("/api/stocks", headers={"If-None-Match": tag}).status_code == 304
+    client.post(f"/api/stocks/{sid}/adjust", json={"delta": 1})
+    r = client.get("/api/stocks", headers={"If-None-Match": tag})
+    assert r.status_code == 200 and r.headers["etag"] != tag
@@ -0,0 +1,77 @@
+# tests/test_warehouse_listing.py
+# 창고 범위 목록/검색/내보내기와 키셋 커서 (warehouseId, 커서의 "w")
+
+import json
+
+from tests.conftest import make_category, make_stock, make_warehouse, unique
+
+
+def _walk(client, path, params):
+    """cursor 로 끝까지 넘기며 id 를 모음"""
+    seen, cursor = [], ""
+    while cursor is not None:
+        r = client.get(path, params={**params, "cursor": cursor})
+        assert r.status_code == 200, r.text
+        body = r.json()
+        seen += [x["id"] for x in body["items"]]
+        cursor = body["next_cursor"]
+    return seen
+
+
+def test_warehouse_cursor_walks_every_location_once(client):
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    prefix = unique("whlist")
+    placed = {}
+    for i in range(7):
+        sid = make_stock(client, cid, 10, name=f"{prefix}-{i}")
+        if i % 3:
+            assert client.post(f"/api/stocks/{sid}/adjust", json={"delta": i, "warehouse_id": wid}).status_code == 200
+            placed[sid] = i
+
+    ids = _walk(client, "/api/stocks", {"warehouseId": wid, "size": 2})
+    assert sorted(ids) == sorted(placed) and len(ids) == len(set(ids))
+
+    items = client.get("/api/stocks", params={"warehouseId": wid, "size": 100}).json()["items"]
+    assert {x["id"]: x["inventory"] for x in items} == placed
+    assert all(x["warehouse_id"] == wid and x["total_inventory"] == 10 + x["inventory"] for x in items)
+
+    # 정렬 지정 + 검색도 같은 범위
+    by_qty = _walk(client, "/api/stocks", {"warehouseId": wid, "size": 3, "sort": "inventory:asc"})
+    assert by_qty == sorted(placed, key=lambda s: (placed[s], s))
+    found = _walk(client, "/api/stocks/search", {"warehouseId": wid, "keyword": prefix, "size": 2})
+    assert sorted(found) == sorted(placed)
+
+
+def test_cursor_is_bound_to_its_warehouse(client):
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    for _ in range(3):
+        sid = make_stock(client, cid, 1)
+        client.post(f"/api/stocks/{sid}/adjust", json={"delta": 1, "warehouse_id": wid})
+
+    cursor = client.get("/api/stocks", params={"warehouseId": wid, "size": 1, "cursor": ""}).json()["next_cursor"]
+    assert cursor
+    assert client.get("/api/stocks", params={"size": 1, "cursor": cursor}).status_code == 400
+    assert client.get("/api/stocks", params={"warehouseId": 999999}).status_code == 404
+
+
+def test_export_is_scoped_to_warehouse(client):
+    cid = make_category(client)
+    wid = make_warehouse(client)
+    placed = {}
+    for i in range(3):
+        sid = make_stock(client, cid, 5)
+        if i:
+            client.post(f"/api/stocks/{sid}/adjust", json={"delta": i, "warehouse_id": wid})
+            placed[sid] = i
+
+    r = client.get("/api/stocks/export", params={"format": "ndjson", "warehouseId": wid})
+    assert r.status_code == 200
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert {x["id"]: x["inventory"] for x in rows} == placed
+    assert all(x["warehouse_id"] == wid and x["total_inventory"] == 5 + x["inventory"] for x in rows)
+
+    header = client.get("/api/stocks/export", params={"warehouseId": wid}).text.splitlines()[0]
+    assert header.lstrip("﻿").split(",")[-2:] == ["warehouse_id", "total_inventory"]
+    assert client.get("/api/stocks/export", params={"warehouseId": 999999}).status_code == 404